@@ -0,0 +1,64 @@
+"""FLUX-ON Biblioteca Quântica: todos os livros servidos por um único processo.
+
+Os livros são lidos de ``livros/<Título>.json`` (ou do armazenamento
+compilado por ``book_store.py``) somente quando um leitor os abre, e ficam
+no cache do processo compartilhado por todas as sessões, limitado a
+``FLUXON_MAX_LIVROS`` livros residentes.
+
+Uso::
+
+    streamlit run biblioteca.py
+"""
+
+import streamlit as st
+
+import book_store
+from leitor_quantico import (
+    apply_page_style,
+    render_book,
+    render_debug_panel,
+    render_library_opener,
+    render_unexpected_error,
+)
+
+
+def render_library_sidebar(catalog):
+    """Troca rápida de livro na sidebar"""
+    titles = list(catalog)
+    current = st.session_state.selected_book
+    with st.sidebar:
+        selected = st.selectbox(
+            "📚 **Biblioteca**",
+            titles,
+            index=titles.index(current),
+            key="library_book_selector"
+        )
+    if selected != current:
+        st.session_state.selected_book = selected
+        st.rerun()
+
+
+def main():
+    apply_page_style()
+    try:
+        if 'book_loaded' not in st.session_state:
+            st.session_state.book_loaded = False
+        
+        catalog = book_store.list_books()
+        
+        if (not st.session_state.book_loaded or 
+            st.session_state.get('selected_book') not in catalog):
+            st.session_state.book_loaded = False
+            render_library_opener(catalog)
+            render_debug_panel()
+            return
+        
+        render_library_sidebar(catalog)
+        render_book(catalog[st.session_state.selected_book])
+        
+    except Exception as e:
+        render_unexpected_error(e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Validação do formato dos livros do FLUX-ON Reader.
+
+O JSON de análise (``livros/<Título>.json``) é verificado em uma única
+passagem: a varredura de offsets do segment_loader.py localiza o resumo e
+cada segmento, e cada trecho é decodificado e conferido contra o esquema
+abaixo. Qualquer problema gera ``BookFormatError`` com o caminho do campo
+(ex.: ``segments[12].complexity_metrics.word_count``), linha, coluna e
+offset em bytes, em vez de uma tentativa de "reparo" do texto inteiro.
+
+Só livros válidos chegam ao índice de offsets e ao armazenamento
+compilado (book_store.py), que por isso não precisam ser revalidados.
+"""
+
+import json
+
+# Placeholder deixado pelo gerador quando a análise ainda não foi executada
+MISSING_DATA_PLACEHOLDER = b"##BOOK_ANALYSIS_DATA##"
+
+NUMBER = 'number'
+INTEGER = 'integer'
+STRING = 'string'
+BOOLEAN = 'boolean'
+
+
+def _object(fields=None, values=None, required=()):
+    return {'type': 'object', 'fields': fields or {}, 'values': values, 'required': required}
+
+
+def _array(items=None):
+    return {'type': 'array', 'items': items}
+
+
+SEGMENT_SCHEMA = _object(
+    fields={
+        'id': INTEGER,
+        'text': STRING,
+        'position': INTEGER,
+        'chapter': INTEGER,
+        'page': INTEGER,
+        'segment_type': STRING,
+        'themes': _object(values=NUMBER),
+        'difficulty': NUMBER,
+        'complexity_metrics': _object(values=NUMBER),
+        'analysis': _object(fields={
+            'keywords': _array(STRING),
+            'entities': _array(_array(STRING)),
+            'readability_score': NUMBER,
+            'semantic_density': NUMBER,
+            'word_count': NUMBER,
+            'unique_words': NUMBER,
+            'lexical_diversity': NUMBER
+        }),
+        'preservation_score': NUMBER
+    },
+    required=('text',)
+)
+
+SUMMARY_SCHEMA = {
+    'book_analysis': _object(fields={
+        'total_segments': INTEGER,
+        'total_chapters': INTEGER,
+        'total_pages': INTEGER,
+        'avg_difficulty': NUMBER,
+        'max_difficulty': NUMBER,
+        'min_difficulty': NUMBER,
+        'theme_distribution': _object(values=NUMBER),
+        'total_words': NUMBER,
+        'avg_words_per_segment': NUMBER
+    }),
+    'difficulty_map': _array(_object(fields={
+        'segment': INTEGER,
+        'difficulty': NUMBER,
+        'word_count': NUMBER
+    })),
+    'theme_analysis': _object(values=_array(_object(
+        fields={'segment': INTEGER, 'score': NUMBER},
+        required=('segment', 'score')
+    ))),
+    'book_name': STRING,
+    'book_cover': STRING
+}
+
+REQUIRED_KEYS = ('segments', 'book_analysis', 'difficulty_map', 'theme_analysis')
+
+
+class BookFormatError(ValueError):
+    """Livro fora do formato esperado, com a localização do problema"""
+
+    def __init__(self, message, path=None, offset=None, line=None, column=None, context=None):
+        self.message = message
+        self.path = path
+        self.offset = offset
+        self.line = line
+        self.column = column
+        self.context = context
+        super().__init__(str(self))
+
+    def __str__(self):
+        location = []
+        if self.path:
+            location.append(self.path)
+        if self.line is not None:
+            location.append(f"linha {self.line}, coluna {self.column}")
+        return f"{self.message} ({'; '.join(location)})" if location else self.message
+
+
+class MissingBookDataError(BookFormatError):
+    """Arquivo vazio ou com o placeholder da análise ainda não executada"""
+
+
+def _type_name(value):
+    if isinstance(value, bool):
+        return BOOLEAN
+    if isinstance(value, int):
+        return INTEGER
+    if isinstance(value, float):
+        return NUMBER
+    if isinstance(value, str):
+        return STRING
+    if isinstance(value, list):
+        return 'array'
+    if isinstance(value, dict):
+        return 'object'
+    return 'null'
+
+
+def _matches(value, expected):
+    actual = _type_name(value)
+    return actual == expected or (expected == NUMBER and actual == INTEGER)
+
+
+def check(value, schema, path):
+    """Confere ``value`` contra ``schema``; retorna (caminho, mensagem) do primeiro erro ou None"""
+    if isinstance(schema, str):
+        if not _matches(value, schema):
+            return path, f"esperado {schema}, encontrado {_type_name(value)}"
+        return None
+
+    if not _matches(value, schema['type']):
+        return path, f"esperado {schema['type']}, encontrado {_type_name(value)}"
+
+    if schema['type'] == 'array':
+        if schema['items'] is not None:
+            for i, item in enumerate(value):
+                error = check(item, schema['items'], f"{path}[{i}]")
+                if error:
+                    return error
+        return None
+
+    for key in schema['required']:
+        if key not in value:
+            return f"{path}.{key}", "campo obrigatório ausente"
+    for key, item in value.items():
+        item_schema = schema['fields'].get(key, schema['values'])
+        if item_schema is not None:
+            error = check(item, item_schema, f"{path}.{key}")
+            if error:
+                return error
+    return None
+
+
+def _line_column(data, offset):
+    prefix = data[:offset]
+    line = prefix.count(b'\n') + 1
+    column = offset - (prefix.rfind(b'\n') + 1) + 1
+    return line, column
+
+
+def _error_at(data, message, path, offset):
+    line, column = _line_column(data, offset)
+    context = bytes(data[max(0, offset - 80):offset + 80]).decode('utf-8', 'replace')
+    return BookFormatError(message, path=path, offset=offset, line=line, column=column, context=context)
+
+
+def _field_offset(data, start, end, path):
+    """Offset aproximado do último campo de ``path`` dentro do trecho [start, end)"""
+    key = path.rsplit('.', 1)[-1].split('[', 1)[0]
+    found = data.find(json.dumps(key).encode('utf-8'), start, end)
+    return found if found >= 0 else start
+
+
+def _decode_span(data, start, end, path):
+    raw = bytes(data[start:end])
+    stripped = raw.rstrip().rstrip(b',')
+    leading = len(stripped) - len(stripped.lstrip())
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError as e:
+        raise _error_at(data, f"JSON inválido: {e.msg}", path, start + leading + e.pos) from None
+    except UnicodeDecodeError as e:
+        raise _error_at(data, "texto fora de UTF-8", path, start + e.start) from None
+
+
+def validate_spans(data, summary_spans, segment_spans, segments_span):
+    """Valida o resumo e cada segmento localizados pela varredura de offsets"""
+    missing = [key for key in REQUIRED_KEYS if key != 'segments' and key not in summary_spans]
+    if missing:
+        raise BookFormatError(f"campo obrigatório ausente: {missing[0]}", path=missing[0])
+
+    for key, (start, end) in summary_spans.items():
+        schema = SUMMARY_SCHEMA.get(key)
+        value = _decode_span(data, start, end, key)
+        if schema is not None:
+            error = check(value, schema, key)
+            if error:
+                path, message = error
+                raise _error_at(data, message, path, _field_offset(data, start, end, path))
+
+    # Entre "[", os segmentos e "]" só pode haver as vírgulas separadoras
+    list_start, list_end = segments_span
+    previous_end = list_start + 1
+    for i, (start, end) in enumerate(segment_spans):
+        start, end = int(start), int(end)
+        path = f"segments[{i}]"
+        separator = b',' if i else b''
+        if bytes(data[previous_end:start]).strip() != separator:
+            raise _error_at(data, "conteúdo inesperado entre segmentos", path, previous_end)
+        previous_end = end
+
+        error = check(_decode_span(data, start, end, path), SEGMENT_SCHEMA, path)
+        if error:
+            field_path, message = error
+            raise _error_at(data, message, field_path, _field_offset(data, start, end, field_path))
+
+    if bytes(data[previous_end:list_end - 1]).strip():
+        raise _error_at(data, "conteúdo inesperado entre segmentos", f"segments[{len(segment_spans)}]",
+                        previous_end)
+
+
+def validate_book(data, scan):
+    """Valida o JSON completo do livro (bytes ou mmap) e retorna a varredura.
+
+    ``scan`` é a função de varredura de offsets (segment_loader.scan_json_book);
+    o retorno é (spans do resumo, spans dos segmentos).
+    """
+    head = bytes(data[:len(MISSING_DATA_PLACEHOLDER) + 64]).strip()
+    if not head or head.startswith(MISSING_DATA_PLACEHOLDER):
+        raise MissingBookDataError("dados de análise não encontrados")
+
+    first = len(bytes(data[:64])) - len(bytes(data[:64]).lstrip())
+    if bytes(data[first:first + 1]) != b'{':
+        raise _error_at(data, "o livro deve ser um objeto JSON", None, first)
+
+    try:
+        summary_spans, segment_spans, segments_span = scan(data)
+    except ValueError as e:
+        raise _error_at(data, str(e), None, len(data)) from None
+
+    if segments_span is None:
+        raise BookFormatError("campo obrigatório ausente ou não é uma lista: segments", path='segments')
+
+    validate_spans(data, summary_spans, segment_spans, segments_span)
+    return summary_spans, segment_spans
@@ -0,0 +1,413 @@
+"""Armazenamento compilado de livros do FLUX-ON Reader.
+
+As análises dos livros ficam em ``livros/<Título>.json``. Este módulo
+converte cada uma em um diretório em disco que pode ser mapeado em
+memória, evitando o ``json.loads`` de vários megabytes ao abrir o livro:
+
+- ``manifest.json``: resumo do livro (book_analysis, difficulty_map, ...)
+- ``texts.zbin`` + ``texts.blocks.npy`` + ``texts.idx.npy``: textos de todos
+  os segmentos em UTF-8, comprimidos em blocos de ``BLOCK_PAGES`` páginas
+  (zlib ou lzma) com tabelas de offsets; ler a página N descomprime apenas
+  o seu bloco, e os blocos recentes ficam em um LRU
+- ``meta.zbin`` + ``meta.blocks.npy`` + ``meta.idx.npy``: campos não numéricos
+  de cada segmento, no mesmo formato
+- ``columns/*.npy``: campos numéricos (difficulty, word_count,
+  readability_score, ...) como arrays contíguos
+- ``themes.npz``: ``theme_analysis`` normalizado (theme_table.py), com as
+  ocorrências de cada tema já associadas às páginas
+
+Só livros aprovados pela validação de ``book_schema.py`` são compilados;
+ao abrir, um armazenamento incompleto ou inconsistente com o manifesto é
+ignorado e o livro volta a ser lido do JSON.
+
+Uso (linha de comando)::
+
+    python book_store.py                      # compila todos os livros da biblioteca
+    python book_store.py livros/Caos.json     # compila um livro específico
+    python book_store.py --compressao lzma    # blocos menores, descompressão mais lenta
+"""
+
+import argparse
+import hashlib
+import json
+import lzma
+import mmap
+import os
+import re
+import shutil
+import threading
+import unicodedata
+import zlib
+
+import numpy as np
+
+import book_schema
+import segment_loader
+import segment_table
+import theme_table
+
+STORE_FORMAT_VERSION = 5
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LIBRARY_DIR = os.path.join(BASE_DIR, 'livros')
+STORE_ROOT = os.path.join(BASE_DIR, 'livros_compilados')
+
+# Dicionários aninhados do segmento cujos campos numéricos viram colunas
+NUMERIC_GROUPS = ('complexity_metrics', 'analysis')
+
+# Páginas por bloco comprimido e blocos descomprimidos mantidos por blob
+BLOCK_PAGES = 8
+BLOCK_CACHE_SIZE = 32
+
+CODECS = {
+    'zlib': (lambda data: zlib.compress(data, 9), zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress)
+}
+
+
+def book_id_from_path(path):
+    """Identificador estável do livro a partir do nome do arquivo de origem"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    normalized = unicodedata.normalize('NFKD', stem).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', normalized.lower()).strip('-') or 'livro'
+
+
+def list_books(library_dir=None):
+    """Catálogo da biblioteca: título -> caminho do JSON de análise"""
+    library_dir = library_dir or LIBRARY_DIR
+    if not os.path.isdir(library_dir):
+        return {}
+    return {
+        os.path.splitext(name)[0]: os.path.join(library_dir, name)
+        for name in sorted(os.listdir(library_dir), key=str.casefold)
+        if name.endswith('.json')
+    }
+
+
+def source_path_for(title, library_dir=None):
+    return os.path.join(library_dir or LIBRARY_DIR, f"{title}.json")
+
+
+def read_analysis_data(source_path):
+    """Lê e valida o JSON de análise; ``book_schema.BookFormatError`` se inválido"""
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    book_schema.validate_book(data, segment_loader.scan_json_book)
+    return json.loads(data)
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_hash_memo = {}
+_hash_memo_lock = threading.Lock()
+
+
+def content_hash(path):
+    """SHA-256 do arquivo de origem, recalculado apenas quando tamanho/mtime mudam"""
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    with _hash_memo_lock:
+        cached = _hash_memo.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    digest = _file_sha256(path)
+    with _hash_memo_lock:
+        _hash_memo[path] = (signature, digest)
+    return digest
+
+
+def _source_signature(path):
+    stat = os.stat(path)
+    return {
+        'file': os.path.basename(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': content_hash(path)
+    }
+
+
+def store_dir_for(source_path, store_root=None):
+    return os.path.join(store_root or STORE_ROOT, book_id_from_path(source_path))
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _numeric_columns(segments):
+    """Campos presentes e numéricos em todos os segmentos: (grupo, chave) -> dtype"""
+    if not segments:
+        return {}
+
+    candidates = {}
+    for key, value in segments[0].items():
+        if key in NUMERIC_GROUPS and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                if is_number(sub_value):
+                    candidates[(key, sub_key)] = None
+        elif is_number(value):
+            candidates[(None, key)] = None
+
+    columns = {}
+    for group, key in candidates:
+        values = []
+        for segment in segments:
+            container = segment.get(group) if group else segment
+            value = container.get(key) if isinstance(container, dict) else None
+            if not is_number(value):
+                break
+            values.append(value)
+        else:
+            all_int = all(isinstance(v, int) for v in values)
+            columns[(group, key)] = np.int64 if all_int else np.float64
+
+    return columns
+
+
+def column_name(group, key):
+    return f"{group}.{key}" if group else key
+
+
+def _write_blob(path, chunks, codec='zlib', block_pages=BLOCK_PAGES):
+    """Grava ``chunks`` comprimidos em blocos de ``block_pages`` itens.
+
+    ``.idx.npy`` guarda os offsets de cada item no fluxo descomprimido e
+    ``.blocks.npy`` os offsets de cada bloco no arquivo ``.zbin``.
+    """
+    compress = CODECS[codec][0]
+    offsets = np.zeros(len(chunks) + 1, dtype=np.uint64)
+    for i, chunk in enumerate(chunks):
+        offsets[i + 1] = offsets[i] + len(chunk)
+
+    block_count = (len(chunks) + block_pages - 1) // block_pages
+    block_offsets = np.zeros(block_count + 1, dtype=np.uint64)
+    with open(path + '.zbin', 'wb') as f:
+        for block in range(block_count):
+            data = compress(b''.join(chunks[block * block_pages:(block + 1) * block_pages]))
+            f.write(data)
+            block_offsets[block + 1] = block_offsets[block] + len(data)
+
+    np.save(path + '.idx.npy', offsets)
+    np.save(path + '.blocks.npy', block_offsets)
+
+
+def compile_book(source_path, store_root=None, codec='zlib'):
+    """Compila a análise de um livro para o formato em disco e retorna o diretório"""
+    analysis_data = read_analysis_data(source_path)
+    segments = analysis_data.get('segments', [])
+    columns = _numeric_columns(segments)
+
+    store_dir = store_dir_for(source_path, store_root)
+    tmp_dir = f"{store_dir}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(os.path.join(tmp_dir, 'columns'))
+
+    texts = []
+    metas = []
+    for segment in segments:
+        texts.append(segment.get('text', '').encode('utf-8'))
+
+        # Mantém as chaves (com None) para preservar a ordem original dos campos
+        meta = dict(segment)
+        if 'text' in meta:
+            meta['text'] = None
+        for group, key in columns:
+            if group:
+                meta[group] = dict(meta[group])
+                meta[group][key] = None
+            else:
+                meta[key] = None
+        metas.append(json.dumps(meta, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    _write_blob(os.path.join(tmp_dir, 'texts'), texts, codec)
+    _write_blob(os.path.join(tmp_dir, 'meta'), metas, codec)
+
+    for (group, key), dtype in columns.items():
+        container = (lambda s: s[group]) if group else (lambda s: s)
+        values = np.array([container(s)[key] for s in segments], dtype=dtype)
+        np.save(os.path.join(tmp_dir, 'columns', column_name(group, key) + '.npy'), values)
+
+    # Ocorrências de temas já associadas às páginas (theme_table.py)
+    page_starts = [segment.get('position', 0) for segment in segments]
+    theme_table.ThemeTable.from_theme_analysis(analysis_data.get('theme_analysis'), page_starts).save(
+        os.path.join(tmp_dir, 'themes.npz'))
+
+    manifest = {
+        'format_version': STORE_FORMAT_VERSION,
+        'book_id': book_id_from_path(source_path),
+        'source': _source_signature(source_path),
+        'segment_count': len(segments),
+        'texts_sha256': segment_table.texts_hash(texts),
+        'blocks': {'codec': codec, 'block_pages': BLOCK_PAGES},
+        'columns': [[group, key] for group, key in columns],
+        'summary': {k: v for k, v in analysis_data.items() if k not in ('segments', 'theme_analysis')}
+    }
+    with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+    if os.path.exists(store_dir):
+        shutil.rmtree(store_dir)
+    os.replace(tmp_dir, store_dir)
+    return store_dir
+
+
+def _is_fresh(manifest, source_path):
+    """Verifica se o armazenamento corresponde ao arquivo de origem atual"""
+    source = manifest.get('source', {})
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        # Sem arquivo de origem, o armazenamento compilado é a única cópia
+        return True
+
+    if stat.st_size != source.get('size'):
+        return False
+    if stat.st_mtime_ns == source.get('mtime_ns'):
+        return True
+    # mtime diferente (ex.: checkout do git) - confirmar pelo conteúdo
+    return content_hash(source_path) == source.get('sha256')
+
+
+def open_book(source_path, store_root=None):
+    """Abre o livro compilado de ``source_path``.
+
+    Retorna ``None`` se o armazenamento não existir, for de outra versão do
+    formato ou estiver desatualizado em relação ao arquivo de origem.
+    """
+    store_dir = store_dir_for(source_path, store_root)
+    manifest_path = os.path.join(store_dir, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format_version') != STORE_FORMAT_VERSION:
+        return None
+    if not _is_fresh(manifest, source_path):
+        return None
+
+    try:
+        book = CompiledBook(store_dir, manifest)
+    except (OSError, ValueError, KeyError):
+        # Armazenamento incompleto: o livro volta a ser lido do JSON
+        return None
+    if not book.is_consistent():
+        book.close()
+        return None
+    return book
+
+
+class _BlockBlob:
+    """Blob comprimido em blocos, com acesso O(1) por item e LRU de blocos"""
+
+    def __init__(self, path, codec, block_pages, encoding=None):
+        self.encoding = encoding
+        self.block_pages = block_pages
+        self._decompress = CODECS[codec][1]
+        self.offsets = np.load(path + '.idx.npy', mmap_mode='r')
+        self.block_offsets = np.load(path + '.blocks.npy', mmap_mode='r')
+        self._file = open(path + '.zbin', 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap não aceita arquivos vazios (livro sem segmentos)
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._blocks = segment_loader.LazySegmentList(
+            len(self.block_offsets) - 1, self._decompress_block, cache_size=BLOCK_CACHE_SIZE)
+
+    def _decompress_block(self, block):
+        start, end = int(self.block_offsets[block]), int(self.block_offsets[block + 1])
+        return self._decompress(self._data[start:end])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        block = index // self.block_pages
+        data = self._blocks[block]
+        base = int(self.offsets[block * self.block_pages])
+        chunk = data[int(self.offsets[index]) - base:int(self.offsets[index + 1]) - base]
+        return chunk.decode(self.encoding) if self.encoding else chunk
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+
+class CompiledBook:
+    """Livro compilado aberto: resumo em memória, segmentos mapeados do disco"""
+
+    def __init__(self, store_dir, manifest):
+        self.store_dir = store_dir
+        self.manifest = manifest
+        self.book_id = manifest['book_id']
+        self.content_hash = manifest['source']['sha256']
+
+        blocks = manifest['blocks']
+        self.texts = _BlockBlob(os.path.join(store_dir, 'texts'), blocks['codec'], blocks['block_pages'],
+                                encoding='utf-8')
+        self._metas = _BlockBlob(os.path.join(store_dir, 'meta'), blocks['codec'], blocks['block_pages'])
+        self.columns = {
+            (group, key): np.load(os.path.join(store_dir, 'columns', column_name(group, key) + '.npy'),
+                                  mmap_mode='r')
+            for group, key in manifest['columns']
+        }
+        self.theme_table = theme_table.ThemeTable.load(os.path.join(store_dir, 'themes.npz'))
+        self.segments = segment_loader.LazySegmentList(len(self.texts), self._decode_segment)
+
+    def is_consistent(self):
+        """Confere as quantidades de páginas de textos, metadados e colunas com o manifesto"""
+        count = self.manifest.get('segment_count')
+        return (len(self.texts) == count and len(self._metas) == count and
+                all(len(values) == count for values in self.columns.values()))
+
+    def _decode_segment(self, index):
+        segment = json.loads(self._metas[index])
+        if 'text' in segment:
+            segment['text'] = self.texts[index]
+        for (group, key), values in self.columns.items():
+            container = segment[group] if group else segment
+            container[key] = values[index].item()
+        return segment
+
+    def column(self, name):
+        """Coluna numérica pelo nome (ex.: 'difficulty', 'complexity_metrics.word_count')"""
+        group, _, key = name.rpartition('.')
+        return self.columns[(group or None, key)]
+
+    def as_analysis_data(self):
+        """Dicionário no formato esperado por ``QuantumBookReader``"""
+        analysis_data = dict(self.manifest['summary'])
+        analysis_data['segments'] = segment_table.SegmentTable.from_compiled(self)
+        analysis_data['theme_table'] = self.theme_table
+        return analysis_data
+
+    def close(self):
+        self.texts.close()
+        self._metas.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compila livros do FLUX-ON Reader para o formato em disco")
+    parser.add_argument('sources', nargs='*',
+                        help="Arquivos de análise (.json); padrão: todos os livros de 'livros/'")
+    parser.add_argument('--destino', default=STORE_ROOT, help="Diretório raiz dos livros compilados")
+    parser.add_argument('--compressao', choices=sorted(CODECS), default='zlib',
+                        help="Compressão dos blocos de texto (padrão: zlib)")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or list(list_books().values())
+    for source in sources:
+        store_dir = compile_book(source, args.destino, args.compressao)
+        print(f"✅ {source} -> {store_dir}")
+
+
+if __name__ == "__main__":
+    main()
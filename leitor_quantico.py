@@ -0,0 +1,3769 @@
+"""FLUX-ON Quantum Reader: núcleo comum a todos os livros.
+
+Contém o leitor (QuantumBookReader), busca, navegação e o cache de livros
+compartilhado pelo processo. Os pontos de entrada são ``biblioteca.py``
+(todos os livros em um único processo) e os scripts de cada livro
+(``Caos.py``, ``Liberdade.py``, ...), que apenas abrem o respectivo livro.
+"""
+
+import time
+_import_started = time.perf_counter()
+
+import streamlit as st
+import numpy as np
+import json
+import re
+import base64
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
+import ast
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import bisect
+import heapq
+import html
+import math
+import os
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+import book_schema
+import book_store
+import segment_loader
+import search_analyzer
+import search_index
+import search_query
+import search_regex
+import segment_table
+import precompute
+import startup_timing
+import theme_table
+
+# Máximo de livros residentes em memória no processo (os menos lidos são descartados)
+MAX_RESIDENT_BOOKS = int(os.environ.get('FLUXON_MAX_LIVROS', 3))
+
+# Consultas recentes cujos resultados ficam em memória, comuns a todas as sessões
+QUERY_CACHE_SIZE = int(os.environ.get('FLUXON_CACHE_BUSCAS', 256))
+
+# Busca avançada: bônus sobre a pontuação BM25 de páginas com a frase exata ou o versículo
+STRUCTURED_MATCH_BOOST = 2.0
+STRUCTURED_MATCH_MIN_SCORE = 0.1
+
+# Busca na biblioteca: livros consultados em paralelo
+FEDERATED_SEARCH_WORKERS = 6
+# Busca na biblioteca: índices mantidos no processo (só o índice e as páginas mapeadas, sem o livro)
+MAX_LIBRARY_INDEXES = int(os.environ.get('FLUXON_MAX_INDICES', 16))
+
+# Resultados de busca exibidos por vez (os trechos são gerados só para eles)
+RESULTS_PER_PAGE = 10
+
+# Concordância (KWIC): palavras de contexto de cada lado da ocorrência
+CONCORDANCE_CONTEXT_WORDS = 8
+CONCORDANCE_ROW = (
+    '<tr><td style="color: #c77dff;">{page}</td>'
+    '<td style="text-align: right; white-space: nowrap;">{left}</td>'
+    '<td style="text-align: center; white-space: nowrap;">'
+    '<mark style="background-color: #ffeb3b; color: black; padding: 2px 4px; border-radius: 3px;">{keyword}</mark></td>'
+    '<td style="white-space: nowrap;">{right}</td></tr>'
+)
+
+# Operador de proximidade da busca: "caos NEAR/5 ordem"
+NEAR_RE = re.compile(r'\s+NEAR/(\d+)\s+')
+WHITESPACE_RE = re.compile(r'\s+')
+EXCERPT_MARK = '<mark style="background-color: #ffeb3b; color: black; padding: 2px 4px; border-radius: 3px;">{}</mark>'
+
+def _plotting_modules():
+    """pandas e plotly só são importados quando um gráfico é renderizado"""
+    return (startup_timing.lazy_import('pandas'),
+            startup_timing.lazy_import('plotly.express'),
+            startup_timing.lazy_import('plotly.graph_objects'))
+
+def apply_page_style():
+    """Configuração da página e CSS; deve ser a primeira chamada de cada rerun"""
+    # --- CONFIGURAÇÃO DA PÁGINA ---
+    st.set_page_config(
+        page_title="FLUX-ON Leitura Quântica",
+        page_icon="📚",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # --- ESTILOS CSS AVANÇADOS ---
+    st.markdown("""
+<style>
+    /* Tema principal aprimorado */
+    .main {
+        background: linear-gradient(135deg, #0f0c29, #1a1a2e, #16213e);
+        color: #e6e6fa;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+    
+    .stApp {
+        background: linear-gradient(135deg, #0f0c29 0%, #1a1a2e 50%, #16213e 100%);
+    }
+    
+    /* Tipografia moderna */
+    h1, h2, h3, h4, h5, h6 {
+        color: #e0aaff;
+        font-family: 'Georgia', serif;
+        text-shadow: 0 0 15px rgba(224, 170, 255, 0.4);
+        margin-bottom: 1rem;
+    }
+    
+    h1 {
+        font-size: 2.8rem;
+        background: linear-gradient(135deg, #e0aaff, #9d4edd, #7b2cbf);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        border-bottom: 3px solid #7b2cbf;
+        padding-bottom: 0.5rem;
+        margin-bottom: 1.5rem;
+    }
+    
+    /* Cards e containers futuristas */
+    .metric-card {
+        background: rgba(45, 45, 65, 0.8);
+        border-left: 5px solid #9d4edd;
+        padding: 20px;
+        margin: 15px 0;
+        border-radius: 15px;
+        box-shadow: 0 6px 25px rgba(157, 78, 221, 0.3);
+        backdrop-filter: blur(12px);
+        transition: all 0.3s ease;
+        border: 1px solid rgba(157, 78, 221, 0.2);
+    }
+    
+    .metric-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 12px 35px rgba(157, 78, 221, 0.4);
+        border-color: rgba(157, 78, 221, 0.4);
+    }
+    
+    /* Text area styling aprimorado */
+    .text-container {
+        background: rgba(30, 30, 46, 0.95);
+        padding: 30px;
+        border-radius: 20px;
+        border: 2px solid #7b2cbf;
+        box-shadow: 0 0 40px rgba(123, 44, 191, 0.25);
+        backdrop-filter: blur(8px);
+        line-height: 1.9;
+        font-size: 17px;
+        max-height: 600px;
+        overflow-y: auto;
+        font-family: 'Georgia', serif;
+    }
+    
+    /* Highlight styles melhorados */
+    .highlight {
+        background: linear-gradient(120deg, #9d4edd50, #5a189a70);
+        padding: 3px 8px;
+        border-radius: 5px;
+        border-bottom: 2px solid #e0aaff;
+        font-weight: 600;
+        color: #f8f9fa;
+    }
+    
+    .highlight-important {
+        background: linear-gradient(120deg, #ff6b6b50, #ee5a2470);
+        padding: 3px 8px;
+        border-radius: 5px;
+        border-bottom: 2px solid #ff6b6b;
+        font-weight: 700;
+        color: #f8f9fa;
+    }
+    
+    .user-highlight {
+        background: linear-gradient(120deg, #4cc9f050, #4895ef70);
+        padding: 3px 8px;
+        border-radius: 5px;
+        border-bottom: 2px solid #4cc9f0;
+        font-weight: 600;
+        color: #f8f9fa;
+    }
+    
+    /* Botões de navegação quântica */
+    .nav-button {
+        background: linear-gradient(135deg, #9d4edd, #7b2cbf);
+        color: white;
+        border: none;
+        padding: 14px 24px;
+        border-radius: 10px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+        margin: 5px;
+        box-shadow: 0 4px 15px rgba(157, 78, 221, 0.3);
+    }
+    
+    .nav-button:hover {
+        background: linear-gradient(135deg, #7b2cbf, #5a189a);
+        transform: translateY(-3px);
+        box-shadow: 0 8px 20px rgba(157, 78, 221, 0.5);
+    }
+    
+    /* Sidebar quântica */
+    .sidebar .sidebar-content {
+        background: linear-gradient(180deg, #1a1a2e 0%, #16213e 100%);
+        border-right: 3px solid #9d4edd;
+        box-shadow: 5px 0 25px rgba(0, 0, 0, 0.3);
+    }
+    
+    /* Abas estilizadas */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        white-space: pre-wrap;
+        background: rgba(45, 45, 65, 0.7);
+        border-radius: 10px 10px 0 0;
+        gap: 10px;
+        padding: 10px 20px;
+        border-bottom: 2px solid #7b2cbf;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #9d4edd, #7b2cbf);
+        color: white;
+    }
+    
+    /* Barras de progresso quânticas */
+    .stProgress > div > div > div {
+        background: linear-gradient(90deg, #9d4edd, #5a189a);
+        box-shadow: 0 0 10px rgba(157, 78, 221, 0.5);
+    }
+    
+    /* Métricas personalizadas */
+    [data-testid="stMetric"] {
+        background: rgba(45, 45, 65, 0.8);
+        padding: 20px;
+        border-radius: 15px;
+        border-left: 5px solid #9d4edd;
+        box-shadow: 0 4px 20px rgba(157, 78, 221, 0.2);
+    }
+    
+    /* Animações suaves */
+    @keyframes pulse {
+        0% { transform: scale(1); }
+        50% { transform: scale(1.02); }
+        100% { transform: scale(1); }
+    }
+    
+    .pulse-animation {
+        animation: pulse 3s infinite;
+    }
+    
+    /* Scrollbar personalizada */
+    .text-container::-webkit-scrollbar {
+        width: 8px;
+    }
+    
+    .text-container::-webkit-scrollbar-track {
+        background: rgba(30, 30, 46, 0.5);
+        border-radius: 10px;
+    }
+    
+    .text-container::-webkit-scrollbar-thumb {
+        background: linear-gradient(135deg, #9d4edd, #7b2cbf);
+        border-radius: 10px;
+    }
+    
+    /* Efeitos de foco */
+    .focus-effect {
+        transition: all 0.3s ease;
+    }
+    
+    .focus-effect:hover {
+        box-shadow: 0 0 25px rgba(157, 78, 221, 0.4);
+    }
+</style>
+""", unsafe_allow_html=True)
+
+class NavigationSystem:
+    def __init__(self, total_pages=1):
+        self.total_pages = total_pages
+    
+    # ✅ NOVO MÉTODO INTERMEDIÁRIO
+    def navigate_from_slider(self):
+        """
+        Lê o valor do slider a partir do session_state e navega para a página.
+        """
+        # A 'key' do slider é 'page_selector_optimized'
+        new_page = st.session_state.page_selector_optimized
+        self.navigate_to(new_page)
+        
+    def navigate_to(self, page_number):
+        """Navega para uma página específica com verificação de limites"""
+        if 1 <= page_number <= self.total_pages:
+            st.session_state.pending_page = page_number
+            st.session_state.page_change_confirmed = False
+            return True
+        return False
+
+    def confirm_page_change(self):
+        """Confirma a mudança de página"""
+        if hasattr(st.session_state, 'pending_page'):
+            st.session_state.current_page = st.session_state.pending_page
+            # Limpa estados relacionados à página atual
+            if hasattr(st.session_state, 'ia_analysis_result'):
+                st.session_state.ia_analysis_result = None
+            if hasattr(st.session_state, 'show_ia_analysis'):
+                st.session_state.show_ia_analysis = False
+    
+    # ... (o restante da classe 'NavigationSystem' permanece igual) ...
+    def next_page(self):
+        current = st.session_state.get('current_page', 1)
+        if current < self.total_pages:
+            return self.navigate_to(current + 1)
+        return False
+    
+    def prev_page(self):
+        current = st.session_state.get('current_page', 1)
+        if current > 1:
+            return self.navigate_to(current - 1)
+        return False
+    
+    def first_page(self):
+        return self.navigate_to(1)
+    
+    def last_page(self):
+        return self.navigate_to(self.total_pages)
+        
+    def update_total_pages(self, total_pages):
+        self.total_pages = total_pages
+
+class RenderController:
+    def __init__(self):
+        self._render_lock = False
+        self._pending_operations = []
+        self._last_render_time = 0
+        self._render_interval = 0.5
+        
+    def should_render(self):
+        current_time = time.time()
+        if (current_time - self._last_render_time < self._render_interval or 
+            self._render_lock):
+            return False
+        return True
+        
+    def acquire_lock(self):
+        if not self._render_lock:
+            self._render_lock = True
+            return True
+        return False
+        
+    def release_lock(self):
+        self._render_lock = False
+        self._last_render_time = time.time()
+        
+    def queue_operation(self, operation):
+        self._pending_operations.append(operation)
+        
+    def execute_queued(self):
+        for operation in self._pending_operations:
+            try:
+                operation()
+            except Exception as e:
+                print(f"Erro na operação enfileirada: {e}")
+        self._pending_operations = []
+
+class SearchResults:
+    """Resultados de uma busca em ordem de relevância, com os trechos gerados sob demanda.
+    
+    A busca calcula apenas páginas e pontuações (``hits``). Palavra
+    encontrada e trecho de cada resultado são montados por ``materialize``
+    quando o resultado é lido (índice, fatia, iteração ou ``page``) e
+    guardados para as leituras seguintes. ``truncated`` indica uma busca
+    interrompida por limite de tempo ou de ocorrências (resultados parciais).
+    """
+    
+    def __init__(self, hits=(), materialize=dict, truncated=False, errors=None):
+        self._hits = list(hits)
+        self._materialize = materialize
+        self._results = {}
+        self.truncated = truncated
+        # Busca na biblioteca: livro -> erro dos livros que não puderam ser buscados
+        self.errors = errors or {}
+    
+    def __len__(self):
+        return len(self._hits)
+    
+    def __bool__(self):
+        return bool(self._hits)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._hits)))]
+        if index < 0:
+            index += len(self._hits)
+        if not 0 <= index < len(self._hits):
+            raise IndexError(index)
+        if index not in self._results:
+            self._results[index] = self._materialize(self._hits[index])
+        return self._results[index]
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self._hits)))
+    
+    def hits(self):
+        """Resultados sem trecho (tipo, página, pontuação...), sem montar nenhum"""
+        return list(self._hits)
+    
+    def page_count(self, per_page=RESULTS_PER_PAGE):
+        return max(1, -(-len(self._hits) // per_page))
+    
+    def page(self, number, per_page=RESULTS_PER_PAGE):
+        """Resultados da página ``number`` (base 1) da listagem"""
+        start = (number - 1) * per_page
+        return self[start:start + per_page]
+
+class SavedSearch:
+    """Busca guardada no estado da sessão: só os resultados leves, sem o motor que os montaria.
+    
+    Um ``SearchResults`` na sessão prenderia na memória o motor de busca (e
+    o livro) mesmo depois de ele sair do cache. Aqui ficam a origem
+    (``content_hash`` do livro ou títulos da biblioteca), a consulta, os
+    resultados leves e os grupos de termos dos trechos; a cada renderização,
+    o ``cursor`` do motor atual do cache monta o ``SearchResults``.
+    """
+    
+    __slots__ = ('source', 'query', 'hits', 'term_groups', 'truncated', 'errors')
+    
+    def __init__(self, source=None, query="", hits=(), term_groups=(), truncated=False, errors=None):
+        self.source = source
+        self.query = query
+        self.hits = tuple(hits)
+        # Grupos de termos do livro (busca no livro) ou título -> grupos (biblioteca)
+        self.term_groups = term_groups
+        self.truncated = truncated
+        self.errors = errors or {}
+    
+    def __len__(self):
+        return len(self.hits)
+
+def normalize_query(query):
+    """Forma canônica da consulta (chave do cache): espaços colapsados e, sem operadores, minúsculas"""
+    query = ' '.join(query.split())
+    # AND/OR/NOT só valem em maiúsculas; sem eles, a busca já ignora maiúsculas
+    return query if search_query.has_operators(query) else query.lower()
+
+class QueryCache:
+    """Resultados de buscas recentes, comuns a todas as sessões do processo (LRU).
+    
+    A chave é (hash do conteúdo do livro, consulta normalizada, tipo de
+    busca, opções). Guarda só os resultados leves (sem trecho) e os termos
+    da consulta, nada que referencie o ``SearchEngine``: o cursor é refeito
+    sobre o motor atual a cada leitura, sem percorrer o índice, e o cache
+    não mantém em memória livros que já saíram do ``SharedBookCache``.
+    """
+    
+    def __init__(self, max_entries=QUERY_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return results
+    
+    def put(self, key, results):
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def discard(self, content_hash):
+        """Remove as entradas de um conteúdo de livro que não será mais buscado"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == content_hash]:
+                del self._entries[key]
+    
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'max_entries': self.max_entries}
+
+class SearchEngine:
+    """Motor de busca otimizado para livros grandes"""
+    
+    def __init__(self, segments, chapters, index=None, analyzer=None, content_hash=None, query_cache=None):
+        self.segments = segments
+        self.chapters = chapters
+        # Resultados de advanced_search no QueryCache do processo (só livros com hash de conteúdo)
+        self.content_hash = content_hash
+        self.query_cache = query_cache
+        # Mesmo analisador (search_analyzer.py) na indexação e nas consultas
+        self.analyzer = analyzer or self.default_analyzer()
+        self.index_loaded = False
+        # O motor é compartilhado entre sessões (SharedBook): só uma thread constrói o índice
+        self._index_lock = threading.Lock()
+        self.chapter_index = self._build_chapter_index()
+        self._doc_lengths = None
+        # Texto do livro inteiro para a busca por expressão regular (montado no primeiro uso)
+        self._corpus = None
+        
+        # Índice pré-calculado (precompute.py), mapeado do disco: dispensa o _build_index
+        if index is not None:
+            self.word_index = index
+            self.index_loaded = True
+    
+    def export_index(self):
+        """Índice (``PositionalIndex``) no formato aceito pelo parâmetro ``index`` (para pré-cálculo)"""
+        with self._index_lock:
+            if not self.index_loaded:
+                self._build_index()
+                self.index_loaded = True
+        return self.word_index
+        
+    def _ensure_index_loaded(self):
+        """Garante que o índice está carregado (lazy loading)"""
+        if not self.index_loaded:
+            with self._index_lock:
+                if not self.index_loaded:
+                    with st.spinner("📚 Carregando índice de busca..."):
+                        self._build_index()
+                        self.index_loaded = True
+    
+    def _build_chapter_index(self):
+        return {
+            chapter['number']: {
+                'title': chapter['title'],
+                'start_page': chapter['start_page'],
+                'end_page': chapter['end_page']
+            }
+            for chapter in self.chapters
+        }
+    
+    def _build_index(self):
+        """Constrói o índice invertido posicional (search_index.py), usado também por frases"""
+        texts = [segment.text for segment in self.segments]
+        self.word_index = search_index.PositionalIndex.build(texts, self.analyzer)
+    
+    @property
+    def doc_lengths(self):
+        """Palavras por página (complexity_metrics.word_count), tamanho do documento no BM25"""
+        if self._doc_lengths is None:
+            lengths = self.segments.column('complexity_metrics.word_count')
+            if not np.any(lengths):
+                # Livro sem a métrica: conta as ocorrências indexadas de cada página
+                pages = np.frombuffer(self.word_index.pages, dtype=np.uint32)
+                counts = np.diff(np.frombuffer(self.word_index.position_bounds, dtype=np.uint32))
+                lengths = np.bincount(pages, weights=counts, minlength=len(self.segments) + 1)[1:]
+            self._doc_lengths = lengths
+        return self._doc_lengths
+    
+    def _fuzzy_terms(self, token):
+        """Termos das palavras do livro a até 1-2 edições de ``token`` (erros de digitação).
+        
+        A palavra digitada é comparada só normalizada, sem radical: o radical
+        de um erro ("cahos" -> "cah") raramente se parece com o da palavra certa.
+        """
+        surface = self.analyzer.normalize(token)
+        distance = search_index.fuzzy_distance(surface)
+        if not distance:
+            return []
+        return [match for match, _ in self.word_index.terms_within(surface, distance)]
+    
+    def _match_terms(self, word, exact_match, fuzzy=True):
+        """Termos do índice para cada palavra da consulta (uma lista por palavra).
+        
+        Com ``fuzzy``, a palavra que não encontra nenhum termo passa a valer
+        pelos termos das palavras mais próximas em distância de edição.
+        """
+        search_term = word.strip()
+        tokens = dict.fromkeys(search_analyzer.TOKEN_RE.findall(search_term))
+        term_groups = []
+        # Mesmo analisador da indexação: "religiao" encontra "religião" e "religiões"
+        if exact_match:
+            terms = set()
+            for token in tokens:
+                term = self.analyzer.analyze_token(token)
+                if term is None or term in terms:
+                    continue
+                terms.add(term)
+                matches = [term] if term in self.word_index else []
+                if not matches and fuzzy:
+                    matches = self._fuzzy_terms(token)
+                if matches:
+                    term_groups.append(matches)
+            return term_groups
+        # Busca parcial, palavra a palavra: o trecho, só normalizado (sem radical), é procurado
+        # nas palavras do livro (search_index.py) e vale pelos termos delas; as expansões de
+        # uma palavra contam como um único termo no BM25
+        for token in tokens:
+            expansions = self.word_index.terms_containing(self.analyzer.normalize(token))
+            if not expansions and fuzzy:
+                expansions = self._fuzzy_terms(token)
+            if expansions:
+                term_groups.append(expansions)
+        return term_groups
+    
+    def _word_excerpt(self, page, term_groups):
+        """Palavra encontrada e trecho na primeira ocorrência de um dos termos na página"""
+        position = min(
+            (positions[0] for group in term_groups for positions in
+             (self.word_index.positions_on_page(term, page) for term in group) if positions),
+            default=None
+        )
+        if position is None:
+            return {}
+        # A palavra como está no texto, não o radical
+        match = search_analyzer.TOKEN_RE.match(self.segments[page - 1].text, position)
+        return {
+            'matched_term': match.group(),
+            'excerpt': self._span_excerpt(page, match.start(), match.end(), context_words=5)
+        }
+    
+    def _materialize(self, hit, term_groups=()):
+        """Resultado completo (com trecho) de um resultado da busca"""
+        result = {key: value for key, value in hit.items() if key != 'span'}
+        if 'span' in hit:
+            result['excerpt'] = self._span_excerpt(hit['page'], *hit['span'])
+        elif hit['type'] == 'word':
+            result.update(self._word_excerpt(hit['page'], term_groups))
+        return result
+    
+    def search_word(self, word, exact_match=False, max_results=None, fuzzy=True):
+        """Páginas ordenadas por relevância (BM25); com ``max_results``, apenas as k melhores.
+        
+        ``fuzzy`` tolera erros de digitação nas palavras sem correspondência.
+        """
+        if not self.index_loaded:
+            self._ensure_index_loaded()
+        
+        term_groups = self._match_terms(word, exact_match, fuzzy)
+        scores, counts = self.word_index.bm25(term_groups, self.doc_lengths)
+        
+        # Heap limitado a k páginas em vez de ordenar todas
+        pages = np.flatnonzero(scores)
+        top_pages = heapq.nlargest(max_results or len(pages), pages, key=scores.__getitem__)
+        
+        # Trechos apenas para os resultados que forem lidos
+        hits = [
+            {'type': 'word', 'page': int(page), 'score': float(scores[page]), 'count': int(counts[page])}
+            for page in top_pages
+        ]
+        return SearchResults(hits, partial(self._materialize, term_groups=term_groups))
+    
+    @staticmethod
+    def _get_stopwords():
+        """Lista de palavras comuns para ignorar na indexação"""
+        return frozenset({
+            'o', 'a', 'e', 'de', 'da', 'do', 'em', 'para', 'com', 'que', 'é', 'um', 'uma',
+            'os', 'as', 'se', 'por', 'não', 'são', 'como', 'mas', 'foi', 'ao',
+            'das', 'dos', 'nas', 'nos', 'pelo', 'pela', 'pelos', 'pelas', 'esse', 'essa',
+            'isso', 'isto', 'aquele', 'aquela', 'aquilo', 'outro', 'outra', 'outros', 'outras',
+            'qual', 'quais', 'quando', 'onde', 'quem', 'cujo', 'cuja', 'cujos', 'cujas',
+            'quê', 'porque', 'porquê'
+        })
+    
+    @classmethod
+    def default_analyzer(cls):
+        """Analisador português (search_analyzer.py) com as stopwords de ``_get_stopwords``"""
+        return search_analyzer.portuguese(cls._get_stopwords())
+    
+    def search_phrase(self, phrase, pages=None):
+        """Busca por frase exata, pela interseção das listas posicionais do índice.
+        
+        Com ``pages`` (ordenadas), só essas páginas são consideradas.
+        """
+        self._ensure_index_loaded()
+        query_tokens = search_analyzer.TOKEN_RE.findall(phrase)
+        query_terms = [(term, ordinal) for term, ordinal, _ in self.analyzer.analyze(phrase)]
+        if not query_terms:
+            # Frase só de stopwords: nada indexado para ancorar a busca
+            return SearchResults()
+        
+        # As stopwords da frase ficam como lacunas no índice; confere nas páginas candidatas
+        stopword_slots = [
+            (ordinal, self.analyzer.normalize(token)) for ordinal, token in enumerate(query_tokens)
+            if self.analyzer.analyze_token(token) is None
+        ]
+        first_ordinal = query_terms[0][1]
+        
+        results = []
+        for page, offsets in self.word_index.phrase_matches(query_terms, pages).items():
+            text = self.segments[page - 1].text
+            spans = []
+            for offset in offsets:
+                tokens = self._tokens_around(page, text, offset, first_ordinal, len(query_tokens) - first_ordinal)
+                if tokens is None:
+                    continue
+                if all(self.analyzer.normalize(tokens[ordinal].group()) == stopword
+                       for ordinal, stopword in stopword_slots):
+                    spans.append((tokens[0].start(), tokens[-1].end()))
+            if spans:
+                results.append({'type': 'phrase', 'page': page, 'count': len(spans), 'span': spans[0]})
+        return SearchResults(results, self._materialize)
+    
+    def _tokens_around(self, page, text, offset, before, after):
+        """As ``before`` palavras antes de ``offset`` e as ``after`` a partir dele (None se faltarem).
+        
+        Os limites das palavras vêm do índice, sem separar a página em palavras.
+        """
+        tokens = self.word_index.page_tokens(page)
+        ordinal = bisect.bisect_left(tokens, offset)
+        if ordinal < before or ordinal + after > len(tokens):
+            return None
+        return [search_analyzer.TOKEN_RE.match(text, start) for start in tokens[ordinal - before:ordinal + after]]
+    
+    def search_near(self, query, pages=None):
+        """Busca por proximidade: ``palavra NEAR/k palavra [NEAR/j palavra ...]``"""
+        self._ensure_index_loaded()
+        parts = NEAR_RE.split(query.strip())
+        operands, distances = parts[::2], [int(k) for k in parts[1::2]]
+        
+        terms = []
+        for operand in operands:
+            operand_terms = [term for term, _, _ in self.analyzer.analyze(operand)]
+            if len(operand_terms) != 1:
+                # Cada lado do NEAR/k é uma palavra indexada
+                return SearchResults()
+            terms.append(operand_terms[0])
+        
+        results = []
+        for page, spans in self.word_index.near_matches(terms, distances, pages).items():
+            start, last = spans[0]
+            end = search_analyzer.TOKEN_RE.match(self.segments[page - 1].text, last).end()
+            results.append({'type': 'near', 'page': page, 'count': len(spans), 'span': (start, end)})
+        return SearchResults(results, self._materialize)
+    
+    def search_chapter(self, chapter_ref):
+        """Busca por capítulo"""
+        self._ensure_index_loaded()
+        results = []
+        
+        # Tentar encontrar por número
+        if isinstance(chapter_ref, int) or chapter_ref.isdigit():
+            chapter_num = int(chapter_ref)
+            if chapter_num in self.chapter_index:
+                chapter = self.chapter_index[chapter_num]
+                results.append({
+                    'type': 'chapter',
+                    'number': chapter_num,
+                    'title': chapter['title'],
+                    'start_page': chapter['start_page'],
+                    'end_page': chapter['end_page']
+                })
+        
+        # Buscar por título
+        for chapter_num, chapter_info in self.chapter_index.items():
+            if (isinstance(chapter_ref, str) and 
+                chapter_ref.lower() in chapter_info['title'].lower()):
+                results.append({
+                    'type': 'chapter',
+                    'number': chapter_num,
+                    'title': chapter_info['title'],
+                    'start_page': chapter_info['start_page'],
+                    'end_page': chapter_info['end_page']
+                })
+        
+        return results
+    
+    def search_verse(self, verse_ref):
+        """Busca por versículo (padrão: capítulo:versículo)"""
+        self._ensure_index_loaded()
+        results = []
+        
+        # Padrão: 3:16 (capítulo 3, versículo 16)
+        verse_pattern = r'(\d+)[:\.](\d+)'
+        match = re.search(verse_pattern, verse_ref)
+        
+        if match:
+            chapter_num = int(match.group(1))
+            verse_num = int(match.group(2))
+            
+            # Encontrar capítulo
+            if chapter_num in self.chapter_index:
+                chapter = self.chapter_index[chapter_num]
+                
+                # Procurar versículo no capítulo
+                verse_pattern = re.compile(rf'\b{verse_num}\b|\b{verse_num}[\.\:]', re.IGNORECASE)
+                
+                for page in range(chapter['start_page'], chapter['end_page'] + 1):
+                    if page <= len(self.segments):
+                        text = self.segments[page - 1].text
+                        verse_match = verse_pattern.search(text)
+                        if verse_match:
+                            results.append({
+                                'type': 'verse',
+                                'chapter': chapter_num,
+                                'verse': verse_num,
+                                'page': page,
+                                'span': verse_match.span()
+                            })
+        
+        return SearchResults(results, self._materialize)
+    
+    def _regex_corpus(self):
+        if self._corpus is None:
+            with self._index_lock:
+                if self._corpus is None:
+                    self._corpus = search_regex.Corpus(segment.text for segment in self.segments)
+        return self._corpus
+    
+    def search_regex(self, pattern, max_results=None):
+        """Páginas, em ordem, com ocorrências da expressão regular ``pattern``.
+        
+        A expressão percorre uma única vez o texto concatenado do livro
+        (search_regex.py), em um processo separado, com limite de tempo e de
+        ocorrências. Levanta
+        ``search_regex.PatternError`` para expressões inválidas ou recusadas.
+        """
+        hits, truncated = self._regex_hits(pattern, max_results)
+        return SearchResults(hits, self._materialize, truncated=truncated)
+    
+    def _regex_hits(self, pattern, max_results):
+        compiled = search_regex.compile_pattern(pattern)
+        self._ensure_index_loaded()
+        matches, truncated = search_regex.shared_worker().scan(compiled, self._regex_corpus())
+        
+        # Uma entrada por página, com o trecho da primeira ocorrência
+        results = {}
+        for page, start, end in matches:
+            if page in results:
+                results[page]['count'] += 1
+            else:
+                results[page] = {'type': 'regex', 'page': page, 'count': 1, 'span': (start, end)}
+        return list(results.values())[:max_results], truncated
+    
+    def _span_excerpt(self, page_num, start, end, context_words=10):
+        """Trecho com ``text[start:end]`` destacado e ``context_words`` palavras de cada lado.
+        
+        O contexto é recortado do texto pelos offsets das palavras guardados no índice.
+        """
+        text = self.segments[page_num - 1].text
+        tokens = self.word_index.page_tokens(page_num)
+        window_start, window_end = start, None
+        if tokens:
+            first = max(0, bisect.bisect_right(tokens, start) - 1)
+            last = max(first, bisect.bisect_left(tokens, end) - 1)
+            window_start, window_end = self.word_index.token_window(page_num, first, last, context_words, context_words)
+        before = WHITESPACE_RE.sub(' ', text[min(window_start, start):start]).lstrip()
+        after = WHITESPACE_RE.sub(' ', text[end:window_end]).rstrip()
+        excerpt = before + EXCERPT_MARK.format(text[start:end]) + after
+        return excerpt + "..." if window_end is not None else excerpt
+    
+    def concordance(self, word, exact_match=True, context_words=CONCORDANCE_CONTEXT_WORDS):
+        """Concordância (KWIC) de ``word``: cada ocorrência, na ordem do livro, com o contexto dos dois lados.
+        
+        Só as ocorrências lidas do ``SearchResults`` têm o contexto recortado.
+        """
+        self._ensure_index_loaded()
+        terms = sorted({term for group in self._match_terms(word, exact_match, fuzzy=False) for term in group})
+        pages, ordinals, offsets = self.word_index.occurrences(terms)
+        return SearchResults(range(len(pages)),
+                             partial(self._concordance_line, pages, ordinals, offsets, context_words))
+    
+    def _concordance_line(self, pages, ordinals, offsets, context_words, index):
+        page, ordinal, offset = int(pages[index]), int(ordinals[index]), int(offsets[index])
+        text = self.segments[page - 1].text
+        end = search_analyzer.TOKEN_RE.match(text, offset).end()
+        start, stop = self.word_index.token_window(page, ordinal, ordinal, context_words, context_words)
+        return {
+            'type': 'concordance',
+            'page': page,
+            'left': WHITESPACE_RE.sub(' ', text[start:offset]).lstrip(),
+            'keyword': text[offset:end],
+            'right': WHITESPACE_RE.sub(' ', text[end:stop]).rstrip()
+        }
+    
+    def advanced_search(self, query, search_type="all", max_results=50, fuzzy=True):
+        """Busca avançada: capítulos e, em seguida, páginas por relevância.
+        
+        Cada página aparece uma vez, com a pontuação BM25 dos termos da
+        consulta; páginas com a frase exata ou o versículo procurado recebem
+        o bônus ``STRUCTURED_MATCH_BOOST`` sobre essa pontuação. Consultas
+        com operadores (``AND``, ``OR``, ``-``, aspas, ``NEAR/k``, parênteses)
+        seguem a linguagem booleana de search_query.py. O tipo ``"regex"``
+        trata a consulta como expressão regular (search_regex.py).
+        
+        Devolve um ``SearchResults``: os trechos só são montados para os
+        resultados que forem lidos. Com ``query_cache``, consultas repetidas
+        (mesma forma normalizada) vêm do cache.
+        """
+        return self.cursor(self.advanced_search_hits(query, search_type, max_results, fuzzy))
+    
+    def advanced_search_hits(self, query, search_type="all", max_results=50, fuzzy=True):
+        """Resultados leves de ``advanced_search`` (``SavedSearch``), sem trechos nem referência ao motor"""
+        if self.query_cache is None or self.content_hash is None:
+            entry = self._advanced_search(query, search_type, max_results, fuzzy)
+        else:
+            # Na expressão regular, maiúsculas e espaços fazem diferença
+            normalized = query if search_type == "regex" else normalize_query(query)
+            key = (self.content_hash, normalized, search_type, max_results, fuzzy)
+            entry = self.query_cache.get(key)
+            if entry is None:
+                entry = self._advanced_search(query, search_type, max_results, fuzzy)
+                # Resultados parciais dependem do tempo disponível: não ficam no cache
+                if not entry[2]:
+                    self.query_cache.put(key, entry)
+        return SavedSearch(self.content_hash, query, *entry)
+    
+    def cursor(self, saved):
+        """``SearchResults`` sobre este motor para os resultados leves de ``saved`` (``SavedSearch``)"""
+        return SearchResults(saved.hits, partial(self._materialize, term_groups=saved.term_groups),
+                             truncated=saved.truncated)
+    
+    def _advanced_search(self, query, search_type, max_results, fuzzy):
+        """(resultados leves, grupos de termos, truncated) da busca avançada"""
+        if search_type == "regex":
+            hits, truncated = self._regex_hits(query, max_results)
+            return tuple(hits), (), truncated
+        results = []
+        boolean = search_type != "verse" and search_query.has_operators(query)
+        
+        if search_type == "chapter" or (search_type == "all" and not boolean):
+            results.extend(self.search_chapter(query))
+        if search_type == "chapter":
+            return tuple(results[:max_results]), (), False
+        
+        self._ensure_index_loaded()
+        exact_match = search_type != "all"
+        if boolean:
+            hits, term_groups = self._boolean_search(query, exact_match, fuzzy, max_results)
+            return tuple(hits), term_groups, False
+        
+        term_groups = self._match_terms(query, exact_match=exact_match, fuzzy=fuzzy)
+        scores, counts = self.word_index.bm25(term_groups, self.doc_lengths)
+        
+        # Resultados estruturados (frase, versículo) trazem o próprio trecho destacado
+        structured = {}
+        if search_type in ["all", "verse"] and re.search(r'\d+[:\.]\d+', query):
+            for result in self.search_verse(query).hits():
+                structured.setdefault(result['page'], result)
+        if search_type in ["all", "phrase"] and len(query.split()) > 1:
+            for result in self.search_phrase(query).hits():
+                structured.setdefault(result['page'], result)
+        
+        if search_type in ["all", "word"]:
+            combined = scores.copy()
+        else:
+            combined = np.zeros_like(scores)
+        for page in structured:
+            # Frase só de stopwords ou versículo sem termos indexados: pontuação mínima
+            combined[page] = max(scores[page], STRUCTURED_MATCH_MIN_SCORE) * STRUCTURED_MATCH_BOOST
+        
+        results.extend(self._rank_pages(combined, counts, structured, max(0, max_results - len(results))))
+        return tuple(results), term_groups, False
+    
+    def _boolean_search(self, query, exact_match, fuzzy, max_results):
+        """Consulta booleana: (resultados, grupos de termos dos critérios positivos).
+        
+        As páginas que satisfazem a consulta vêm ordenadas pelo BM25 dos critérios positivos.
+        """
+        tree = search_query.parse(query)
+        resolver = _QueryResolver(self, tree, exact_match, fuzzy)
+        pages = np.array(search_query.evaluate(tree, resolver), dtype=np.intp)
+        
+        term_groups = [group for leaf in search_query.positive_leaves(tree) for group in resolver.term_groups(leaf)]
+        scores, counts = self.word_index.bm25(term_groups, self.doc_lengths)
+        
+        combined = np.zeros_like(scores)
+        # Páginas aceitas só por exclusão (ex.: "-ritual") ficam com a pontuação mínima
+        combined[pages] = np.maximum(scores[pages], STRUCTURED_MATCH_MIN_SCORE)
+        structured = {page: result for page, result in resolver.structured.items() if combined[page]}
+        for page in structured:
+            combined[page] *= STRUCTURED_MATCH_BOOST
+        
+        return self._rank_pages(combined, counts, structured, max_results), term_groups
+    
+    def _rank_pages(self, combined, counts, structured, limit):
+        """Resultados (sem trecho) das ``limit`` páginas de maior pontuação em ``combined``"""
+        pages = np.flatnonzero(combined)
+        top_pages = heapq.nlargest(limit, pages, key=combined.__getitem__)
+        results = []
+        for page in top_pages:
+            page = int(page)
+            result = structured.get(page, {'type': 'word', 'page': page})
+            results.append(dict(result, score=float(combined[page]), count=int(counts[page])))
+        return results
+
+
+class _QueryResolver:
+    """Folhas de uma consulta booleana (search_query.py) resolvidas no índice de um ``SearchEngine``"""
+    
+    def __init__(self, engine, tree, exact_match, fuzzy):
+        self.engine = engine
+        self.exact_match = exact_match
+        self.fuzzy = fuzzy
+        self.page_count = len(engine.segments)
+        # Frases e proximidade fora de exclusões viram resultados estruturados
+        self.positive = {id(leaf) for leaf in search_query.positive_leaves(tree)}
+        self.structured = {}
+        self._term_groups = {}
+        self._missing = set()
+    
+    def term_groups(self, leaf):
+        """Grupos de termos do índice da folha (os mesmos usados no BM25)"""
+        key = id(leaf)
+        if key not in self._term_groups:
+            if isinstance(leaf, search_query.Term):
+                groups = []
+                for token in dict.fromkeys(search_analyzer.TOKEN_RE.findall(leaf.text)):
+                    token_groups = self.engine._match_terms(token, self.exact_match, self.fuzzy)
+                    if token_groups:
+                        groups.extend(token_groups)
+                    elif not self.exact_match or self.engine.analyzer.analyze_token(token) is not None:
+                        # Palavra que não está no livro: a folha não tem páginas
+                        self._missing.add(key)
+            else:
+                # Frase e proximidade: as palavras exatas, sem os operadores NEAR/k
+                groups = self.engine._match_terms(NEAR_RE.sub(' ', leaf.text), True, False)
+            self._term_groups[key] = groups
+        return self._term_groups[key]
+    
+    def estimate(self, leaf):
+        """Limite superior do número de páginas da folha"""
+        groups = self.term_groups(leaf)
+        if id(leaf) in self._missing:
+            return 0
+        if not groups:
+            # Palavra só de stopwords não restringe; frase sem termos indexados não encontra nada
+            return self.page_count if isinstance(leaf, search_query.Term) else 0
+        word_index = self.engine.word_index
+        return min(sum(word_index.document_frequency(term) for term in group) for group in groups)
+    
+    def pages(self, leaf, candidates):
+        if isinstance(leaf, search_query.Term):
+            groups = self.term_groups(leaf)
+            if id(leaf) in self._missing:
+                return []
+            if not groups:
+                return list(range(1, self.page_count + 1)) if candidates is None else candidates
+            word_index = self.engine.word_index
+            lists = [
+                word_index.term_pages(group[0]) if len(group) == 1 else
+                search_query.union(word_index.term_pages(term) for term in group)
+                for group in groups
+            ]
+            if candidates is not None:
+                lists.append(candidates)
+            # Da lista mais curta para a mais longa
+            lists.sort(key=len)
+            pages = list(lists[0])
+            for other in lists[1:]:
+                if not pages:
+                    break
+                pages = search_query.intersect(pages, other)
+            return pages
+        
+        if isinstance(leaf, search_query.Phrase):
+            results = self.engine.search_phrase(leaf.text, candidates).hits()
+        else:
+            results = self.engine.search_near(leaf.text, candidates).hits()
+        if id(leaf) in self.positive:
+            for result in results:
+                self.structured.setdefault(result['page'], result)
+        return sorted(result['page'] for result in results)
+    
+class FederatedSearch:
+    """Busca em vários livros de uma vez, com um ``SearchEngine`` por livro.
+    
+    Os livros são consultados em paralelo (um pool de threads). As
+    pontuações BM25 de livros diferentes não são comparáveis, então cada
+    livro é normalizado pela sua melhor página (que passa a valer 1), e as
+    listas já ordenadas são intercaladas por um heap (``heapq.merge``). Cada
+    resultado traz o livro (``book``) além da página; o trecho é montado
+    pelo motor do próprio livro, só quando o resultado é lido. Um livro que
+    não pode ser buscado fica de fora, com o erro em ``errors``.
+    """
+    
+    def __init__(self, engines, max_workers=FEDERATED_SEARCH_WORKERS):
+        # Título -> função sem argumentos que devolve o SearchEngine do livro
+        self.engines = dict(engines)
+        self.max_workers = max_workers
+    
+    def _search_book(self, title, query, search_type, max_results, fuzzy):
+        """(resultados normalizados do livro, ``SavedSearch`` do livro)"""
+        saved = self.engines[title]().advanced_search_hits(query, search_type, max_results, fuzzy)
+        best = max((hit['score'] for hit in saved.hits if 'score' in hit), default=0.0)
+        normalized = []
+        for hit in saved.hits:
+            # Capítulos não têm pontuação: ficam no topo do livro
+            score = hit['score'] / best if 'score' in hit and best > 0 else 1.0
+            normalized.append(dict(hit, book=title, score=score, book_score=hit.get('score')))
+        normalized.sort(key=lambda hit: -hit['score'])
+        return normalized, saved
+    
+    def _materialize(self, term_groups, hit):
+        # O motor do livro monta o trecho e mantém book, score e book_score do resultado
+        return self.engines[hit['book']]()._materialize(hit, term_groups[hit['book']])
+    
+    def search(self, query, search_type="all", max_results=50, fuzzy=True):
+        """Os ``max_results`` melhores resultados de todos os livros"""
+        return self.cursor(self.search_hits(query, search_type, max_results, fuzzy))
+    
+    def search_hits(self, query, search_type="all", max_results=50, fuzzy=True):
+        """Resultados leves de ``search`` (``SavedSearch``), sem trechos nem referência aos motores"""
+        if not self.engines:
+            return SavedSearch(tuple(self.engines), query, term_groups={})
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.engines))) as pool:
+            futures = {
+                title: pool.submit(self._search_book, title, query, search_type, max_results, fuzzy)
+                for title in self.engines
+            }
+        
+        ranked = []
+        term_groups = {}
+        truncated = False
+        errors = {}
+        for title, future in futures.items():
+            try:
+                hits, saved = future.result()
+            except Exception as e:
+                # Livro inválido ou ilegível: os demais continuam na busca
+                errors[title] = str(e)
+                continue
+            ranked.append(hits)
+            term_groups[title] = saved.term_groups
+            truncated = truncated or saved.truncated
+        merged = itertools.islice(heapq.merge(*ranked, key=lambda hit: -hit['score']), max_results)
+        return SavedSearch(tuple(self.engines), query, merged, term_groups, truncated, errors)
+    
+    def cursor(self, saved):
+        """``SearchResults`` sobre os motores atuais dos livros para os resultados leves de ``saved``"""
+        return SearchResults(saved.hits, partial(self._materialize, saved.term_groups),
+                             truncated=saved.truncated, errors=saved.errors)
+    
+class BookStateManager:
+    def __init__(self):
+        self.current_position = 0
+        self.total_pages = 0
+        self.loaded = False
+        self.segments = []
+        self._change_listeners = []
+        
+    def load_book(self, analysis_data):
+        self.segments = analysis_data.get('segments', [])
+        self.total_pages = len(self.segments)
+        self.current_position = min(st.session_state.get('current_page', 1), self.total_pages)
+        self.loaded = True
+        return True
+        
+    def navigate_to(self, page_number):
+        if 1 <= page_number <= self.total_pages:
+            self.current_position = page_number
+            self._notify_change()
+            return True
+        return False
+        
+    def _notify_change(self):
+        for listener in self._change_listeners:
+            try:
+                listener(self.current_position)
+            except Exception as e:
+                print(f"Erro no listener: {e}")
+                
+    def get_current_segment(self):
+        if 0 <= self.current_position - 1 < len(self.segments):
+            return self.segments[self.current_position - 1]
+        return None
+    
+    def add_change_listener(self, listener):
+        self._change_listeners.append(listener)
+
+# Léxico dos temas estendidos (política, religião, ...) usado nas análises
+EXTENDED_THEMES = {
+    'política': {
+        'keywords': ['governo', 'presidente', 'eleições', 'democracia', 'ditadura', 'político', 
+                'partido', 'estado', 'lei', 'justiça', 'poder', 'corrupção', 'voto', 'parlamento',
+                'legislativo', 'executivo', 'ministro', 'prefeito', 'vereador', 'senador',
+                'deputado', 'política', 'ideologia', 'partidário', 'coalizão', 'oposição'],
+        'weight': 0.7
+    },
+    'religião': {
+        'keywords': ['deus', 'fé', 'igreja', 'bíblia', 'oração', 'espiritual', 'divino', 'sagrado',
+                'profeta', 'religioso', 'crença', 'culto', 'ritual', 'teologia', 'pecado',
+                'bispo', 'padre', 'pastor', 'templo', 'sinagoga', 'mesquita', 'deus',
+                'jesus', 'cristo', 'allah', 'budismo', 'hinduísmo', 'espiritualidade'],
+        'weight': 0.6
+    },
+    'sexo': {
+        'keywords': ['sexual', 'gênero', 'masculino', 'feminino', 'relação', 'corpo', 'desejo',
+                'intimidade', 'orientação', 'identidade', 'atração', 'reprodução', 'prazer',
+                'sensual', 'erótico', 'afetividade', 'casamento', 'namoro', 'paixão', 'amor',
+                'heterossexual', 'homossexual', 'bissexual', 'transgênero', 'libido'],
+        'weight': 0.5
+    },
+    'cultura': {
+        'keywords': ['arte', 'música', 'literatura', 'tradição', 'costumes', 'sociedade', 'valores',
+                'identidade', 'folclore', 'herança', 'expressão', 'cultural', 'patrimônio',
+                'dança', 'teatro', 'cinema', 'pintura', 'escultura', 'fotografia', 'arquitetura',
+                'festival', 'celebração', 'ritual', 'mitologia', 'história', 'ancestral'],
+        'weight': 0.8
+    }
+}
+
+def analyze_extended_themes(text, extended_themes=EXTENDED_THEMES):
+    text_lower = text.lower()
+    words = re.findall(r'\b\w+\b', text_lower)
+    total_words = len(words)
+    
+    if total_words == 0:
+        return {theme: 0 for theme in extended_themes.keys()}
+    
+    theme_scores = {}
+    
+    for theme, theme_data in extended_themes.items():
+        score = 0
+        keyword_count = 0
+        
+        for keyword in theme_data['keywords']:
+            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
+            count = len(re.findall(pattern, text_lower))
+            
+            if count > 0:
+                word_weight = theme_data['weight']
+                
+                common_word_penalty = 1.0
+                if keyword in ['poder', 'estado', 'lei', 'corpo', 'valor']:
+                    common_word_penalty = 0.6
+                
+                score += (count * word_weight * common_word_penalty)
+                keyword_count += count
+        
+        density = (keyword_count / total_words) * 1000
+        
+        if density > 0:
+            normalized_score = min(100, 20 * math.log1p(density))
+        else:
+            normalized_score = 0
+        
+        diversity_bonus = 1.0
+        if keyword_count > 5:
+            diversity_bonus = 1.2
+        
+        theme_scores[theme] = min(100, normalized_score * diversity_bonus)
+    
+    return theme_scores
+
+CHAPTER_PATTERNS = [
+    r'(capítulo|chapter|cap\.)\s+(\d+|[IVXLCDM]+)[\s:-]*(.*)',
+    r'^(CAPÍTULO|CHAPTER)\s+(\d+|[IVXLCDM]+)[\s:-]*(.*)',
+    r'^(\d+|[IVXLCDM]+)[\s.-]*(.*)',
+    r'^.*\b(capítulo|chapter)\b.*$'
+]
+
+def extract_chapters_advanced(segments):
+    chapters = []
+    current_chapter = None
+    
+    for i, segment in enumerate(segments):
+        text = segment.text.strip()
+        
+        if len(text) > 300:
+            if current_chapter:
+                current_chapter['end_page'] = i
+            continue
+            
+        chapter_detected = False
+        chapter_title = ""
+        chapter_number = ""
+        
+        for pattern in CHAPTER_PATTERNS:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                chapter_detected = True
+                groups = match.groups()
+                
+                if len(groups) >= 2:
+                    chapter_number = groups[1] if groups[1] else str(len(chapters) + 1)
+                    chapter_title = groups[2] if len(groups) > 2 and groups[2] else f"Capítulo {chapter_number}"
+                else:
+                    chapter_number = str(len(chapters) + 1)
+                    chapter_title = text
+                
+                break
+        
+        is_toc = any(word in text.lower() for word in ['sumário', 'índice', 'conteúdo', 'contents'])
+        
+        if chapter_detected and not is_toc:
+            if current_chapter:
+                current_chapter['end_page'] = i
+            
+            current_chapter = {
+                'number': chapter_number,
+                'title': chapter_title,
+                'start_page': i + 1,
+                'end_page': len(segments),
+                'segments': [i + 1]
+            }
+            chapters.append(current_chapter)
+        elif current_chapter and not is_toc:
+            current_chapter['segments'].append(i + 1)
+    
+    return chapters
+
+class SharedBook:
+    """Livro imutável compartilhado por todas as sessões e reruns do processo.
+    
+    Guarda apenas o que é derivado do conteúdo do livro (segmentos, capítulos,
+    motor de busca, temas). O estado de cada leitor (current_page,
+    user_highlights, user_notes, resultados de busca) fica em st.session_state.
+    
+    Carregamento em duas camadas: o resumo (book_analysis, difficulty_map,
+    theme_analysis) está disponível assim que o livro é aberto, e basta para
+    métricas, KPIs, gráfico de dificuldade e navegação. As páginas são lidas
+    sob demanda, e os dados derivados delas (capítulos, temas, índice de
+    busca) vêm do cache de artefatos (precompute.py) ou são calculados em
+    segundo plano por ``warm_up``; até lá, ``peek_derived`` retorna None e a
+    interface mostra o que já estiver pronto.
+    """
+    
+    def __init__(self, book_id, content_hash, analysis_data, artifact_cache=None, query_cache=None):
+        self.book_id = book_id
+        self.content_hash = content_hash
+        self.query_cache = query_cache
+        
+        # Páginas em formato colunar (segment_table.py): sem um dict por página
+        segments = segment_table.SegmentTable.coerce(analysis_data.get('segments', []))
+        
+        # Temas da análise ficam só na forma normalizada (theme_table.py)
+        self._theme_table = analysis_data.get('theme_table')
+        self._theme_analysis = analysis_data.get('theme_analysis') or {}
+        summary = {key: value for key, value in analysis_data.items() if key not in ('theme_analysis', 'theme_table')}
+        
+        self.analysis_data = MappingProxyType({**summary, 'segments': segments})
+        self.segments = segments
+        self.book_analysis = MappingProxyType(analysis_data.get('book_analysis', {}))
+        self.artifact_cache = artifact_cache or precompute.ArtifactCache()
+        self._difficulties = None
+        self._derived = {}
+        # Um lock por dado: o cálculo em segundo plano de um não bloqueia os outros
+        self._derived_locks = {name: threading.Lock() for name in precompute.DERIVED_NAMES}
+        self._search_engine = None
+        self._warm_up_thread = None
+        self._warm_up_lock = threading.Lock()
+        self._lock = threading.RLock()
+    
+    @property
+    def difficulties(self):
+        """Dificuldade por página; vem do resumo (difficulty_map) quando ele cobre todas as páginas"""
+        if self._difficulties is None:
+            difficulty_map = self.analysis_data.get('difficulty_map') or []
+            if len(difficulty_map) == len(self.segments):
+                self._difficulties = np.array([entry.get('difficulty', 0) for entry in difficulty_map], dtype=float)
+            else:
+                self._difficulties = self.segments.column('difficulty')
+        return self._difficulties
+    
+    @property
+    def theme_table(self):
+        """Temas da análise: matriz temas x posições com a página de cada posição"""
+        if self._theme_table is None:
+            with self._lock:
+                if self._theme_table is None:
+                    # Livro lido do JSON: as páginas são resolvidas aqui (no compilado, ao compilar)
+                    self._theme_table = theme_table.ThemeTable.from_theme_analysis(
+                        self._theme_analysis, self.segments.column('position'))
+                    self._theme_analysis = None
+        return self._theme_table
+    
+    def derived_key(self, name):
+        themes_digest = self.theme_table.digest() if name == 'theme_heatmap' else None
+        return precompute.derived_key(name, self.segments.texts_hash(), themes_digest)
+    
+    def _get_derived(self, name, compute):
+        if name not in self._derived:
+            with self._derived_locks[name]:
+                if name not in self._derived:
+                    self._derived[name] = self._load_or_compute(name, compute)
+        return self._derived[name]
+    
+    def _load_or_compute(self, name, compute):
+        # Livros sem identidade (dados passados diretamente) não usam o cache em disco
+        if not self.book_id:
+            return compute()
+        
+        return self.artifact_cache.get_or_compute(self.book_id, name, self.derived_key(name), compute)
+    
+    def peek_derived(self, name):
+        """Dado derivado se já estiver em memória ou no cache em disco, sem calcular nada"""
+        if name in self._derived:
+            return self._derived[name]
+        if not self.book_id or not self.segments.texts_hash_known:
+            return None
+        
+        lock = self._derived_locks[name]
+        if not lock.acquire(blocking=False):
+            # Sendo calculado agora (warm_up)
+            return None
+        try:
+            if name not in self._derived:
+                value = self.artifact_cache.get(self.book_id, name, self.derived_key(name))
+                if value is None:
+                    return None
+                self._derived[name] = value
+        finally:
+            lock.release()
+        return getattr(self, name)
+    
+    def warm_up(self):
+        """Calcula em segundo plano (uma vez por livro) os dados derivados que faltam"""
+        with self._warm_up_lock:
+            if self._warm_up_thread is None:
+                self._warm_up_thread = threading.Thread(
+                    target=self._warm_up, name=f"warm-up-{self.book_id}", daemon=True)
+                self._warm_up_thread.start()
+        return self._warm_up_thread
+    
+    def _warm_up(self):
+        for name in precompute.DERIVED_NAMES:
+            try:
+                getattr(self, name)
+            except Exception as e:
+                print(f"Erro ao pré-calcular {name} de {self.book_id}: {e}")
+    
+    @property
+    def chapters(self):
+        return tuple(self._get_derived('chapters', lambda: precompute.compute_chapters(self.segments)))
+    
+    @property
+    def search_index(self):
+        return self._get_derived('search_index',
+                                 lambda: precompute.compute_search_index(self.segments, self.chapters))
+    
+    @property
+    def page_themes(self):
+        """(nomes dos temas estendidos, matriz temas x páginas)"""
+        return self._get_derived('page_themes', lambda: precompute.compute_page_themes(self.segments))
+    
+    @property
+    def theme_heatmap(self):
+        """(nomes dos temas, matriz temas x páginas) do mapa de calor da visão geral"""
+        return self._get_derived('theme_heatmap', lambda: precompute.compute_theme_heatmap(
+            self.theme_table, self.page_themes))
+    
+    @property
+    def book_themes(self):
+        """Temas estendidos do livro inteiro"""
+        return self._get_derived('book_themes', lambda: precompute.compute_book_themes(self.segments))
+    
+    @property
+    def search_engine(self):
+        if self._search_engine is None:
+            with self._lock:
+                if self._search_engine is None:
+                    if 'search_index' not in self._derived:
+                        with st.spinner("📚 Carregando índice de busca..."):
+                            index = self.search_index
+                    else:
+                        index = self.search_index
+                    self._search_engine = SearchEngine(self.segments, self.chapters, index=index,
+                                                       content_hash=self.content_hash, query_cache=self.query_cache)
+        return self._search_engine
+
+class SharedBookCache:
+    """Registro de livros do processo, indexado por (identidade do livro, hash do conteúdo).
+    
+    Mantém no máximo ``max_resident`` livros em memória; ao carregar um novo
+    livro, o menos recentemente lido é descartado (LRU). Sessões que ainda
+    estejam usando um livro descartado continuam com sua referência até o
+    fim do rerun. Os livros compartilham um ``QueryCache`` de resultados de busca.
+    """
+    
+    def __init__(self, max_resident=MAX_RESIDENT_BOOKS):
+        self.max_resident = max(1, max_resident)
+        self._books = OrderedDict()
+        # Resultados de busca de todos os livros do processo
+        self.query_cache = QueryCache()
+        # Livros rejeitados pela validação, para não revalidá-los a cada rerun
+        self._errors = {}
+        self._lock = threading.Lock()
+        
+    def get(self, book_id, content_hash):
+        key = (book_id, content_hash)
+        with self._lock:
+            book = self._books.get(key)
+            if book is not None:
+                self._books.move_to_end(key)
+            return book
+        
+    def get_or_create(self, book_id, content_hash, analysis_data):
+        key = (book_id, content_hash)
+        with self._lock:
+            book = self._books.get(key)
+            if book is None:
+                # Versões antigas do mesmo livro não serão mais lidas nem buscadas
+                for old_key in [k for k in self._books if k[0] == book_id]:
+                    del self._books[old_key]
+                    self.query_cache.discard(old_key[1])
+                book = SharedBook(book_id, content_hash, analysis_data, query_cache=self.query_cache)
+                self._books[key] = book
+                while len(self._books) > self.max_resident:
+                    self._books.popitem(last=False)
+            self._books.move_to_end(key)
+            return book
+    
+    def get_error(self, book_id, content_hash):
+        """Erro de formato registrado para este conteúdo do livro, se houver"""
+        with self._lock:
+            return self._errors.get((book_id, content_hash))
+    
+    def record_error(self, book_id, content_hash, error):
+        with self._lock:
+            for old_key in [k for k in self._errors if k[0] == book_id]:
+                del self._errors[old_key]
+            self._errors[(book_id, content_hash)] = error
+    
+    def resident_books(self):
+        with self._lock:
+            return [book_id for book_id, _ in self._books]
+
+class LibraryIndexCache:
+    """Motores de busca da busca na biblioteca, sem abrir os livros no ``SharedBookCache``.
+    
+    Cada motor tem só o que a busca usa: as páginas mapeadas do livro
+    compilado (ou lidas sob demanda do JSON), os capítulos e o índice de
+    busca mapeado do cache de artefatos (precompute.py). Buscar em todos os
+    livros não tira da memória os livros que as sessões estão lendo. Guarda
+    no máximo ``max_entries`` motores (LRU); a versão nova de um livro
+    substitui a anterior. Não usa o Streamlit: é chamado pelas threads da
+    ``FederatedSearch``.
+    """
+    
+    def __init__(self, query_cache=None, max_entries=MAX_LIBRARY_INDEXES, artifact_cache=None):
+        self.max_entries = max(1, max_entries)
+        self.query_cache = query_cache
+        self.artifact_cache = artifact_cache or precompute.ArtifactCache()
+        self._engines = OrderedDict()
+        self._lock = threading.Lock()
+        # As versões do código de análise (chaves dos artefatos) leem o
+        # código-fonte com inspect/ast, que falha em threads concorrentes:
+        # calculadas aqui, nas threads da busca já estão em cache
+        precompute.analysis_versions()
+    
+    def engine(self, source_path):
+        """``SearchEngine`` do livro; ``book_schema.BookFormatError`` se os dados forem inválidos"""
+        key = (book_store.book_id_from_path(source_path), book_store.content_hash(source_path))
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+        # Fora do lock: os livros da mesma busca são abertos em paralelo
+        engine = self._open(source_path, *key)
+        with self._lock:
+            engine = self._engines.setdefault(key, engine)
+            for old_key in [k for k in self._engines if k[0] == key[0] and k != key]:
+                del self._engines[old_key]
+            self._engines.move_to_end(key)
+            while len(self._engines) > self.max_entries:
+                self._engines.popitem(last=False)
+        return engine
+    
+    def _open(self, source_path, book_id, content_hash):
+        book = book_store.open_book(source_path)
+        if book is not None:
+            segments = segment_table.SegmentTable.from_compiled(book)
+        else:
+            segments = segment_table.SegmentTable.coerce(segment_loader.open_json_book(source_path).segments)
+        
+        def derived(name, compute):
+            key = precompute.derived_key(name, segments.texts_hash())
+            return self.artifact_cache.get_or_compute(book_id, name, key, compute)
+        
+        chapters = tuple(derived('chapters', lambda: precompute.compute_chapters(segments)))
+        index = derived('search_index', lambda: precompute.compute_search_index(segments, chapters))
+        return SearchEngine(segments, chapters, index=index, content_hash=content_hash,
+                            query_cache=self.query_cache)
+    
+    def resident_books(self):
+        with self._lock:
+            return [book_id for book_id, _ in self._engines]
+
+@st.cache_resource(show_spinner=False)
+def get_book_cache():
+    """Cache de livros único por processo (sobrevive a reruns e é comum a todas as sessões)"""
+    return SharedBookCache()
+
+@st.cache_resource(show_spinner=False)
+def get_library_index_cache():
+    """Motores da busca na biblioteca, únicos por processo (resultados no mesmo ``QueryCache`` dos livros)"""
+    return LibraryIndexCache(get_book_cache().query_cache)
+
+# Estado de leitura que pertence a um livro específico (guardado ao trocar de livro)
+BOOK_SESSION_KEYS = (
+    'current_page', 'pending_page', 'last_page', 'user_highlights', 'user_notes', 'search_results', 'search_results_page',
+    'current_search_query', 'concordance_key', 'concordance_page',
+    'ia_analysis_result', 'ia_prompt_used', 'show_ia_analysis',
+    'selected_text_for_analysis', 'book_cover_shown'
+)
+# Widgets que dependem do livro: apenas descartados (o Streamlit não aceita restaurá-los)
+BOOK_WIDGET_KEYS = ('page_selector_optimized',)
+
+def switch_session_book(book_id):
+    """Torna ``book_id`` o livro ativo da sessão, preservando o estado de leitura do anterior"""
+    previous_book = st.session_state.get('active_book_id')
+    if previous_book == book_id:
+        return
+    
+    saved_sessions = st.session_state.setdefault('book_sessions', {})
+    if previous_book is not None:
+        saved_sessions[previous_book] = {
+            key: st.session_state[key] for key in BOOK_SESSION_KEYS if key in st.session_state
+        }
+    
+    for key in BOOK_SESSION_KEYS + BOOK_WIDGET_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
+    for key, value in saved_sessions.get(book_id, {}).items():
+        st.session_state[key] = value
+    st.session_state.active_book_id = book_id
+
+def _json_default(obj):
+    # Segmentos ficam em uma SegmentTable; cada página volta ao formato original
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return list(obj)
+
+def safe_json_dump(data):
+    try:
+        return json.dumps(data, ensure_ascii=False, indent=2, default=_json_default)
+    except Exception:
+        def escape_str(obj):
+            if isinstance(obj, str):
+                return (obj.replace("\\", "\\\\")
+                         .replace('"', '\\"')
+                         .replace('\n', '\\n')
+                         .replace('\r', '\\r')
+                         .replace('\t', '\\t'))
+            elif isinstance(obj, dict):
+                return {k: escape_str(v) for k, v in obj.items()}
+            elif isinstance(obj, list):
+                return [escape_str(i) for i in obj]
+            else:
+                return obj
+        return json.dumps(escape_str(data), ensure_ascii=False, indent=2, default=_json_default)
+
+def render_book_opener():
+    st.title("📖 FLUX-ON Quantum Reader")
+    st.markdown("""
+    <div style='text-align: center; padding: 3rem; background: rgba(45, 45, 65, 0.8); border-radius: 20px; border: 3px solid #9d4edd;'>
+        <h1 style='color: #e0aaff; margin-bottom: 2rem;'>Bem-vindo ao Leitor Quântico</h1>
+        <p style='color: #c77dff; font-size: 1.2rem; margin-bottom: 3rem;'>
+            Sistema avançado de análise e leitura multidimensional
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown("""
+        <div style='text-align: center; margin: 2rem 0;'>
+            <h3 style='color: #e0aaff;'>📚 Carregar Livro para Análise</h3>
+            <p style='color: #c77dff;'>Selecione uma das opções abaixo para começar</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("📊 Carregar Análise Existente", use_container_width=True, key="load_existing"):
+            st.session_state.book_loaded = True
+        
+        st.button("🆕 Analisar Novo Livro (Em Breve)", use_container_width=True, disabled=True)
+        
+        st.markdown("---")
+        st.info("""
+        **💡 Dica:** Use a opção 'Carregar Análise Existente' para visualizar 
+        relatórios já processados pelo sistema FLUX-ON.
+        """)
+
+def render_library_opener(catalog):
+    """Tela inicial da biblioteca: escolha de um dos livros disponíveis"""
+    st.title("📚 FLUX-ON Biblioteca Quântica")
+    st.markdown("""
+    <div style='text-align: center; padding: 3rem; background: rgba(45, 45, 65, 0.8); border-radius: 20px; border: 3px solid #9d4edd;'>
+        <h1 style='color: #e0aaff; margin-bottom: 2rem;'>Bem-vindo à Biblioteca Quântica</h1>
+        <p style='color: #c77dff; font-size: 1.2rem; margin-bottom: 3rem;'>
+            Todos os livros analisados pelo sistema FLUX-ON em um só lugar
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if not catalog:
+        st.warning("📭 Nenhum livro encontrado no diretório 'livros/'.")
+        return
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown("""
+        <div style='text-align: center; margin: 2rem 0;'>
+            <h3 style='color: #e0aaff;'>📖 Escolha um livro</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        for i, title in enumerate(catalog):
+            if st.button(f"📘 {title}", use_container_width=True, key=f"library_open_{i}"):
+                st.session_state.selected_book = title
+                st.session_state.book_loaded = True
+                st.rerun()
+    
+    render_library_search(catalog)
+
+def library_search(catalog):
+    """Busca federada em todos os livros do catálogo (título -> caminho do JSON)"""
+    index_cache = get_library_index_cache()
+    return FederatedSearch({
+        title: partial(index_cache.engine, source_path)
+        for title, source_path in catalog.items()
+    })
+
+def render_results_pager(results, state_key):
+    """Resultados da página atual da listagem (``RESULTS_PER_PAGE`` por vez), com navegação.
+    
+    A página atual fica em ``st.session_state[state_key]``; só os
+    resultados devolvidos têm o trecho montado.
+    """
+    page_count = results.page_count()
+    current = min(max(1, st.session_state.get(state_key, 1)), page_count)
+    if page_count > 1:
+        first = (current - 1) * RESULTS_PER_PAGE + 1
+        last = min(current * RESULTS_PER_PAGE, len(results))
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("⬅️ Anteriores", key=f"{state_key}_prev", disabled=current == 1, use_container_width=True):
+                st.session_state[state_key] = current - 1
+                st.rerun()
+        with col2:
+            st.markdown(f"Resultados {first}–{last} de {len(results)} · página {current} de {page_count}")
+        with col3:
+            if st.button("Próximos ➡️", key=f"{state_key}_next", disabled=current == page_count, use_container_width=True):
+                st.session_state[state_key] = current + 1
+                st.rerun()
+    return results.page(current)
+
+def render_library_search(catalog):
+    """Busca em todos os livros, com atalho para a página de cada resultado"""
+    st.markdown("---")
+    st.header("🔎 Buscar em toda a biblioteca")
+    query = st.text_input(
+        "Digite sua busca:",
+        placeholder="Palavra, frase ou consulta com AND / OR / -exclusão...",
+        key="library_search_input"
+    )
+    if st.button("🔎 Buscar nos livros", key="library_search_button") and query:
+        with st.spinner("Buscando em todos os livros..."):
+            # Só os resultados leves: os trechos são montados pelos motores do cache a cada renderização
+            st.session_state.library_search_results = library_search(catalog).search_hits(query)
+            st.session_state.library_search_page = 1
+    
+    saved = st.session_state.get('library_search_results')
+    if not isinstance(saved, SavedSearch):
+        return
+    for title, error in saved.errors.items():
+        st.warning(f"⚠️ Não foi possível buscar em '{title}': {error}")
+    if not saved:
+        st.info("Nenhum resultado encontrado.")
+        return
+    
+    results = library_search(catalog).cursor(saved)
+    st.markdown(f"**📊 {len(results)} resultado(s) para '{saved.query}'**")
+    for i, result in enumerate(render_results_pager(results, 'library_search_page')):
+        page = result.get('page', result.get('start_page'))
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            st.markdown(f"**📘 {result['book']}** — Página {page} · relevância {result['score']:.2f}")
+            if 'excerpt' in result:
+                st.markdown(result['excerpt'], unsafe_allow_html=True)
+            elif result['type'] == 'chapter':
+                st.markdown(f"Capítulo {result['number']}: {result['title']}")
+        with col2:
+            if st.button("Abrir →", key=f"library_hit_{i}", use_container_width=True):
+                st.session_state.selected_book = result['book']
+                st.session_state.book_loaded = True
+                # Aplicada por render_book depois de restaurar o estado do livro
+                st.session_state.library_target = (book_store.book_id_from_path(catalog[result['book']]), page)
+                st.rerun()
+
+class QuantumBookReader:
+    def __init__(self, analysis_data=None, shared_book=None):
+        if shared_book is None:
+            shared_book = SharedBook(None, None, analysis_data or {})
+        
+        self.shared_book = shared_book
+        self.analysis_data = shared_book.analysis_data
+        self.segments = shared_book.segments
+        
+        if 'current_page' not in st.session_state:
+            st.session_state.current_page = 1
+            
+        # CORREÇÃO: Atualizar total_pages do nav_system
+        self.nav_system = NavigationSystem(len(self.segments))
+        self.state_manager = BookStateManager()
+        self.render_controller = RenderController()
+        # (SavedSearch da sessão, SearchResults montado a partir dele) desta renderização
+        self._search_cursor = None
+        
+        self.state_manager.add_change_listener(self._on_page_change)
+        
+        if self.segments:
+            self.state_manager.load_book(self.analysis_data)
+            
+        self.ia_prompts = self._initialize_prompts()
+        self._processed_text_cache = {}
+        
+        
+        self.api_config = {
+            'configured': False,
+            'api_key': '',
+            'api_url': 'https://api.deepseek.com/v1/chat/completions',
+            'model': 'deepseek-chat'
+        }
+        
+        self.extended_themes = EXTENDED_THEMES
+        
+        self._initialize_session_state()
+        self.book_analysis = shared_book.book_analysis
+    
+    # Capítulos e índice de busca são construídos uma vez por processo (SharedBook)
+    @property
+    def chapters(self):
+        return self.shared_book.chapters
+    
+    @property
+    def search_engine(self):
+        return self.shared_book.search_engine
+    
+    # Resultados de busca são estado da sessão, não do livro compartilhado: a
+    # sessão guarda só os resultados leves (SavedSearch), e os trechos são
+    # montados pelo motor do livro no cache
+    @property
+    def search_results(self):
+        saved = st.session_state.get('search_results')
+        if not isinstance(saved, SavedSearch) or saved.source != self.search_engine.content_hash:
+            # Sem busca, ou de outra versão do livro
+            return SearchResults()
+        if self._search_cursor is None or self._search_cursor[0] is not saved:
+            # Um cursor por renderização: os trechos montados valem para a barra lateral e a listagem
+            self._search_cursor = (saved, self.search_engine.cursor(saved))
+        return self._search_cursor[1]
+    
+    @search_results.setter
+    def search_results(self, saved):
+        if not isinstance(saved, SavedSearch):
+            saved = SavedSearch(self.search_engine.content_hash, hits=saved)
+        st.session_state.search_results = saved
+        st.session_state.search_results_page = 1
+    
+    @property
+    def current_search_query(self):
+        return st.session_state.get('current_search_query', "")
+    
+    @current_search_query.setter
+    def current_search_query(self, query):
+        st.session_state.current_search_query = query
+    
+    def _initialize_session_state(self):
+        # CORREÇÃO: Garantir que current_page está inicializado
+        if 'current_page' not in st.session_state:
+            st.session_state.current_page = 1
+            
+        if 'user_highlights' not in st.session_state:
+            st.session_state.user_highlights = {}
+            
+        if 'user_notes' not in st.session_state:
+            st.session_state.user_notes = {}
+            
+        if 'show_ia_analysis' not in st.session_state:
+            st.session_state.show_ia_analysis = False
+            
+        if 'selected_text_for_analysis' not in st.session_state:
+            st.session_state.selected_text_for_analysis = ""
+            
+        if 'ia_analysis_result' not in st.session_state:
+            st.session_state.ia_analysis_result = None
+            
+        if 'ia_prompt_used' not in st.session_state:
+            st.session_state.ia_prompt_used = None
+            
+        if 'book_loaded' not in st.session_state:
+            st.session_state.book_loaded = False
+            
+        if 'book_cover_shown' not in st.session_state:
+            st.session_state.book_cover_shown = False
+            
+        if 'api_configured' not in st.session_state:
+            st.session_state.api_configured = False
+            
+        if 'deepseek_response' not in st.session_state:
+            st.session_state.deepseek_response = None
+            
+        if 'local_analysis' not in st.session_state:
+            st.session_state.local_analysis = None
+            
+        if 'copied_prompt' not in st.session_state:
+            st.session_state.copied_prompt = None
+        
+        if 'page_change_confirmed' not in st.session_state:
+            st.session_state.page_change_confirmed = False
+    
+    def _on_page_change(self, new_page):
+        st.session_state.current_page = new_page
+        if 'ia_analysis_result' in st.session_state:
+            st.session_state.ia_analysis_result = None
+    
+    def load_analysis_data(self, analysis_data):
+        self.shared_book = SharedBook(None, None, analysis_data)
+        self.analysis_data = self.shared_book.analysis_data
+        self.segments = self.shared_book.segments
+        self.state_manager.load_book(self.analysis_data)
+        self.nav_system.update_total_pages(len(self.segments))
+        self.book_analysis = self.shared_book.book_analysis
+        st.session_state.book_loaded = True
+        
+    def render_advanced_search_sidebar(self):
+        """Sidebar com busca avançada e filtros"""
+        with st.sidebar:
+            st.markdown("---")
+            st.header("🔍 Busca Avançada")
+            
+            # Campo de busca principal
+            search_query = st.text_input(
+                "O que você está procurando?",
+                placeholder="Digite palavra, frase, capítulo ou versículo...",
+                key="main_search_input"
+            )
+            
+            # Filtros avançados
+            with st.expander("⚙️ Filtros Avançados", expanded=False):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    search_type = st.selectbox(
+                        "Tipo de busca:",
+                        ["Todos", "Palavras", "Frases", "Capítulos", "Versículos"],
+                        key="search_type_filter"
+                    )
+                    
+                    case_sensitive = st.checkbox("Diferenciar maiúsc/minúsc", False)
+                
+                with col2:
+                    min_word_length = st.slider("Tamanho mínimo palavra:", 3, 10, 4)
+                    max_results = st.slider("Máx. resultados:", 10, 200, 50)
+            
+            # Botões de ação
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.button("🔎 Buscar", use_container_width=True) and search_query:
+                    self.perform_search(search_query, search_type, case_sensitive, max_results)
+            
+            with col2:
+                if st.button("🧹 Limpar", use_container_width=True):
+                    self.search_results = []
+                    self.current_search_query = ""
+            
+            # Resultados rápidos na sidebar
+            if self.search_results:
+                st.markdown("---")
+                st.subheader("📋 Resultados Encontrados")
+                
+                for i, result in enumerate(self.search_results[:3]):
+                    emoji = "📖" if result['type'] == 'chapter' else "📜" if result['type'] == 'verse' else "📄"
+                    st.info(f"{emoji} {self._format_search_result(result)}")
+                    
+                    if st.button("Ir →", key=f"sidebar_goto_{i}", use_container_width=True):
+                        st.session_state.current_page = result.get('page', result.get('start_page'))
+                        st.rerun()
+                
+                if len(self.search_results) > 3:
+                    st.info(f"📊 ... e mais {len(self.search_results) - 3} resultados")
+                    
+                    if st.button("Ver todos os resultados", use_container_width=True):
+                        st.session_state.current_menu = "🔍 Resultados Busca"
+                        st.rerun()
+
+    def _format_search_result(self, result):
+        """Formata resultado para exibição compacta"""
+        if result['type'] == 'chapter':
+            return f"Capítulo {result['number']}: {result['title']}"
+        elif result['type'] == 'verse':
+            return f"Versículo {result['chapter']}:{result['verse']}"
+        elif result['type'] == 'word':
+            return f"Palavra: {result.get('matched_term', '')} ({result['count']}x)"
+        elif result['type'] == 'phrase':
+            return "Frase encontrada"
+        elif result['type'] == 'near':
+            return f"Proximidade ({result['count']}x)"
+        elif result['type'] == 'regex':
+            return f"Expressão regular ({result['count']}x)"
+        return "Resultado"
+    
+    @st.cache_data(show_spinner=False, max_entries=100)
+    def _process_text_highlights_cached(_self, text, keywords, entities, page_highlights):
+        highlighted_text = text
+        
+        for highlight_id, highlight_data in page_highlights.items():
+            highlighted_text = highlighted_text.replace(
+                highlight_data['text'],
+                f'<span class="user-highlight" title="Destacado pelo usuário">{highlight_data["text"]}</span>'
+            )
+        
+        for entity, label in entities[:10]:
+            if entity not in highlighted_text:
+                highlighted_text = re.sub(
+                    re.escape(entity),
+                    f'<span class="highlight-important" title="{label}">{entity}</span>',
+                    highlighted_text,
+                    flags=re.IGNORECASE
+                )
+        
+        for keyword in keywords[:15]:
+            if keyword not in highlighted_text:
+                highlighted_text = re.sub(
+                    f'\\b{re.escape(keyword)}\\b',
+                    f'<span class="highlight">{keyword}</span>',
+                    highlighted_text,
+                    flags=re.IGNORECASE
+                )
+        
+        return highlighted_text
+    
+    def _generate_text_analysis_prompt(self, prompt_type, text, segment=None):
+        """Gera prompt contextualizado baseado no tipo de análise"""
+        book_name = self.analysis_data.get('book_name', 'este livro')
+        current_page = st.session_state.current_page
+        current_chapter = self._get_current_chapter()
+        
+        chapter_info = f"Capítulo {current_chapter['number']}: {current_chapter['title']}" if current_chapter else "Contexto geral"
+        
+        prompts = {
+            'page_summary': f"""Gere um resumo detalhado da página {current_page} do livro "{book_name}".
+    Contexto: {chapter_info}
+    Texto: {text[:2000]}
+    Inclua os principais pontos, ideias-chave e como esta página se conecta com o conteúdo geral do livro.""",
+            
+            'analysis': f"""Analise profundamente este texto considerando:
+    1. Contexto histórico e significado filosófico
+    2. Metáforas, simbolismos e linguagem figurada  
+    3. Relações com temas maiores da obra
+    4. Implicações científicas, filosóficas ou sociais
+    5. Conexões com outros conceitos apresentados no livro
+
+    Contexto: {chapter_info}
+    Livro: {book_name}
+    Texto para análise: {text[:2000]}""",
+            
+            'explain_concepts': f"""Explique os conceitos complexos presentes no texto:
+    Contexto: {chapter_info}
+    Livro: {book_name}
+    Texto: {text[:2000]}
+    Forneça definições claras, exemplos práticos e relação com o contexto do livro.""",
+            
+            'chapter_context': f"""Considerando que este texto faz parte do {chapter_info} do livro "{book_name}",
+    analise como este trecho se relaciona com:
+    1. O contexto geral do capítulo
+    2. A estrutura narrativa do livro  
+    3. Os temas principais da obra
+    4. O desenvolvimento de ideias ao longo do livro
+
+    Trecho para análise: {text[:2000]}"""
+        }
+        
+        return prompts.get(prompt_type, f"Analise o seguinte texto: {text[:2000]}")
+    
+    def _format_text_for_display(self, text):
+        if not text:
+            return text
+            
+        text = re.sub(r'([.!?])([A-Za-z])', r'\1 \2', text)
+        text = re.sub(r'([,:;])([A-Za-z])', r'\1 \2', text)
+        
+        chapter_patterns = [
+            r'(?i)^(capítulo|chapter|cap\.)\s+(\d+|[IVXLCDM]+)[\s:-]*(.*)$',
+            r'^(CAPÍTULO|CHAPTER)\s+(\d+|[IVXLCDM]+)[\s:-]*(.*)$',
+            r'^(\d+|[IVXLCDM]+)[\s.-]+\s*(.*)$'
+        ]
+        
+        lines = text.split('\n')
+        formatted_lines = []
+        
+        for line in lines:
+            line_formatted = line
+            for pattern in chapter_patterns:
+                match = re.match(pattern, line.strip())
+                if match:
+                    groups = match.groups()
+                    if len(groups) >= 3 and groups[2]:
+                        line_formatted = f'<h3 class="chapter-title">{groups[0]} {groups[1]}: {groups[2]}</h3>'
+                    elif len(groups) >= 2:
+                        line_formatted = f'<h3 class="chapter-title">{groups[0]} {groups[1]}</h3>'
+                    break
+            formatted_lines.append(line_formatted)
+        
+        text = '\n'.join(formatted_lines)
+        
+        paragraphs = text.split('\n\n')
+        if len(paragraphs) > 1:
+            formatted_paragraphs = []
+            for paragraph in paragraphs:
+                if paragraph.strip():
+                    if len(paragraph.strip()) < 100 and not re.search(r'[.!?]$', paragraph):
+                        formatted_paragraphs.append(f'<p class="short-paragraph">{paragraph.strip()}</p>')
+                    else:
+                        paragraph_text = paragraph.strip()
+                        formatted_paragraphs.append(f'<p>{paragraph_text}</p>')
+            text = '\n\n'.join(formatted_paragraphs)
+        else:
+            text = f'<p>{text}</p>'
+        
+        text = re.sub(r'\s+', ' ', text)
+        
+        return text
+    
+    def render_search_interface(self):
+        """Renderiza a interface de busca avançada"""
+        st.sidebar.markdown("---")
+        st.sidebar.header("🔍 Busca Avançada")
+        
+        # Campo de busca
+        search_query = st.sidebar.text_input(
+            "Digite sua busca:",
+            placeholder="Palavra, frase, capítulo ou versículo...",
+            help='Operadores: deus AND (fé OR igreja) -ritual "caos do passado"; '
+                 'proximidade: caos NEAR/5 ordem (até 5 palavras de distância); '
+                 'no tipo "Expressão regular": cap[ií]tulo \\d+, (?i) ignora maiúsculas',
+            key="search_input"
+        )
+        
+        # Tipo de busca
+        search_type = st.sidebar.selectbox(
+            "Tipo de busca:",
+            ["Todos", "Palavras", "Frases", "Capítulos", "Versículos", "Expressão regular"],
+            key="search_type"
+        )
+        fuzzy = st.sidebar.checkbox(
+            "Tolerar erros de digitação",
+            value=True,
+            help="Palavras sem resultado buscam as mais parecidas (até 2 letras de diferença)",
+            key="search_fuzzy"
+        )
+        
+        # Botão de busca
+        if st.sidebar.button("🔎 Buscar", use_container_width=True) and search_query:
+            with st.spinner("Buscando..."):
+                search_type_map = {
+                    "Todos": "all",
+                    "Palavras": "word", 
+                    "Frases": "phrase",
+                    "Capítulos": "chapter",
+                    "Versículos": "verse",
+                    "Expressão regular": "regex"
+                }
+                
+                self.current_search_query = search_query
+                try:
+                    self.search_results = self.search_engine.advanced_search_hits(
+                        search_query, 
+                        search_type_map[search_type],
+                        fuzzy=fuzzy
+                    )
+                except search_regex.PatternError as e:
+                    self.search_results = []
+                    st.sidebar.error(f"⚠️ {e}")
+        
+        if self.search_results.truncated:
+            st.sidebar.warning("⏱️ Busca interrompida pelo limite de tempo ou de ocorrências: resultados parciais.")
+        
+        # Exibir resultados se houver
+        if self.search_results:
+            st.sidebar.markdown(f"**📊 {len(self.search_results)} resultado(s) encontrado(s)**")
+            
+            for i, result in enumerate(self.search_results[:5]):  # Mostrar primeiros 5
+                result_type = result['type']
+                if result_type == 'chapter':
+                    st.sidebar.info(f"📖 Capítulo {result['number']}: {result['title']} (páginas {result['start_page']}-{result['end_page']})")
+                elif result_type == 'verse':
+                    st.sidebar.info(f"📜 {result['chapter']}:{result['verse']} - Página {result['page']}")
+                else:
+                    st.sidebar.info(f"📄 Página {result['page']} - {result.get('count', 1)} ocorrência(s)")
+                
+                if st.sidebar.button("Ir para", key=f"goto_{i}", use_container_width=True):
+                    st.session_state.current_page = result.get('page', result.get('start_page'))
+                    st.rerun()
+            
+            if len(self.search_results) > 5:
+                st.sidebar.info(f"📋 ... e mais {len(self.search_results) - 5} resultados")
+    
+    def render_search_results_page(self):
+        """Página dedicada aos resultados de busca"""
+        if not self.search_results:
+            return
+        
+        st.title(f"🔍 Resultados da busca: '{self.current_search_query}'")
+        st.markdown(f"**📊 {len(self.search_results)} resultado(s) encontrado(s)**")
+        
+        # Agrupar resultados por página (capítulos pela página inicial); trechos só da página da listagem
+        results_by_page = {}
+        for result in render_results_pager(self.search_results, 'search_results_page'):
+            page = result.get('page', result.get('start_page'))
+            if page not in results_by_page:
+                results_by_page[page] = []
+            results_by_page[page].append(result)
+        
+        # Exibir resultados na ordem de relevância
+        for page, page_results in results_by_page.items():
+            with st.expander(f"📄 Página {page} - {len(page_results)} resultado(s)", expanded=False):
+                for result in page_results:
+                    if result['type'] == 'word':
+                        st.markdown(f"**Palavra:** {result.get('matched_term', self.current_search_query)}")
+                        st.markdown(f"**Ocorrências:** {result['count']}")
+                    elif result['type'] == 'phrase':
+                        st.markdown("**Frase encontrada:**")
+                    elif result['type'] == 'near':
+                        st.markdown(f"**Termos próximos:** {result['count']} ocorrência(s)")
+                    elif result['type'] == 'regex':
+                        st.markdown(f"**Ocorrências da expressão:** {result['count']}")
+                    elif result['type'] == 'verse':
+                        st.markdown(f"**Versículo:** {result['chapter']}:{result['verse']}")
+                    elif result['type'] == 'chapter':
+                        st.markdown(f"**Capítulo {result['number']}:** {result['title']} (páginas {result['start_page']}-{result['end_page']})")
+                    
+                    if 'score' in result:
+                        st.markdown(f"**Relevância:** {result['score']:.2f}")
+                    
+                    # Exibir trecho
+                    if 'excerpt' in result:
+                        st.markdown(f"**Trecho:** {result['excerpt']}", unsafe_allow_html=True)
+                    
+                    # Botão para ir para a página
+                    if st.button("Ir para esta página", key=f"result_goto_{page}_{result['type']}"):
+                        st.session_state.current_page = page
+                        st.rerun()
+                    
+                    st.markdown("---")
+
+    def render_concordance_page(self):
+        """Concordância (KWIC): todas as ocorrências de uma palavra, com o contexto alinhado"""
+        st.title("📑 Concordância")
+        
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            word = st.text_input("Palavra:", placeholder="Ex: caos", key="concordance_word")
+        with col2:
+            context_words = st.slider("Palavras de contexto:", 3, 15, CONCORDANCE_CONTEXT_WORDS,
+                                      key="concordance_context")
+        with col3:
+            variations = st.checkbox("Variações", key="concordance_variations",
+                                     help="Inclui as palavras que contêm o trecho digitado")
+        
+        if not word.strip():
+            st.info("Digite uma palavra para listar todas as suas ocorrências no livro.")
+            return
+        
+        key = (word.strip(), context_words, variations)
+        if st.session_state.get('concordance_key') != key:
+            st.session_state.concordance_key = key
+            st.session_state.concordance_page = 1
+        
+        # Refeita a cada renderização (só consulta o índice): na sessão, o
+        # SearchResults prenderia o motor do livro na memória
+        lines = self.search_engine.concordance(word.strip(), exact_match=not variations, context_words=context_words)
+        if not lines:
+            st.info("Nenhuma ocorrência encontrada.")
+            return
+        
+        st.markdown(f"**📊 {len(lines)} ocorrência(s)**")
+        rows = ''.join(
+            CONCORDANCE_ROW.format(page=line['page'], left=html.escape(line['left']),
+                                   keyword=html.escape(line['keyword']), right=html.escape(line['right']))
+            for line in render_results_pager(lines, 'concordance_page')
+        )
+        st.markdown(f'<table style="width: 100%;">{rows}</table>', unsafe_allow_html=True)
+
+    def _render_interactive_text(self, segment):
+        raw_text = segment.text
+        
+        if not raw_text:
+            st.warning("📝 Conteúdo não disponível para esta página")
+            return
+        
+        formatted_text = self._format_text_for_display(raw_text)
+        
+        keywords = segment.keywords[:8]
+        entities = segment.entities[:5]
+        
+        page_highlights = {}
+        if (st.session_state.current_page in st.session_state.user_highlights and 
+            st.session_state.user_highlights[st.session_state.current_page]):
+            page_highlights = st.session_state.user_highlights[st.session_state.current_page]
+        
+        highlighted_text = self._process_text_highlights_cached(
+            formatted_text, keywords, entities, page_highlights
+        )
+        
+        st.markdown("""
+        <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;'>
+            <h2>📖 Conteúdo da Página</h2>
+            <div style='color: #c77dff; font-size: 1rem;'>
+                🎨 <strong>Destacados:</strong> 
+                <span style='background: #9d4edd40; padding: 3px 8px; border-radius: 5px; margin: 0 3px;'>Palavras-chave</span>
+                <span style='background: #ff6b6b40; padding: 3px 8px; border-radius: 5px; margin: 0 3px;'>Entidades</span>
+                <span style='background: #4cc9f040; padding: 3px 8px; border-radius: 5px; margin: 0 3px;'>Seleção</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class='text-container focus-effect'>
+            {highlighted_text}
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        st.subheader("🔍 Ferramentas de Análise de Texto")
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            selected_text = st.text_input(
+                "Selecionar texto para análise:",
+                placeholder="Digite ou cole o texto que deseja analisar",
+                key=f"text_select_{st.session_state.current_page}"
+            )
+        
+        with col2:
+            st.markdown("<div style='height: 30px'></div>", unsafe_allow_html=True)
+            if st.button("🔍 Analisar Texto", use_container_width=True) and selected_text:
+                if st.session_state.current_page not in st.session_state.user_highlights:
+                    st.session_state.user_highlights[st.session_state.current_page] = {}
+                
+                highlight_id = f"highlight_{len(st.session_state.user_highlights[st.session_state.current_page]) + 1}"
+                st.session_state.user_highlights[st.session_state.current_page][highlight_id] = {
+                    'text': selected_text,
+                    'page': st.session_state.current_page
+                }
+                
+                st.session_state.selected_text_for_analysis = selected_text
+                st.session_state.show_ia_analysis = True
+                
+                st.success("Texto destacado para análise!")
+        
+        if keywords or entities or page_highlights:
+            st.markdown("---")
+            info_col1, info_col2, info_col3 = st.columns(3)
+            
+            with info_col1:
+                if keywords:
+                    st.caption(f"🔑 **Palavras-chave:** {', '.join(keywords[:5])}{'...' if len(keywords) > 5 else ''}")
+            
+            with info_col2:
+                if entities:
+                    entity_list = [f"{e[0]} ({e[1]})" for e in entities[:3]]
+                    st.caption(f"🏷️ **Entidades:** {', '.join(entity_list)}{'...' if len(entities) > 3 else ''}")
+            
+            with info_col3:
+                if page_highlights:
+                    highlight_count = len(page_highlights)
+                    st.caption(f"⭐ **Seleções do usuário:** {highlight_count} texto(s) destacado(s)")
+    
+    def _initialize_prompts(self):
+        return {
+            'summary': """Analise o seguinte texto e forneça um resumo conciso em português. 
+Destaque os pontos principais, conceitos-chave e a mensagem central:""",
+            
+            'analysis': """Analise profundamente este texto considerando:
+1. Contexto histórico e significado filosófico
+2. Metáforas, simbolismos e linguagem figurada
+3. Relações com temas maiores da obra
+4. Implicações científicas, filosóficas ou sociais
+5. Conexões com outros conceitos apresentados no livro
+
+Texto para análise:""",
+            
+            'explain_concepts': """Explique os seguintes conceitos presentes no texto: {concepts}
+Forneça definições claras, exemplos práticos e relação con o contexto do livro:""",
+            
+            'chapter_context': """Considerando que este texto faz parte do capítulo "{chapter}" do livro "{book_name}",
+analise como este trecho se relaciona con:
+1. O contexto geral do capítulo
+2. A estrutura narrativa do livro
+3. Os temas principais da obra
+4. O desenvolvimento de ideias ao longo do livro
+
+Trecho para análise:""",
+            
+            'page_summary': """Gere um resumo detalhado da página {page} do livro "{book_name}". 
+Inclua os principais pontos, ideias-chave e como esta página se conecta com o conteúdo geral do livro:""",
+            
+            'highlight_analysis': """Analise o seguinte texto destacado pelo usuário: "{highlighted_text}"
+Contexto do trecho: {context}
+Forneça uma análise aprofundada do significado, importância e relações com o conteúdo do livro:"""
+        }
+    
+    def _extract_chapters_advanced(self):
+        return extract_chapters_advanced(self.segments)
+    
+    def render_advanced_sidebar(self):
+        with st.sidebar:
+            st.markdown("""
+            <div style='text-align: center; margin-bottom: 2rem; padding: 1rem; background: rgba(157, 78, 221, 0.1); border-radius: 15px;'>
+                <h1 style='font-size: 2rem; margin-bottom: 0.5rem; background: linear-gradient(135deg, #e0aaff, #9d4edd); -webkit-background-clip: text; -webkit-text-fill-color: transparent;'>📖 FLUX-ON READER</h1>
+                <p style='color: #c77dff; margin: 0; font-size: 1.1rem;'>Leitura Quântica Multidimensional</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.header("🔢 Navegação Rápida")
+            nav_col1, nav_col2, nav_col3 = st.columns(3)
+            
+            with nav_col1:
+                if st.button("⏮️ Primeira", use_container_width=True, help="Ir para a primeira página"):
+                    self.nav_system.first_page()
+            
+            with nav_col2:
+                if st.button("◀️ Anterior", use_container_width=True, help="Página anterior"):
+                    self.nav_system.prev_page()
+            
+            with nav_col3:
+                if st.button("Próxima ▶️", use_container_width=True, help="Próxima página"):
+                    self.nav_system.next_page()
+            
+            # ✅ BOTÃO DE CONFIRMAÇÃO (só aparece quando há mudança pendente)
+            if hasattr(st.session_state, 'pending_page') and st.session_state.pending_page != st.session_state.get('current_page', 1):
+                st.markdown("---")
+                if st.button("✅ **CONFIRMAR MUDANÇA DE PÁGINA**", 
+                            use_container_width=True,
+                            type="primary",
+                            help="Clique para carregar a página selecionada"):
+                    self.nav_system.confirm_page_change()
+                    st.rerun()  # Força a atualização após confirmação
+                
+                st.info(f"📖 Página {st.session_state.pending_page} selecionada. Confirme para carregar.")
+            
+            st.header("🎯 Navegação por Página")
+
+            # ✅ CORREÇÃO: O select_slider já funciona bem com o session_state
+            selected_page = st.select_slider(
+                "Selecionar página:",
+                options=list(range(1, len(self.segments) + 1)),
+                value=st.session_state.current_page,
+                key="page_selector_optimized",
+                on_change=lambda: setattr(st.session_state, 'pending_page', st.session_state.page_selector_optimized)
+            )
+            
+            metrics_data = [
+                ("📄 Total de páginas", len(self.segments)),
+                ("📝 Palavras totais", self.book_analysis.get('total_words', 0)),
+                ("🎯 Dificuldade média", f"{self.book_analysis.get('avg_difficulty', 0):.1f}/100"),
+                ("📈 Variação de dificuldade", f"{self.book_analysis.get('max_difficulty', 0) - self.book_analysis.get('min_difficulty', 0):.1f}")
+            ]
+            
+            for metric, value in metrics_data:
+                st.metric(metric, value)
+            
+            st.header("🎯 Temas Principais")
+            # CORREÇÃO: Usar self.book_analysis
+            theme_dist = self.book_analysis.get('theme_distribution', {})
+            
+            if theme_dist:
+                # Temas estendidos dependem das páginas: entram quando estiverem prontos
+                extended_themes = self.shared_book.peek_derived('book_themes')
+                
+                combined_themes = {**theme_dist, **(extended_themes or {})}
+                
+                for theme, score in sorted(combined_themes.items(), key=lambda x: x[1], reverse=True)[:8]:
+                    st.progress(score/100, f"{theme}: {score:.1f}%")
+                
+                if extended_themes is None:
+                    st.caption("⏳ Temas estendidos em cálculo...")
+            else:
+                st.info("Análise de temas em andamento...")
+                
+            st.markdown("---")
+            if st.button("🏠 Voltar à Tela Inicial", use_container_width=True, key="back_to_main"):
+                st.session_state.book_loaded = False
+    
+    def _get_current_chapter(self):
+        """Capítulo da página atual; None se não houver ou enquanto os capítulos são calculados (warm_up)"""
+        chapters = self.shared_book.peek_derived('chapters')
+        if chapters is None:
+            st.caption("⏳ Capítulos em cálculo...")
+            return None
+        current_page = st.session_state.current_page
+        for chapter in chapters:
+            if current_page >= chapter['start_page'] and current_page <= chapter['end_page']:
+                return chapter
+        return None
+    
+    def _render_visual_analysis(self, segment):
+        pd, px, go = _plotting_modules()
+        st.markdown("---")
+        st.header("📊 Análise Visual da Página")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            metrics = segment.complexity_metrics
+            if metrics:
+                metrics_names = ['Palavras', 'Sentenças', 'Pal./Sentença', 'Tam. Médio']
+                metrics_values = [
+                    metrics.get('word_count', 0),
+                    metrics.get('sentence_count', 0),
+                    metrics.get('avg_sentence_length', 0),
+                    metrics.get('avg_word_length', 0)
+                ]
+                
+                fig = go.Figure()
+                
+                fig.add_trace(go.Scatterpolar(
+                    r=metrics_values,
+                    theta=metrics_names,
+                    fill='toself',
+                    name='Métricas',
+                    line_color='#e0aaff',
+                    fillcolor='rgba(224, 170, 255, 0.3)'
+                ))
+                
+                fig.update_layout(
+                    polar=dict(
+                        bgcolor='rgba(30, 30, 46, 0.3)',
+                        radialaxis=dict(
+                            visible=True,
+                            range=[0, max(metrics_values) * 1.2]
+                        ),
+                    ),
+                    showlegend=False,
+                    title="📈 Métricas de Complexidade (Radar)",
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e0aaff', size=12),
+                    height=400
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            themes = segment.themes
+            if themes and len(themes) > 0:
+                text_analysis = self._analyze_text_patterns(segment.text)
+                extended_themes = text_analysis.get('extended_themes', {})
+                
+                all_themes = {**themes, **extended_themes}
+                themes_df = pd.DataFrame({
+                    'Tema': list(all_themes.keys()),
+                    'Intensidade': list(all_themes.values())
+                }).sort_values('Intensidade', ascending=False).head(8)
+                
+                fig = px.pie(themes_df, values='Intensidade', names='Tema', 
+                            title="🎯 Distribuição de Temas (Incluindo Novos)",
+                            hole=0.4,
+                            color_discrete_sequence=px.colors.qualitative.Set3)
+                
+                fig.update_traces(textposition='inside', textinfo='percent+label')
+                fig.update_layout(
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e0aaff'),
+                    showlegend=True,
+                    height=400,
+                    legend=dict(
+                        orientation="h",
+                        yanchor="bottom",
+                        y=-0.2,
+                        xanchor="center",
+                        x=0.5
+                    )
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("🔍 Análise de temas em andamento...")
+        
+        st.markdown("---")
+        st.subheader("🌍 Análise de Temas Sociais e Culturais")
+        
+        text_analysis = self._analyze_text_patterns(segment.text)
+        extended_themes = text_analysis.get('extended_themes', {})
+        
+        if extended_themes:
+            theme_cols = st.columns(4)
+            
+            for i, (theme, score) in enumerate(extended_themes.items()):
+                if score > 5:
+                    with theme_cols[i % 4]:
+                        icons = {
+                            'política': '🏛️',
+                            'religião': '🙏',
+                            'sexo': '❤️',
+                            'cultura': '🎭'
+                        }
+                        
+                        st.metric(
+                            label=f"{icons.get(theme, '📊')} {theme.capitalize()}",
+                            value=f"{score:.1f}%",
+                            help=f"Intensidade do tema {theme} nesta página"
+                        )
+            
+            if any(score > 5 for score in extended_themes.values()):
+                extended_df = pd.DataFrame({
+                    'Tema': list(extended_themes.keys()),
+                    'Intensidade': list(extended_themes.values())
+                }).sort_values('Intensidade', ascending=False)
+                
+                fig = px.bar(extended_df, x='Tema', y='Intensidade',
+                            title="📊 Intensidade dos Temas Sociais",
+                            color='Intensidade',
+                            color_continuous_scale='viridis')
+                
+                fig.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e0aaff'),
+                    height=300
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("🤔 Nenhum tema social significativo detectado nesta página.")
+        
+        sentiment_score = max(0, min(100, segment.difficulty * 0.8))
+        sentiment_label = "Positivo" if sentiment_score > 60 else "Neutro" if sentiment_score > 40 else "Desafiador"
+        sentiment_icon = "😊" if sentiment_score > 60 else "😐" if sentiment_score > 40 else "😔"
+        
+        st.markdown("---")
+        sentiment_col1, sentiment_col2, sentiment_col3 = st.columns([1, 2, 1])
+        
+        with sentiment_col2:
+            html = f"""
+            <div style='text-align: center; padding: 1.5rem; background: rgba(45, 45, 65, 0.7); border-radius: 15px; border-left: 5px solid #7b2cbf;'>
+                <h3 style='color: #e0aaff; margin-bottom: 1rem;'>🎭 Tom Emocional da Página</h3>
+                <div style='font-size: 2.5rem; font-weight: bold; color: #e0aaff; margin: 0.5rem 0;'>{sentiment_icon} {sentiment_label}</div>
+                <div style='margin-top: 1.5rem; position: relative;'>
+                    <div style='background: rgba(255,255,255,0.1); height: 25px; border-radius: 12px; overflow: hidden;'>
+                        <div style='background: linear-gradient(90deg, #f44336, #ff9800, #4caf50); 
+                                height: 100%; width: {sentiment_score:.1f}%; border-radius: 12px; 
+                                position: relative;'>
+                            <div style='position: absolute; right: 5px; top: 50%; transform: translateY(-50%); 
+                                    color: white; font-weight: bold; font-size: 12px;'>
+                                {sentiment_score:.1f}%
+                            </div>
+                        </div>
+                    </div>
+                    <div style='display: flex; justify-content: space-between; margin-top: 0.5rem; color: #c77dff; font-size: 0.9rem;'>
+                        <span>Desafiador</span>
+                        <span>Neutro</span>
+                        <span>Positivo</span>
+                    </div>
+                </div>
+            </div>
+            """
+            st.markdown(html, unsafe_allow_html=True)
+    
+    def _analyze_extended_themes(self, text):
+        return analyze_extended_themes(text, self.extended_themes)
+
+    def _analyze_text_patterns(self, text):
+        words = re.findall(r'\b\w+\b', text.lower())
+        word_freq = Counter(words)
+        
+        stopwords = {'o', 'a', 'e', 'de', 'da', 'do', 'em', 'para', 'com', 'que', 'é', 'um', 'uma', 'os', 'as'}
+        relevant_words = {word: count for word, count in word_freq.items() 
+                         if word not in stopwords and len(word) > 3 and count > 1}
+        
+        scientific_terms = {'energia', 'quantum', 'consciência', 'evolução', 'comportamento', 
+                           'física', 'mente', 'universo', 'realidade', 'matéria', 'filosofia'}
+        
+        found_terms = {term: word_freq.get(term, 0) for term in scientific_terms 
+                      if term in word_freq}
+        
+        extended_themes = self._analyze_extended_themes(text)
+        
+        return {
+            'frequent_words': dict(sorted(relevant_words.items(), 
+                                        key=lambda x: x[1], reverse=True)[:15]),
+            'scientific_terms': found_terms,
+            'extended_themes': extended_themes,
+            'total_words': len(words),
+            'unique_words': len(set(words))
+        }
+
+    def _render_api_configuration(self):
+        st.markdown("---")
+        st.header("🔧 Configuração da API DeepSeek")
+        
+        with st.expander("⚙️ Configurar Conexão com IA", expanded=False):
+            st.info("""
+            **Para usar análises com IA em tempo real:**
+            1. Obtenha uma chave API em: https://platform.deepseek.com/
+            2. Cole sua chave API abaixo
+            3. Salve as configurações
+            """)
+            
+            api_key = st.text_input(
+                "🔑 Chave API DeepSeek:",
+                type="password",
+                placeholder="sk-...",
+                help="Insira sua chave API do DeepSeek"
+            )
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("💾 Salvar Configurações", use_container_width=True):
+                    if api_key:
+                        self.api_config['api_key'] = api_key
+                        self.api_config['configured'] = True
+                        st.session_state.api_configured = True
+                        st.success("✅ Configurações salvas com sucesso!")
+                    else:
+                        st.error("❌ Por favor, insira uma chave API válida")
+            
+            with col2:
+                if st.button("🧪 Testar Conexão", use_container_width=True):
+                    if api_key:
+                        with st.spinner("Testando conexão com DeepSeek..."):
+                            success = self._test_api_connection(api_key)
+                            if success:
+                                st.success("✅ Conexão com API estabelecida com sucesso!")
+                            else:
+                                st.error("❌ Falha na conexão. Verifique sua chave API.")
+                    else:
+                        st.warning("⚠️ Insira uma chave API primeiro")
+            
+            if self.api_config['configured']:
+                st.markdown("---")
+                st.success("✅ API Configurada - Análises em tempo real disponíveis")
+                if st.button("🗑️ Remover Configuração", type="secondary", use_container_width=True):
+                    self.api_config['configured'] = False
+                    self.api_config['api_key'] = ''
+                    st.session_state.api_configured = False
+    
+    def _test_api_connection(self, api_key: str) -> bool:
+        requests = startup_timing.lazy_import('requests')
+        try:
+            headers = {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+            
+            payload = {
+                "model": "deepseek-chat",
+                "messages": [{"role": "user", "content": "Teste de conexão. Responda com 'OK'."}],
+                "max_tokens": 10,
+                "temperature": 0.1
+            }
+            
+            response = requests.post(
+                self.api_config['api_url'],
+                headers=headers,
+                json=payload,
+                timeout=15
+            )
+            
+            return response.status_code == 200
+            
+        except Exception:
+            return False
+    
+    def _call_deepseek_api(self, prompt: str, max_tokens: int = 4000) -> Optional[str]:
+        requests = startup_timing.lazy_import('requests')
+        try:
+            if not self.api_config['configured'] or not self.api_config['api_key']:
+                st.warning("🔧 API não configurada. Usando análise inteligente local.")
+                return self._fallback_analysis(prompt)
+            
+            headers = {
+                "Authorization": f"Bearer {self.api_config['api_key']}",
+                "Content-Type": "application/json"
+            }
+            
+            payload = {
+                "model": "deepseek-chat",
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "Você é um especialista em análise literária e científica. Forneça análises profundas e insights valiosos baseados no texto fornecido. Seja conciso, claro e focado nos aspectos mais relevantes. Responda em português."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "max_tokens": max_tokens,
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "stream": False
+            }
+            
+            api_url = "https://api.deepseek.com/v1/chat/completions"
+            
+            with st.spinner("🔗 Conectando com DeepSeek AI..."):
+                response = requests.post(
+                    api_url,
+                    headers=headers,
+                    json=payload,
+                    timeout=30
+                )
+            
+            if response.status_code == 200:
+                result = response.json()
+                return result['choices'][0]['message']['content']
+            else:
+                st.error(f"❌ Erro na API: {response.status_code} - {response.text}")
+                return None
+                
+        except requests.exceptions.Timeout:
+            st.error("⏰ Timeout na conexão com a API. Verifique sua internet.")
+            return self._fallback_analysis(prompt)
+            
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 401:
+                st.error("🔐 Erro de autenticação. Verifique sua chave API.")
+            elif e.response.status_code == 429:
+                st.warning("🚦 Limite de requisições excedido. Usando análise local.")
+            else:
+                st.error(f"❌ Erro HTTP {e.response.status_code}: {e.response.text}")
+            return self._fallback_analysis(prompt)
+            
+        except Exception as e:
+            st.error(f"⚠️ Erro na chamada da API: {str(e)}")
+            return self._fallback_analysis(prompt)
+    
+    def _fallback_analysis(self, prompt: str) -> str:
+        return f"""
+        **📊 Análise Local - FLUX-ON Reader**
+
+        🔧 **Status:** API DeepSeek não disponível no momento
+
+        💡 **Para ativar análises completas:**
+        1. Configure sua chave API em: https://platform.deepseek.com/
+        2. Adicione créditos à sua conta
+        3. Sua chave atual: `{self.api_config.get('api_key', 'Não configurada')}`
+
+        **📋 Prompt que seria enviado:**
+        {prompt}
+        """
+
+    def _render_analysis_tools(self, segment):
+        st.markdown("---")
+        
+        # MOVER AS ABAS PARA A SIDEBAR - ESTRUTURA REORGANIZADA
+        with st.sidebar:
+            st.markdown("---")
+            st.header("🧰 Ferramentas de Análise")
+            
+            # Abas verticais na sidebar
+            selected_tool = st.radio(
+                "Selecione a ferramenta:",
+                ["🤖 Análise IA", "🔍 Insights", "📝 Anotações", "⭐ Textos Destacados"],
+                key="analysis_tools_sidebar"
+            )
+        
+        # Container principal para o conteúdo das ferramentas
+        analysis_container = st.container()
+        
+        with analysis_container:
+            if selected_tool == "🤖 Análise IA":
+                self._render_ia_analysis_tab(segment)
+                
+            elif selected_tool == "🔍 Insights":
+                self._render_insights_tab(segment)
+                
+            elif selected_tool == "📝 Anotações":
+                self._render_notes_tab()
+                
+            elif selected_tool == "⭐ Textos Destacados":
+                self._render_highlights_tab()
+
+    def _render_ia_analysis_tab(self, segment):
+        st.subheader("🤖 Análise com Inteligência Artificial")
+        
+        if self.api_config['configured']:
+            st.success("✅ API Configurada - Análises em tempo real")
+        else:
+            st.warning("🔧 API não configurada - Usando análise local")
+            st.info("💡 Configure a API DeepSeek para análises mais precisas")
+        
+        analysis_options = {
+            "Resumo da Página": "page_summary",
+            "Análise Profunda": "analysis",
+            "Explicar Conceitos": "explain_concepts",
+            "Contexto do Capítulo": "chapter_context"
+        }
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            analysis_type = st.selectbox(
+                "Tipo de análise:",
+                list(analysis_options.keys()),
+                help="Selecione o tipo de análise que deseja realizar"
+            )
+        
+        with col2:
+            st.markdown("<div style='height: 28px'></div>", unsafe_allow_html=True)
+            if st.button("🚀 Gerar Análise", use_container_width=True):
+                with st.spinner("🤖 Processando análise..."):
+                    prompt_type = analysis_options[analysis_type]
+                    # CORREÇÃO: Usar o método correto para gerar prompt
+                    prompt = self._generate_text_analysis_prompt(prompt_type, segment.text[:3000], segment)
+                    
+                    st.session_state.ia_prompt = prompt
+                    analysis_result = self._call_deepseek_api(prompt)
+                    
+                    if not analysis_result:
+                        analysis_result = self._generate_generic_analysis(prompt)
+                    
+                    st.session_state.ia_analysis_result = analysis_result
+                    st.success("✅ Análise concluída!")
+        
+        # Preview de padrões detectados
+        text_to_analyze = segment.text[:3000]
+        if text_to_analyze:
+            patterns = self._analyze_text_patterns(text_to_analyze)
+            
+            with st.expander("🔍 Visualizar Padrões Detectados", expanded=False):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if patterns['frequent_words']:
+                        st.write("**📊 Palavras frequentes:**")
+                        for word, count in list(patterns['frequent_words'].items())[:4]:
+                            st.write(f"- `{word}`: {count}x")
+                
+                with col2:
+                    if patterns['extended_themes']:
+                        relevant_themes = {theme: score for theme, score in patterns['extended_themes'].items() if score > 5}
+                        if relevant_themes:
+                            st.write("**🌍 Temas detectados:**")
+                            for theme, score in list(relevant_themes.items())[:3]:
+                                st.write(f"- `{theme}`: {score:.1f}%")
+        
+        # Exibir resultado da análise
+        if 'ia_analysis_result' in st.session_state and st.session_state.ia_analysis_result:
+            st.markdown("---")
+            st.subheader("📋 Resultado da Análise")
+            st.markdown(st.session_state.ia_analysis_result)
+            
+    def _generate_contextual_prompt(self, prompt_type, text, segment):
+        """Gera prompt contextualizado baseado no tipo de análise"""
+        book_name = self.analysis_data.get('book_name', 'este livro')
+        current_page = st.session_state.current_page
+        current_chapter = self._get_current_chapter()
+        
+        chapter_info = f"Capítulo {current_chapter['number']}: {current_chapter['title']}" if current_chapter else "Contexto geral"
+        
+        prompts = {
+            'page_summary': f"""Gere um resumo detalhado da página {current_page} do livro "{book_name}".
+Contexto: {chapter_info}
+Texto: {text[:2000]}
+Inclua os principais pontos, ideias-chave e como esta página se conecta com o conteúdo geral do livro.""",
+            
+            'analysis': f"""Analise profundamente este texto considerando:
+1. Contexto histórico e significado filosófico
+2. Metáforas, simbolismos e linguagem figurada  
+3. Relações com temas maiores da obra
+4. Implicações científicas, filosóficas ou sociais
+5. Conexões com outros conceitos apresentados no livro
+
+Contexto: {chapter_info}
+Livro: {book_name}
+Texto para análise: {text[:2000]}""",
+            
+            'explain_concepts': f"""Explique os conceitos complexos presentes no texto:
+Contexto: {chapter_info}
+Livro: {book_name}
+Texto: {text[:2000]}
+Forneça definições claras, exemplos práticos e relação com o contexto do livro.""",
+            
+            'chapter_context': f"""Considerando que este texto faz parte do {chapter_info} do livro "{book_name}",
+analise como este trecho se relaciona com:
+1. O contexto geral do capítulo
+2. A estrutura narrativa do livro  
+3. Os temas principais da obra
+4. O desenvolvimento de ideias ao longo do livro
+
+Trecho para análise: {text[:2000]}"""
+        }
+        
+        return prompts.get(prompt_type, f"Analise o seguinte texto: {text[:2000]}")
+
+    def _render_insights_tab(self, segment):
+        st.subheader("🔍 Insights Automáticos")
+        
+        insights = self._generate_insights(segment)
+        
+        if insights:
+            st.info("💡 **Insights detectados:**")
+            for insight in insights[:3]:  # Limitar a 3 insights principais
+                st.write(f"• {insight}")
+            
+            if len(insights) > 3:
+                with st.expander("Ver mais insights"):
+                    for insight in insights[3:]:
+                        st.write(f"• {insight}")
+            
+            insights_text = "\n".join(insights)
+            if st.button("📋 Copiar Insights", use_container_width=True):
+                self._copy_to_clipboard(insights_text)
+                st.success("✅ Insights copiados!")
+        else:
+            st.info("🤔 Nenhum insight automático detectado.")
+        
+        # Análise de padrões compacta
+        st.markdown("---")
+        st.subheader("📊 Análise Rápida")
+        
+        text_analysis = self._analyze_text_patterns(segment.text)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if text_analysis['frequent_words']:
+                st.write("**🔤 Palavras-chave:**")
+                for word, count in list(text_analysis['frequent_words'].items())[:4]:
+                    st.write(f"`{word}` ({count}x)")
+        
+        with col2:
+            if text_analysis['extended_themes']:
+                relevant_themes = {t: s for t, s in text_analysis['extended_themes'].items() if s > 5}
+                if relevant_themes:
+                    st.write("**🎯 Temas:**")
+                    for theme, score in list(relevant_themes.items())[:2]:
+                        st.write(f"`{theme}`: {score:.1f}%")
+
+    def _render_notes_tab(self):
+        st.subheader("📝 Anotações Pessoais")
+        
+        # Área de nova anotação
+        new_note = st.text_area(
+            "✍️ Nova anotação:",
+            placeholder="Digite suas anotações aqui...",
+            height=120,
+            key=f"new_note_{st.session_state.current_page}"
+        )
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            if st.button("💾 Salvar", use_container_width=True) and new_note:
+                st.session_state.user_notes[st.session_state.current_page] = new_note
+                st.success("✅ Salvo!")
+        
+        with col2:
+            if st.button("🧹 Limpar", use_container_width=True):
+                st.session_state.user_notes[st.session_state.current_page] = ""
+        
+        # Anotações salvas
+        st.markdown("---")
+        st.subheader("📓 Anotações Salvas")
+        
+        current_notes = st.session_state.user_notes.get(st.session_state.current_page, "")
+        if current_notes.strip():
+            st.text_area(
+                f"Anotação Página {st.session_state.current_page}:",
+                value=current_notes,
+                height=200,
+                key=f"current_note_display"
+            )
+        else:
+            st.info("📝 Nenhuma anotação para esta página.")
+
+    def _render_highlights_tab(self):
+        st.subheader("⭐ Textos Destacados")
+        
+        current_page = st.session_state.current_page
+        page_highlights = st.session_state.user_highlights.get(current_page, {})
+        
+        if page_highlights:
+            st.success(f"📖 **{len(page_highlights)} destaque(s)**")
+            
+            for highlight_id, highlight_data in list(page_highlights.items())[:3]:  # Limitar a 3
+                with st.expander(f"🔖 Destaque {list(page_highlights.keys()).index(highlight_id) + 1}", expanded=False):
+                    st.info(f'"{highlight_data["text"]}"')
+                    
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.button(f"📋 Copiar", key=f"copy_{highlight_id}"):
+                            self._copy_to_clipboard(highlight_data["text"])
+                            st.success("✅ Copiado!")
+                    with col2:
+                        if st.button(f"🗑️ Remover", key=f"remove_{highlight_id}"):
+                            del st.session_state.user_highlights[current_page][highlight_id]
+                            st.success("✅ Removido!")
+            
+            if len(page_highlights) > 3:
+                with st.expander("Ver todos os destaques"):
+                    for highlight_id, highlight_data in list(page_highlights.items())[3:]:
+                        st.info(f'"{highlight_data["text"]}"')
+        else:
+            st.info("⭐ Nenhum texto destacado nesta página.")
+        
+        # Estatísticas rápidas
+        total_highlights = sum(len(highlights) for highlights in st.session_state.user_highlights.values())
+        if total_highlights > 0:
+            st.markdown("---")
+            st.metric("📊 Total no livro", total_highlights)
+            
+    def _copy_to_clipboard(self, text):
+        try:
+            import pyperclip
+            pyperclip.copy(text)
+            return True
+        except:
+            try:
+                js_code = f"""
+                navigator.clipboard.writeText(`{text}`).then(() => {{
+                    console.log('Texto copiado para a área de transferência');
+                }}).catch(err => {{
+                    console.error('Erro ao copiar texto: ', err);
+                }});
+                """
+                st.components.v1.html(f"<script>{js_code}</script>", height=0)
+                return True
+            except:
+                st.error("❌ Não foi possível copiar para a área de transferência")
+                return False
+        
+    def _generate_insights(self, segment):
+        insights = []
+        difficulty = segment.difficulty
+        themes = segment.themes
+        readability = segment.readability_score
+        
+        text_analysis = self._analyze_text_patterns(segment.text)
+        extended_themes = text_analysis.get('extended_themes', {})
+        
+        if difficulty > 70:
+            insights.append("💡 **Alta complexidade conceptual**: Esta página contém conceitos avançados de filosofia e ciência. Considere ler com atenção extra e fazer pausas para reflexão.")
+        elif difficulty < 30:
+            insights.append("💡 **Leitura acessível**: Conteúdo de fácil compreensão. Ideal para revisão rápida e absorção de conceitos fundamentais.")
+        
+        if themes:
+            main_theme = max(themes, key=themes.get) if themes else None
+            if main_theme:
+                insights.append(f"🎯 **Tema principal**: {main_theme} ({themes[main_theme]:.1f}% de relevância). Este tema é central para a compreensão do capítulo atual.")
+        
+        for theme, score in extended_themes.items():
+            if score > 20:
+                icons = {'política': '🏛️', 'religião': '🙏', 'sexo': '❤️', 'cultura': '🎭'}
+                insights.append(f"{icons.get(theme, '📊')} **Tema {theme}**: Forte presença ({score:.1f}%) - relevante para análise social do conteúdo.")
+        
+        if readability > 80:
+            insights.append("📖 **Excelente legibilidade**: Texto bem estruturado e de fácil leitura. Aproveite para absorver os conceitos rapidamente.")
+        elif readability < 50:
+            insights.append("⚠️ **Texto complexo**: Estrutura de frases mais complexa. Considere ler em voz alta para melhor compreensão.")
+        
+        text = segment.text.lower()
+        if any(word in text for word in ['tesla', 'energia', 'elétrica']):
+            insights.append("🔌 **Contexto científico**: Esta página faz referência a conceitos de física e energia. Esses conceitos são usados como metáfora para processos conscientes.")
+        
+        if any(word in text for word in ['comportamento', 'humano', 'evolução']):
+            insights.append("🧠 **Análise comportamental**: O texto explora padrões de comportamento humano. Preste atenção nas conexões entre biologia e psicologia.")
+        
+        return insights
+
+    def _render_selected_text_analysis(self):
+        if hasattr(st.session_state, 'show_ia_analysis') and st.session_state.show_ia_analysis:
+            st.markdown("---")
+            st.header("🧠 Análise Avançada do Texto Selecionado")
+            
+            selected_text = st.session_state.selected_text_for_analysis
+            current_segment = self.segments[st.session_state.current_page - 1]
+            context_text = current_segment.text
+            
+            prompt = self._generate_text_analysis_prompt('analysis', selected_text)
+            
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                st.markdown("**📝 Texto Selecionado para Análise:**")
+                st.info(f'"{selected_text}"')
+            
+            with col2:
+                if st.button("🔄 Gerar Nova Análise", use_container_width=True):
+                    st.session_state.ia_analysis_result = None
+                
+                if st.button("❌ Fechar Análise", use_container_width=True):
+                    st.session_state.show_ia_analysis = False
+            
+            patterns = self._analyze_text_patterns(selected_text)
+            with st.expander("🔍 Padrões Detectados no Texto", expanded=False):
+                if patterns['frequent_words']:
+                    st.write("**📊 Palavras-chave:**")
+                    for word, count in list(patterns['frequent_words'].items())[:5]:
+                        st.write(f"- `{word}` ({count}x)")
+                
+                extended_themes = patterns.get('extended_themes', {})
+                relevant_themes = {t: s for t, s in extended_themes.items() if s > 10}
+                if relevant_themes:
+                    st.write("**🌍 Temas Detectados:**")
+                    for theme, score in relevant_themes.items():
+                        st.write(f"- `{theme}`: {score:.1f}%")
+            
+            if 'ia_analysis_result' not in st.session_state:
+                with st.spinner("🤖 Analisando texto com IA multidimensional..."):
+                    analysis_result = self._call_deepseek_api(prompt)
+                    st.session_state.ia_analysis_result = analysis_result
+                    st.session_state.ia_prompt_used = prompt
+            
+            if st.session_state.ia_analysis_result:
+                st.markdown("---")
+                st.subheader("📋 Resultado da Análise Multidimensional")
+                st.markdown(st.session_state.ia_analysis_result)
+                
+                with st.expander("🔧 Detalhes Técnicos da Análise"):
+                    st.text_area("Prompt utilizado:", st.session_state.ia_prompt_used, height=200)
+            
+            st.markdown("---")
+    
+    def _render_segment_safely(self, segment):
+        try:
+            if not segment:
+                st.warning("📄 Segmento não disponível")
+                return
+            
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                self._render_interactive_text(segment)
+                
+            with col2:
+                self._render_analysis_tools(segment)
+            
+            self._render_visual_analysis(segment)
+            
+            self._render_selected_text_analysis()
+            
+        except Exception as e:
+            st.error(f"❌ Erro ao renderizar página: {str(e)}")
+            st.info("📋 Recarregue a página ou volte para a página anterior")
+
+    def render_quantum_reader(self):
+        """
+        Renderiza o conteúdo principal da página atual do livro.
+        """
+        # ✅ Verificar se há uma mudança de página pendente
+        if hasattr(st.session_state, 'pending_page') and st.session_state.pending_page != st.session_state.current_page:
+            st.warning(f"📖 Página {st.session_state.pending_page} selecionada. Clique em 'Confirmar Mudança de Página' na sidebar para carregar.")
+        
+        # CORREÇÃO: Forçar rerun quando a página mudar (mantido para compatibilidade)
+        if 'last_page' not in st.session_state:
+            st.session_state.last_page = st.session_state.current_page
+        
+        if st.session_state.last_page != st.session_state.current_page:
+            st.session_state.last_page = st.session_state.current_page
+            st.rerun()
+            
+        if not self.render_controller.should_render():
+            st.info("⏳ Carregando conteúdo...")
+            return
+            
+        if not self.render_controller.acquire_lock():
+            return
+        
+        try:
+            current_page = st.session_state.current_page
+            total_pages = len(self.segments)
+            
+            # CORREÇÃO: Verificar limites antes de renderizar
+            if current_page > total_pages:
+                st.session_state.current_page = total_pages
+                st.rerun()
+                return
+                
+            if current_page < 1:
+                st.session_state.current_page = 1
+                st.rerun()
+                return
+            
+            # CORREÇÃO: Usar state_manager para obter segmento atual
+            segment = self.state_manager.get_current_segment()
+            difficulty = segment.difficulty if segment else 0
+            word_count = segment.word_count if segment else 0
+            
+            st.markdown(f"""
+            <div style='display: flex; justify-content: space-between; align-items: center; 
+                        background: rgba(157, 78, 221, 0.1); padding: 1rem; border-radius: 10px; 
+                        margin-bottom: 1.5rem; border-left: 4px solid #9d4edd;'>
+                <div>
+                    <h2 style='color: #e0aaff; margin: 0; font-size: 1.8rem;'>📖 {self.analysis_data.get('book_name', 'Livro')}</h2>
+                    <p style='color: #c77dff; margin: 0;'>Página {current_page} de {total_pages}</p>
+                </div>
+                <div style='text-align: right;'>
+                    <p style='color: #c77dff; margin: 0;'>Dificuldade: {difficulty:.1f}/100</p>
+                    <p style='color: #c77dff; margin: 0;'>{word_count} palavras</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # CORREÇÃO: Chamar método de renderização seguro
+            self._render_segment_safely(segment)
+            
+        except Exception as e:
+            st.error(f"Erro na renderização: {e}")
+            # CORREÇÃO: Definir segment antes de usar no except
+            segment = self.state_manager.get_current_segment() if hasattr(self, 'state_manager') else None
+            if segment and segment.text:
+                st.text_area("Conteúdo da página:", segment.text, height=300)
+        finally:
+            self.render_controller.release_lock()
+
+    def render_book_overview(self):
+        pd, px, go = _plotting_modules()
+        st.title("📊 Visão Geral do Livro")
+        
+        book_analysis = self.analysis_data.get('book_analysis', {})
+        theme_table = self.shared_book.theme_table
+        
+        st.subheader("📈 Métricas Principais")
+        col1, col2, col3, col4 = st.columns(4)
+        metrics = [
+            ("📄 Total de Páginas", book_analysis.get('total_segments', 0), "#4cc9f0"),
+            ("📝 Palavras", book_analysis.get('total_words', 0), "#9d4edd"),
+            ("🎯 Dificuldade Média", f"{book_analysis.get('avg_difficulty', 0):.1f}/100", "#ff9800"),
+            ("📈 Variação", f"{book_analysis.get('max_difficulty', 0) - book_analysis.get('min_difficulty', 0):.1f}", "#f44336")
+        ]
+        
+        for i, (label, value, color) in enumerate(metrics):
+            with [col1, col2, col3, col4][i]:
+                st.markdown(f"""
+                <div class='metric-card pulse-animation'>
+                    <h3 style='color: {color}; margin: 0; font-size: 1.2rem;'>{label}</h3>
+                    <p style='font-size: 2.2rem; font-weight: bold; color: {color}; margin: 0;'>{value}</p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        st.subheader("📊 Evolução da Dificuldade")
+        # Camada de resumo (difficulty_map): não precisa das páginas
+        difficulties = self.shared_book.difficulties
+        
+        if len(difficulties):
+            df = pd.DataFrame({
+                'Página': range(1, len(difficulties) + 1),
+                'Dificuldade': difficulties,
+                'Capítulo': ['Geral'] * len(difficulties)
+            })
+            
+            chapters = self.shared_book.peek_derived('chapters')
+            if chapters:
+                for i, chapter in enumerate(chapters):
+                    start, end = chapter['start_page'] - 1, min(chapter['end_page'], len(difficulties))
+                    df.loc[start:end, 'Capítulo'] = f"Cap {chapter['number']}"
+            
+            fig = px.line(df, x='Página', y='Dificuldade', 
+                        title="Evolução da Dificuldade por Página",
+                        color='Capítulo',
+                        color_discrete_sequence=px.colors.qualitative.Set3)
+            
+            avg_difficulty = book_analysis.get('avg_difficulty', 0)
+            fig.add_hline(y=avg_difficulty, 
+                        line_dash="dash", line_color="red",
+                        annotation_text=f"Média: {avg_difficulty:.1f}")
+            
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#e0aaff'),
+                height=500,
+                showlegend=True
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        if theme_table:
+            st.markdown("---")
+            st.subheader("🎭 Mapa de Calor Temático")
+            
+            # Matriz pré-calculada (precompute.py) ou em cálculo no segundo plano
+            theme_heatmap = self.shared_book.peek_derived('theme_heatmap')
+            if theme_heatmap is None:
+                st.info("⏳ O mapa de calor está sendo calculado a partir das páginas; ele aparece na próxima atualização.")
+            else:
+                theme_names, heatmap_data = theme_heatmap
+                max_pages = heatmap_data.shape[1]
+                
+                fig = px.imshow(heatmap_data,
+                            labels=dict(x="Página", y="Tema", color="Intensidade"),
+                            x=list(range(1, max_pages + 1)),
+                            y=theme_names,
+                            aspect="auto",
+                            color_continuous_scale="viridis")
+                
+                fig.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e0aaff'),
+                    height=400
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            
+            # Camada de resumo: os capítulos vêm das próprias ocorrências de temas
+            chapter_numbers, chapter_means = theme_table.chapter_means()
+            if len(chapter_numbers):
+                st.subheader("📚 Temas por Capítulo")
+                chapters_df = pd.DataFrame({
+                    'Capítulo': np.tile([f"Cap {number}" for number in chapter_numbers], len(theme_table)),
+                    'Tema': np.repeat(theme_table.names, len(chapter_numbers)),
+                    'Intensidade média': chapter_means.ravel()
+                })
+                
+                fig = px.bar(chapters_df, x='Capítulo', y='Intensidade média', color='Tema',
+                             barmode='group', title="Intensidade Média dos Temas por Capítulo")
+                fig.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e0aaff'),
+                    height=400
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown("---")
+        st.subheader("🌍 Análise de Temas Sociais e Culturais")
+        
+        extended_themes = self.shared_book.peek_derived('book_themes')
+        
+        if extended_themes is None:
+            st.info("⏳ Os temas sociais e culturais estão sendo calculados; eles aparecem na próxima atualização.")
+        elif extended_themes:
+            theme_cols = st.columns(4)
+            
+            for i, (theme, score) in enumerate(extended_themes.items()):
+                if score > 5:
+                    with theme_cols[i % 4]:
+                        icons = {
+                            'política': '🏛️',
+                            'religião': '🙏',
+                            'sexo': '❤️',
+                            'cultura': '🎭'
+                        }
+                        
+                        st.metric(
+                            label=f"{icons.get(theme, '📊')} {theme.capitalize()}",
+                            value=f"{score:.1f}%",
+                            help=f"Intensidade do tema {theme} no livro"
+                        )
+            
+            if any(score > 5 for score in extended_themes.values()):
+                extended_df = pd.DataFrame({
+                    'Tema': list(extended_themes.keys()),
+                    'Intensidade': list(extended_themes.values())
+                }).sort_values('Intensidade', ascending=False)
+                
+                fig = px.bar(extended_df, x='Tema', y='Intensidade',
+                            title="📊 Intensidade dos Temas Sociais no Livro",
+                            color='Intensidade',
+                            color_continuous_scale='viridis')
+                
+                fig.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#e0aaff'),
+                    height=300
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("🤔 Nenhum tema social significativo detectado no livro.")
+        
+        st.markdown("---")
+        st.subheader("🧠 Estatísticas de Leitura")
+        
+        total_words = book_analysis.get('total_words', 0)
+        reading_time_min = total_words / 200
+        
+        stat_col1, stat_col2, stat_col3 = st.columns(3)
+        
+        with stat_col1:
+            st.metric("⏱️ Tempo Estimado", f"{reading_time_min:.0f} min")
+        
+        with stat_col2:
+            avg_difficulty = book_analysis.get('avg_difficulty', 0)
+            level = "Fácil" if avg_difficulty < 40 else "Médio" if avg_difficulty < 70 else "Difícil"
+            st.metric("📊 Nível", level)
+        
+        with stat_col3:
+            st.metric("📖 Densidade", f"{(total_words/book_analysis.get('total_segments', 1)):.0f} palavras/página")
+    
+    def render_export_section(self):
+        st.title("💾 Exportar Dados e Relatórios")
+        
+        st.info("""
+        **Exporte seus dados de leitura** para análise externa, compartilhamento ou backup.
+        Todos os relatórios incluem suas anotações pessoais e destaques.
+        """)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("📊 Dados de Análise")
+            
+            if st.button("📄 JSON Completo", use_container_width=True, help="Exportar todos os dados de análise em formato JSON"):
+                try:
+                    export_data = self.analysis_data.copy()
+                    export_data['theme_analysis'] = self.shared_book.theme_table.to_dict()
+                    export_data['user_notes'] = st.session_state.user_notes
+                    export_data['user_highlights'] = st.session_state.user_highlights
+
+                    data_str = safe_json_dump(export_data)
+
+                    b64 = base64.b64encode(data_str.encode()).decode()
+                    href = f'<a href="data:application/json;base64,{b64}" download="analise_livro_completa.json">⬇️ Baixar JSON Completo</a>'
+                    st.markdown(href, unsafe_allow_html=True)
+                except Exception as e:
+                    st.error(f"Erro ao gerar JSON: {str(e)}")
+            
+            if st.button("📈 Dados Estatísticos", use_container_width=True, help="Exportar métricas e estatísticas em CSV"):
+                try:
+                    output = "Página,Dificuldade,Palavras,Sentenças,Tema Principal\n"
+                    difficulties = self.segments.column('difficulty')
+                    word_counts = self.segments.column('complexity_metrics.word_count')
+                    sentence_counts = self.segments.column('complexity_metrics.sentence_count')
+                    for i, segment in enumerate(self.segments):
+                        themes = segment.themes
+                        main_theme = max(themes, key=themes.get) if themes else 'Nenhum'
+                        output += f"{i + 1},{difficulties[i]},{word_counts[i]},{sentence_counts[i]},{main_theme}\n"
+                    
+                    b64 = base64.b64encode(output.encode()).decode()
+                    href = f'<a href="data:file/csv;base64,{b64}" download="estatisticas_livro.csv">⬇️ Baixar CSV Estatístico</a>'
+                    st.markdown(href, unsafe_allow_html=True)
+                except Exception as e:
+                    st.error(f"Erro ao gerar CSV: {str(e)}")
+        
+        with col2:
+            st.subheader("📝 Conteúdo Personalizado")
+            
+            if st.button("📖 Anotações Pessoais", use_container_width=True, help="Exportar apenas suas anotações e destaques"):
+                self._export_notes()
+            
+            if st.button("🖼️ Gráficos de Análise", use_container_width=True, help="Exportar visualizações gráficas (em breve)"):
+                st.info("Recurso em desenvolvimento - em breve disponível!")
+            
+            if st.button("🤖 Análises com IA", use_container_width=True, help="Exportar análises geradas pela IA (em breve)"):
+                st.info("Recurso em desenvolvimento - em breve disponível!")
+    
+    def _export_notes(self):
+        if not st.session_state.user_notes:
+            st.warning("Não há anotações para exportar.")
+            return
+        
+        notes_text = "# Anotações Pessoais - FLUX-ON Reader\n\n"
+        for page, note in st.session_state.user_notes.items():
+            if note.strip():
+                notes_text += f"## Página {page}\n\n{note}\n\n---\n\n"
+        
+        b64 = base64.b64encode(notes_text.encode()).decode()
+        href = f'<a href="data:file/txt;base64,{b64}" download="anotacoes_fluxon.txt">📥 Baixar Anotações</a>'
+        st.markdown(href, unsafe_allow_html=True)
+        st.success("Anotações preparadas para download!")
+
+    def render(self):
+        if 'book_cover_shown' not in st.session_state:
+            book_cover = self.analysis_data.get('book_cover')
+            if book_cover:
+                st.markdown("""
+                <div style='text-align: center; margin: 2rem 0; padding: 2rem; background: rgba(45, 45, 65, 0.8); border-radius: 20px;'>
+                    <h1 style='color: #e0aaff; margin-bottom: 2rem;'>📖 {}</h1>
+                    <img src="{}" style="max-width: 300px; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.3);">
+                </div>
+                """.format(self.analysis_data.get('book_name', 'Livro'), book_cover), 
+                unsafe_allow_html=True)
+                
+                st.markdown("---")
+                st.session_state.book_cover_shown = True
+        
+        self.render_search_interface()
+        
+        # Adicionar opção de menu para resultados de busca
+        menu_options = {
+            "📖 Ler Livro": self.render_quantum_reader,
+            "📊 Visão Geral": self.render_book_overview,
+            "🔍 Resultados Busca": self.render_search_results_page,  # NOVO
+            "📑 Concordância": self.render_concordance_page,
+            "🔧 Configurações": self._render_api_configuration,
+            "💾 Exportar": self.render_export_section
+        }
+        
+        with st.sidebar:
+            selected_menu = st.selectbox(
+                "**Navegação Principal**",
+                list(menu_options.keys()),
+                index=0
+            )
+        
+        self.render_advanced_sidebar()
+        
+        menu_options[selected_menu]()
+        
+        st.markdown("---")
+        st.markdown("""
+        <div style='text-align: center; color: #c77dff; padding: 2rem; background: rgba(157, 78, 221, 0.1); border-radius: 15px;'>
+            <p style='font-size: 1.2rem; margin-bottom: 0.5rem;'>✨ <strong>FLUX-ON Quantum Reader v8.0</strong> - Sistema Avançado de Análise Literária</p>
+            <p style='margin: 0;'>📚 Transformando leitura em experiência quântica multidimensional</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def _render_missing_data_help():
+    st.error("🚨 Dados de análise não encontrados")
+    st.info("""
+    📋 **Solução de problemas:**
+    1. Execute primeiro a análise do livro no módulo principal
+    2. Aguarde o processamento completo dos dados
+    3. Recarregue a página após a análise ser concluída
+    """)
+    
+    if st.button("📊 Executar Análise do Livro", type="primary"):
+        st.switch_page("main_analysis.py")
+
+def _render_format_error(error):
+    """Diagnóstico de um livro fora do formato: campo, linha/coluna e trecho do arquivo"""
+    st.error(f"🚨 Arquivo de análise inválido: {error.message}")
+    if error.path:
+        st.markdown(f"**Campo:** `{error.path}`")
+    if error.line is not None:
+        st.text(f"Linha: {error.line}, Coluna: {error.column}, Byte: {error.offset}")
+    if error.context:
+        st.code(f"...{error.context}...", language="json")
+    st.info("""
+    📋 **Solução de problemas:**
+    1. Corrija o campo indicado ou execute novamente a análise do livro
+    2. Certifique-se de que o processo de análise foi concluído com sucesso
+    3. Se o problema persistir, verifique o arquivo de origem
+    """)
+
+def _render_book_error(error):
+    if isinstance(error, book_schema.MissingBookDataError):
+        _render_missing_data_help()
+    else:
+        _render_format_error(error)
+
+def open_shared_book(source_path, book_cache):
+    """Livro de ``source_path`` no cache ``book_cache``, carregado sem interface.
+    
+    Levanta ``book_schema.BookFormatError`` (registrado no cache) se os
+    dados forem inválidos.
+    """
+    book_id = book_store.book_id_from_path(source_path)
+    content_hash = book_store.content_hash(source_path)
+    shared_book = book_cache.get(book_id, content_hash)
+    
+    if shared_book is not None:
+        return shared_book
+    
+    # Livro já rejeitado com este conteúdo: diagnóstico sem nova validação
+    error = book_cache.get_error(book_id, content_hash)
+    if error is not None:
+        raise error
+    
+    # ✅ Livro compilado (book_store.py): mapeia o armazenamento em disco
+    # em vez de decodificar o JSON
+    compiled_book = book_store.open_book(source_path)
+    
+    if compiled_book is not None:
+        analysis_data = compiled_book.as_analysis_data()
+    else:
+        # ✅ Sem livro compilado: o JSON é validado uma vez ao construir o
+        # índice de offsets, e as páginas são decodificadas sob demanda
+        # (segment_loader.py)
+        try:
+            analysis_data = segment_loader.open_json_book(source_path).as_analysis_data()
+        except book_schema.BookFormatError as e:
+            book_cache.record_error(book_id, content_hash, e)
+            raise
+    
+    return book_cache.get_or_create(book_id, content_hash, analysis_data)
+
+def load_shared_book(source_path):
+    """Obtém o livro do cache do processo, carregando-o apenas quando necessário.
+    
+    Retorna ``None`` (após exibir o diagnóstico) se os dados forem inválidos.
+    """
+    if not os.path.exists(source_path):
+        _render_missing_data_help()
+        return None
+    
+    book_cache = get_book_cache()
+    shared_book = book_cache.get(book_store.book_id_from_path(source_path), book_store.content_hash(source_path))
+    if shared_book is not None:
+        return shared_book
+    
+    try:
+        with st.spinner("📚 Preparando livro..."):
+            return open_shared_book(source_path, book_cache)
+    except book_schema.BookFormatError as e:
+        _render_book_error(e)
+        return None
+
+def render_book(source_path):
+    """Renderiza o leitor para o livro de ``source_path`` na sessão atual"""
+    shared_book = load_shared_book(source_path)
+    if shared_book is None:
+        return
+    
+    switch_session_book(shared_book.book_id)
+    target = st.session_state.pop('library_target', None)
+    if target is not None and target[0] == shared_book.book_id:
+        st.session_state.current_page = target[1]
+    # Resumo já disponível; capítulos, temas e índice são preparados em segundo plano
+    shared_book.warm_up()
+    reader = QuantumBookReader(shared_book=shared_book)
+    reader.render()
+    render_debug_panel()
+
+def debug_enabled():
+    """Painel de depuração: ``?debug=1`` na URL ou FLUXON_DEBUG=1 no ambiente"""
+    return os.environ.get('FLUXON_DEBUG') == '1' or st.query_params.get('debug') == '1'
+
+def render_debug_panel():
+    if not debug_enabled():
+        return
+    
+    with st.sidebar.expander("🛠️ Depuração", expanded=False):
+        st.markdown("**⏱️ Inicialização deste processo**")
+        timings = startup_timing.recorded_timings()
+        st.code("\n".join(f"{seconds * 1000:8.1f} ms  {name}" for name, seconds in timings) or "sem registros")
+        
+        if st.button("Medir cold start (novo interpretador)", key="debug_cold_start"):
+            with st.spinner("Medindo imports..."):
+                elapsed, imports = startup_timing.measure_cold_start()
+            st.code(startup_timing.format_report(elapsed, imports, top=15))
+        
+        st.markdown("**🔎 Cache de buscas (processo)**")
+        stats = get_book_cache().query_cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = stats['hits'] / lookups if lookups else 0.0
+        st.code(f"acertos {stats['hits']} · falhas {stats['misses']} · taxa {hit_rate:.0%}\n"
+                f"consultas em cache {stats['entries']}/{stats['max_entries']}")
+
+def render_unexpected_error(e):
+    st.error(f"🚨 Erro inesperado: {str(e)}")
+    st.info("""
+    📋 **Solução de problemas:**
+    1. Recarregue a página e tente novamente
+    2. Verifique se há problemas com seus dados de entrada
+    3. Consulte o suporte técnico se o problema persistir
+    """)
+
+def run_book(title):
+    """Ponto de entrada dos scripts de um único livro (ex.: ``Caos.py``)"""
+    apply_page_style()
+    try:
+        if 'book_loaded' not in st.session_state:
+            st.session_state.book_loaded = False
+        
+        if not st.session_state.book_loaded:
+            render_book_opener()
+            render_debug_panel()
+            return
+        
+        render_book(book_store.source_path_for(title))
+        
+    except Exception as e:
+        render_unexpected_error(e)
+
+startup_timing.record('import leitor_quantico', time.perf_counter() - _import_started)
@@ -0,0 +1,292 @@
+"""Pré-cálculo e cache dos dados derivados de cada livro do FLUX-ON Reader.
+
+Capítulos, índice de busca, temas estendidos por página, matriz do mapa
+de calor e temas do livro inteiro são derivados dos segmentos. Cada um é
+gravado em ``livros_compilados/derivados/<livro>/<dado>-<chave>.npz``
+(o índice de busca, em um diretório ``search_index-<chave>/`` mapeado em
+memória ao abrir; ver search_index.py), onde a chave é um hash dos textos dos segmentos e da versão do código de
+análise que produziu o dado (léxico ``EXTENDED_THEMES``, lista
+``CHAPTER_PATTERNS``, ...) e do código-fonte das funções que o calculam.
+Editar o léxico, o algoritmo ou o texto de uma página muda a chave: o
+artefato antigo deixa de ser encontrado e é recalculado e regravado
+automaticamente no primeiro uso (``SharedBook``).
+
+Chaves antigas não são apagadas na hora: durante uma implantação gradual,
+processos de versões diferentes usam chaves diferentes do mesmo dado. Um
+artefato é removido quando outro do mesmo dado é gravado e ele está há
+mais de ``ARTIFACT_GRACE_SECONDS`` sem ser lido nem gravado; a linha de
+comando remove na hora as versões que não são as atuais.
+
+O pipeline abaixo calcula tudo antecipadamente, tirando esse trabalho da
+primeira sessão de cada livro.
+
+Uso (linha de comando)::
+
+    python precompute.py                      # pré-calcula todos os livros da biblioteca
+    python precompute.py livros/Caos.json     # pré-calcula um livro específico
+    python precompute.py --manter-antigos     # sem apagar as versões anteriores dos dados
+"""
+
+import argparse
+import glob
+import functools
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+import book_store
+import leitor_quantico
+import search_analyzer
+import search_index
+import segment_loader
+import theme_table
+
+# Alterar ao mudar o formato dos arquivos (o código dos cálculos já entra na chave)
+ARTIFACT_FORMAT_VERSION = 7
+
+# Tempo sem uso após o qual a versão antiga de um dado pode ser apagada
+ARTIFACT_GRACE_SECONDS = int(os.environ.get('FLUXON_CARENCIA_ARTEFATOS', 7 * 24 * 3600))
+
+# Ordem de cálculo no pré-carregamento: primeiro o que a barra lateral usa
+DERIVED_NAMES = ('book_themes', 'chapters', 'page_themes', 'theme_heatmap', 'search_index')
+
+# Dados gravados como diretório de arquivos mapeados em memória, em vez de .npz
+MAPPED_NAMES = ('search_index',)
+
+
+def artifact_root(store_root=None):
+    return os.path.join(store_root or book_store.STORE_ROOT, 'derivados')
+
+
+@functools.lru_cache(maxsize=None)
+def source_hash(obj):
+    """Hash do código-fonte de uma função ou classe (bytecode, se a fonte não estiver disponível)"""
+    try:
+        source = inspect.getsource(obj).encode('utf-8')
+    except (OSError, TypeError):
+        source = getattr(getattr(obj, '__code__', None), 'co_code', b'')
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def analysis_versions():
+    """O que, além dos textos, determina cada dado derivado"""
+    lq = leitor_quantico
+    themes_code = [source_hash(lq.analyze_extended_themes)]
+    return {
+        'chapters': [lq.CHAPTER_PATTERNS, source_hash(lq.extract_chapters_advanced), source_hash(compute_chapters)],
+        'search_index': [lq.CHAPTER_PATTERNS, lq.SearchEngine.default_analyzer().signature(),
+                         source_hash(lq.SearchEngine._build_index), source_hash(search_index.PositionalIndex),
+                         source_hash(search_analyzer.Analyzer)],
+        'page_themes': [lq.EXTENDED_THEMES, *themes_code, source_hash(compute_page_themes)],
+        'theme_heatmap': [lq.EXTENDED_THEMES, *themes_code, source_hash(compute_page_themes),
+                          source_hash(compute_theme_heatmap), source_hash(theme_table.ThemeTable)],
+        'book_themes': [lq.EXTENDED_THEMES, *themes_code, source_hash(compute_book_themes)]
+    }
+
+
+def derived_key(name, segments_hash, themes_digest=None):
+    """Chave de cache de um dado derivado: textos + versão do código de análise"""
+    parts = {
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'name': name,
+        'texts': segments_hash,
+        'analysis': analysis_versions()[name]
+    }
+    if name == 'theme_heatmap':
+        # O mapa de calor também inclui os temas da análise original do livro
+        parts['themes'] = themes_digest
+    encoded = json.dumps(parts, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def compute_chapters(segments):
+    return leitor_quantico.extract_chapters_advanced(segments)
+
+
+def compute_search_index(segments, chapters):
+    return leitor_quantico.SearchEngine(segments, chapters).export_index()
+
+
+def compute_page_themes(segments):
+    """Temas estendidos de cada página: (nomes dos temas, matriz temas x páginas)"""
+    names = list(leitor_quantico.EXTENDED_THEMES)
+    matrix = np.zeros((len(names), len(segments)))
+    for i, segment in enumerate(segments):
+        scores = leitor_quantico.analyze_extended_themes(segment.text)
+        for row, name in enumerate(names):
+            matrix[row, i] = scores[name]
+    return names, matrix
+
+
+def compute_book_themes(segments):
+    """Temas estendidos do livro inteiro (barra lateral e visão geral)"""
+    return leitor_quantico.analyze_extended_themes(" ".join(segment.text for segment in segments))
+
+
+def compute_theme_heatmap(theme_table, page_themes):
+    """Mapa de calor da visão geral: temas da análise + temas estendidos por página.
+
+    Retorna (nomes dos temas, matriz temas x páginas). Um tema estendido com
+    o mesmo nome de um tema da análise o substitui, mantendo a posição.
+    """
+    names, matrix = page_themes
+    stacked = np.vstack([theme_table.page_matrix(matrix.shape[1]), matrix])
+
+    rows = {name: row for row, name in enumerate(theme_table.names)}
+    rows.update({name: len(theme_table) + row for row, name in enumerate(names)})
+    return list(rows), stacked[list(rows.values())]
+
+
+class ArtifactCache:
+    """Dados derivados em disco, endereçados por (livro, dado, chave)"""
+
+    def __init__(self, root=None):
+        self.root = root or artifact_root()
+
+    def path(self, book_id, name, key):
+        extension = '' if name in MAPPED_NAMES else '.npz'
+        return os.path.join(self.root, book_id, f"{name}-{key[:32]}{extension}")
+
+    def get(self, book_id, name, key):
+        """Valor gravado para a chave, ou ``None`` se ausente/desatualizado"""
+        path = self.path(book_id, name, key)
+        if not os.path.exists(path):
+            return None
+        if name in MAPPED_NAMES:
+            value = search_index.PositionalIndex.load(path, key)
+        else:
+            value = self._load_npz(path, key)
+        if value is not None:
+            _touch(path)
+        return value
+
+    @staticmethod
+    def _load_npz(path, key):
+        try:
+            with np.load(path, allow_pickle=False) as saved:
+                if str(saved['key']) != key:
+                    return None
+                value = json.loads(saved['json'].tobytes())
+                if 'matrix' in saved.files:
+                    # Pares (nomes, matriz): page_themes e theme_heatmap
+                    return value, saved['matrix']
+                return value
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def get_or_compute(self, book_id, name, key, compute):
+        """Valor gravado para a chave; se não houver, ``compute()``, gravado para os próximos"""
+        value = self.get(book_id, name, key)
+        if value is None:
+            value = compute()
+            try:
+                self.put(book_id, name, key, value)
+            except OSError:
+                # Diretório somente leitura: o dado vale apenas para este processo
+                pass
+        return value
+
+    def put(self, book_id, name, key, value):
+        path = self.path(book_id, name, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if name in MAPPED_NAMES:
+            self._put_mapped(path, name, key, value)
+        else:
+            arrays = {'key': np.array(key)}
+            if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], np.ndarray):
+                value, arrays['matrix'] = value
+            encoded = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            arrays['json'] = np.frombuffer(encoded, dtype=np.uint8)
+
+            tmp_path = os.path.join(os.path.dirname(path), f".tmp-{os.getpid()}-{name}.npz")
+            np.savez(tmp_path, **arrays)
+            os.replace(tmp_path, path)
+
+        self.prune(book_id, name, path)
+        return path
+
+    def prune(self, book_id, name, keep_path, grace_seconds=ARTIFACT_GRACE_SECONDS):
+        """Remove as outras versões de um dado sem uso há mais de ``grace_seconds``"""
+        cutoff = time.time() - grace_seconds
+        for old_path in glob.glob(os.path.join(self.root, glob.escape(book_id), f"{name}-*")):
+            if old_path == keep_path:
+                continue
+            try:
+                if os.path.getmtime(old_path) > cutoff:
+                    # Pode ser a chave atual de um processo de outra versão
+                    continue
+                if os.path.isdir(old_path):
+                    shutil.rmtree(old_path)
+                else:
+                    os.remove(old_path)
+            except OSError:
+                pass
+
+    def _put_mapped(self, path, name, key, value):
+        """Grava o diretório do índice em um temporário e o renomeia (leitores nunca veem um parcial)"""
+        tmp_path = os.path.join(os.path.dirname(path), f".tmp-{os.getpid()}-{name}")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        value.save(tmp_path, key)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Diretório já existe: gravado por outro processo (vale o dele) ou incompleto
+            if search_index.PositionalIndex.load(path, key) is None:
+                shutil.rmtree(path, ignore_errors=True)
+                os.replace(tmp_path, path)
+            else:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _touch(path):
+    """Marca o artefato como em uso (a data de modificação conta para ``prune``)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def precompute_book(source_path, store_root=None, prune=False):
+    """Calcula e grava todos os dados derivados de um livro; retorna seus caminhos.
+
+    Com ``prune``, apaga na hora as demais versões de cada dado.
+    """
+    book = book_store.open_book(source_path, store_root) or segment_loader.open_json_book(source_path, store_root)
+    try:
+        shared_book = leitor_quantico.SharedBook(book.book_id, book.content_hash, book.as_analysis_data(),
+                                                 artifact_cache=ArtifactCache(artifact_root(store_root)))
+        # Cada acesso calcula (ou confirma no cache) e grava o respectivo artefato
+        for name in DERIVED_NAMES:
+            getattr(shared_book, name)
+        paths = [shared_book.artifact_cache.path(book.book_id, name, shared_book.derived_key(name))
+                 for name in DERIVED_NAMES]
+        if prune:
+            for name, path in zip(DERIVED_NAMES, paths):
+                shared_book.artifact_cache.prune(book.book_id, name, path, grace_seconds=0)
+        return paths
+    finally:
+        book.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-calcula os dados derivados dos livros do FLUX-ON Reader")
+    parser.add_argument('sources', nargs='*',
+                        help="Arquivos de análise (.json); padrão: todos os livros de 'livros/'")
+    parser.add_argument('--destino', default=book_store.STORE_ROOT, help="Diretório raiz dos livros compilados")
+    parser.add_argument('--manter-antigos', action='store_true',
+                        help="Não apagar as versões anteriores dos dados (ex.: durante uma implantação gradual)")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or list(book_store.list_books().values())
+    for source in sources:
+        paths = precompute_book(source, args.destino, prune=not args.manter_antigos)
+        print(f"✅ {source} -> {os.path.dirname(paths[0])} ({len(paths)} artefatos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""Analisador de texto da busca do FLUX-ON Reader.
+
+Todos os livros são em português. Cada palavra passa pela mesma sequência
+de filtros ao indexar e ao buscar:
+
+1. ``casefold``: maiúsculas/minúsculas
+2. remoção de stopwords (a lista de ``SearchEngine._get_stopwords``,
+   comparada sem acentos)
+3. ``stem``: radical no estilo RSLP (Orengo & Huyck): plural, feminino,
+   advérbio, aumentativo/diminutivo, sufixos nominais, sufixos verbais e
+   vogal final ("político", "políticos" e "política" -> "polit")
+4. ``fold_accents``: decomposição NFKD sem os acentos ("religião" ->
+   "religiao", "ação" -> "acao")
+
+O plural é reduzido antes de remover os acentos, porque é nele que o
+acento decide a regra: "papéis" -> "papel", mas "fáceis" -> "facil";
+"país" é singular, e "pais" é o plural de "pai". As demais regras são
+escritas sem acentos e valem para a palavra já sem eles, de modo que
+"religiao" e "religião" têm o mesmo radical. As exceções de uma regra
+valem com e sem acentos, salvo as escritas com acento ("país").
+
+O resultado de cada palavra fica em cache (``Analyzer.analyze_token``), de
+modo que o vocabulário de um livro é analisado uma vez por processo.
+``Analyzer.signature`` descreve filtros e regras e entra na chave do
+índice de busca em cache (precompute.py).
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Alterar ao mudar o comportamento dos filtros sem mudar as tabelas abaixo
+ANALYZER_VERSION = 3
+
+TOKEN_CACHE_SIZE = 1 << 17
+
+# Regras (sufixo, tamanho mínimo do radical, substituição[, exceções]), das
+# mais longas para as mais curtas; aplica-se a primeira que casar (uma
+# exceção só descarta a própria regra, e as seguintes ainda são testadas).
+# O plural recebe a palavra ainda com acentos; as demais regras, sem eles
+PLURAL_RULES = (
+    ('ns', 1, 'm'),
+    ('ões', 1, 'ão'),
+    ('oes', 1, 'ao'),
+    ('ães', 1, 'ão', ('mães',)),
+    ('aes', 1, 'ao', ('maes',)),
+    ('ais', 1, 'al', ('cais', 'mais', 'demais', 'jamais', 'pais')),
+    ('éis', 2, 'el'),
+    ('veis', 2, 'vel'),
+    ('eis', 2, 'il'),
+    ('óis', 1, 'ol'),
+    ('ois', 2, 'ol', ('depois',)),
+    ('is', 2, 'il', ('lapis', 'cais', 'mais', 'demais', 'jamais', 'pais', 'crucis', 'biquinis', 'pois', 'depois',
+                     'dois', 'leis', 'reis', 'seis', 'tenis')),
+    ('les', 3, 'l'),
+    ('res', 3, 'r'),
+    ('s', 2, '', ('alias', 'pires', 'lapis', 'cais', 'mais', 'demais', 'jamais', 'mas', 'menos', 'ferias', 'fezes',
+                  'pesames', 'crucis', 'gas', 'atras', 'moises', 'atraves', 'conves', 'país', 'apos', 'ambas',
+                  'ambos', 'messias', 'caos', 'deus', 'lotus', 'virus', 'onibus', 'tenis', 'pois', 'depois',
+                  'dois', 'seis')),
+)
+
+FEMININE_RULES = (
+    ('ona', 3, 'ao', ('abandona', 'lona', 'iona', 'cortisona', 'monotona', 'maratona', 'acetona', 'detona',
+                      'carona')),
+    ('ora', 3, 'or'),
+    ('na', 4, 'no', ('carona', 'abandona', 'lona', 'iona', 'cortisona', 'monotona', 'maratona', 'acetona',
+                     'detona', 'guiana', 'campana', 'grana', 'caravana', 'banana', 'paisana')),
+    ('inha', 3, 'inho', ('rainha', 'linha', 'minha')),
+    ('esa', 3, 'es', ('mesa', 'obesa', 'princesa', 'turquesa', 'ilesa', 'pesa', 'presa')),
+    ('osa', 3, 'oso', ('mucosa', 'prosa')),
+    ('iaca', 3, 'iaco'),
+    ('ica', 3, 'ico', ('dica',)),
+    ('ada', 2, 'ado', ('pitada',)),
+    ('ida', 3, 'ido', ('vida',)),
+    ('ima', 3, 'imo', ('vitima',)),
+    ('iva', 3, 'ivo', ('saliva', 'oliva')),
+    ('eira', 3, 'eiro', ('beira', 'cadeira', 'frigideira', 'bandeira', 'feira', 'capoeira', 'barreira',
+                         'fronteira', 'besteira', 'poeira')),
+)
+
+ADVERB_RULES = (
+    ('mente', 4, '', ('experimente',)),
+)
+
+AUGMENTATIVE_RULES = (
+    ('dissimo', 5, ''),
+    ('abilissimo', 5, ''),
+    ('issimo', 3, ''),
+    ('esimo', 3, ''),
+    ('errimo', 4, ''),
+    ('zinho', 2, ''),
+    ('quinho', 4, 'c'),
+    ('uinho', 4, ''),
+    ('adinho', 3, ''),
+    ('inho', 3, '', ('caminho', 'cominho')),
+    ('alhao', 4, ''),
+    ('uca', 4, '', ('maluca',)),
+    ('aca', 4, '', ('arraca', 'barraca', 'cloaca')),
+    ('zao', 2, '', ('coalizao',)),
+    ('arraz', 4, ''),
+    ('arra', 3, ''),
+)
+
+NOUN_RULES = (
+    ('encialista', 4, ''),
+    ('alista', 5, ''),
+    ('agem', 3, '', ('coragem', 'chantagem', 'vantagem', 'carruagem')),
+    ('iamento', 4, ''),
+    ('amento', 3, '', ('firmamento', 'fundamento', 'departamento')),
+    ('imento', 3, ''),
+    ('mento', 6, '', ('firmamento', 'elemento', 'complemento', 'instrumento', 'departamento')),
+    ('alizado', 4, ''),
+    ('atizado', 4, ''),
+    ('tizado', 4, '', ('alfabetizado',)),
+    ('izado', 5, '', ('organizado', 'pulverizado')),
+    ('ativo', 4, '', ('pejorativo', 'relativo')),
+    ('tivo', 4, '', ('relativo',)),
+    ('ivo', 4, '', ('passivo', 'possessivo', 'pejorativo', 'positivo')),
+    ('ado', 2, '', ('grado',)),
+    ('ido', 3, '', ('candido', 'consolido', 'rapido', 'decido', 'timido', 'duvido', 'marido')),
+    ('ador', 3, ''),
+    ('edor', 3, ''),
+    ('idor', 4, '', ('ouvidor',)),
+    ('dor', 4, '', ('ouvidor',)),
+    ('sor', 4, '', ('assessor',)),
+    ('atoria', 5, ''),
+    ('tor', 3, '', ('benfeitor', 'leitor', 'editor', 'pastor', 'produtor', 'promotor', 'consultor')),
+    ('abilidade', 5, ''),
+    ('icionista', 4, ''),
+    ('cionista', 5, ''),
+    ('ionista', 5, ''),
+    ('ionar', 5, ''),
+    ('ional', 4, ''),
+    ('encia', 3, ''),
+    ('ancia', 4, '', ('ambulancia',)),
+    ('izacao', 5, ''),
+    ('acao', 3, '', ('nacao', 'educacao', 'comunicacao')),
+    ('icao', 3, ''),
+    ('ucao', 3, ''),
+    ('cao', 4, ''),
+    ('idade', 4, '', ('autoridade', 'comunidade')),
+    ('edade', 3, ''),
+    ('ismo', 3, '', ('cinismo',)),
+    ('ista', 4, ''),
+    ('ico', 4, '', ('tico', 'publico', 'explico')),
+    ('eza', 3, ''),
+    ('ez', 4, ''),
+    ('ura', 4, '', ('imatura', 'acupuntura', 'costura')),
+    ('ario', 3, '', ('armario',)),
+    ('eiro', 3, '', ('desfiladeiro', 'pioneiro', 'mosteiro')),
+    ('oso', 3, '', ('precioso',)),
+    ('avel', 2, '', ('agradavel',)),
+    ('ivel', 5, '', ('possivel',)),
+    ('ante', 2, '', ('gigante', 'elefante', 'adiante', 'possante', 'instante', 'restaurante')),
+    ('al', 4, '', ('afinal', 'animal', 'estatal', 'bissexual', 'desleal', 'fiscal', 'formal', 'pessoal',
+                   'liberal', 'postal', 'virtual', 'visual', 'pontual', 'sideral', 'sucursal')),
+)
+
+VERB_RULES = (
+    ('ariamos', 2, ''), ('eriamos', 3, ''), ('iriamos', 3, ''),
+    ('assemos', 2, ''), ('essemos', 3, ''), ('issemos', 3, ''),
+    ('aramos', 2, ''), ('eramos', 3, ''), ('iramos', 3, ''),
+    ('avamos', 2, ''), ('aremos', 2, ''), ('eremos', 3, ''), ('iremos', 3, ''),
+    ('ariam', 2, ''), ('eriam', 3, ''), ('iriam', 3, ''),
+    ('assem', 2, ''), ('essem', 3, ''), ('issem', 3, ''),
+    ('arias', 2, ''), ('erias', 3, ''), ('irias', 3, ''),
+    ('ardes', 2, ''), ('erdes', 3, ''), ('irdes', 3, ''),
+    ('aram', 2, ''), ('eram', 3, ''), ('iram', 3, ''),
+    ('avam', 2, ''), ('arem', 2, ''), ('erem', 3, ''), ('irem', 3, ''),
+    ('ando', 2, ''), ('endo', 3, ''), ('indo', 3, ''),
+    ('ara', 2, ''), ('era', 3, ''), ('ira', 3, ''),
+    ('ava', 2, ''), ('ado', 2, ''), ('ido', 3, ''),
+    ('ar', 2, '', ('azar', 'bazaar', 'patamar')),
+    ('er', 2, ''), ('ir', 3, ''),
+    ('am', 2, ''), ('em', 2, ''),
+    ('ou', 3, ''), ('eu', 3, ''), ('iu', 3, ''),
+)
+
+VOWEL_RULES = (
+    ('a', 3, ''),
+    ('e', 3, ''),
+    ('o', 3, ''),
+)
+
+
+def fold_accents(token):
+    """Remove acentos e cedilha (decomposição NFKD sem as marcas combinantes)"""
+    decomposed = unicodedata.normalize('NFKD', token)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _is_exception(word, exceptions):
+    # Exceções sem acento valem também para a palavra com acentos ("atraves" -> "através")
+    return word in exceptions or fold_accents(word) in exceptions
+
+
+def _apply_rules(word, rules):
+    """Aplica a primeira regra que casar; retorna (palavra, se alguma regra foi aplicada)"""
+    for rule in rules:
+        suffix, min_stem, replacement = rule[:3]
+        if not word.endswith(suffix) or len(word) - len(suffix) < min_stem:
+            continue
+        if len(rule) > 3 and _is_exception(word, rule[3]):
+            continue
+        return word[:len(word) - len(suffix)] + replacement, True
+    return word, False
+
+
+def stem(word):
+    """Radical de uma palavra em minúsculas (com ou sem acentos), no estilo do RSLP; sem acentos"""
+    if len(word) < 3:
+        return fold_accents(word)
+    if word.endswith('s'):
+        word, _ = _apply_rules(word, PLURAL_RULES)
+    word = fold_accents(word)
+    if word.endswith('a'):
+        word, _ = _apply_rules(word, FEMININE_RULES)
+    word, _ = _apply_rules(word, ADVERB_RULES)
+    word, _ = _apply_rules(word, AUGMENTATIVE_RULES)
+    word, removed = _apply_rules(word, NOUN_RULES)
+    if not removed:
+        word, removed = _apply_rules(word, VERB_RULES)
+        if not removed:
+            word, _ = _apply_rules(word, VOWEL_RULES)
+    return word
+
+
+class Analyzer:
+    """Sequência de filtros aplicada a cada palavra, com cache por palavra.
+
+    ``normalizers`` só mudam a forma da palavra (maiúsculas) e vêm antes
+    de tudo. Cada filtro de ``filters`` recebe e retorna uma string;
+    ``None`` descarta a palavra (stopword). ``folding`` (acentos) vem por
+    último. ``normalize`` aplica só ``normalizers`` e ``folding``: é a
+    forma da palavra usada na busca por trecho de palavra, sem radical.
+    """
+
+    def __init__(self, name, normalizers, filters=(), folding=(), rules=None):
+        self.name = name
+        self.normalizers = tuple(normalizers)
+        self.filters = tuple(filters)
+        self.folding = tuple(folding)
+        self.rules = rules
+        self.analyze_token = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._analyze_token)
+        self.normalize = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._normalize)
+
+    def _normalize(self, token):
+        for normalizer in self.normalizers + self.folding:
+            token = normalizer(token)
+        return token
+
+    def _analyze_token(self, token):
+        for normalizer in self.normalizers:
+            token = normalizer(token)
+        for token_filter in self.filters:
+            token = token_filter(token)
+            if not token:
+                return None
+        for fold in self.folding:
+            token = fold(token)
+        return token
+
+    def tokens(self, text):
+        """(termo, offset no texto original) de cada palavra, com None nas descartadas"""
+        analyze_token = self.analyze_token
+        for match in TOKEN_RE.finditer(text):
+            yield analyze_token(match.group()), match.start()
+
+    def forms(self, text):
+        """(forma normalizada, termo, offset no texto original) de cada palavra, termo None nas descartadas"""
+        analyze_token, normalize = self.analyze_token, self.normalize
+        for match in TOKEN_RE.finditer(text):
+            token = match.group()
+            yield normalize(token), analyze_token(token), match.start()
+
+    def analyze(self, text):
+        """(termo, ordinal, offset no texto original) de cada palavra que não é descartada.
+
+        O ordinal conta todas as palavras do texto, inclusive as descartadas,
+        para que frases e proximidade meçam a distância real entre os termos.
+        """
+        for ordinal, (term, offset) in enumerate(self.tokens(text)):
+            if term is not None:
+                yield term, ordinal, offset
+
+    def signature(self):
+        """Descrição serializável do analisador (chave de cache do índice)"""
+        return {
+            'name': self.name,
+            'version': ANALYZER_VERSION,
+            'normalizers': [f.__name__ for f in self.normalizers],
+            'filters': [f.__name__ for f in self.filters],
+            'folding': [f.__name__ for f in self.folding],
+            'rules': self.rules
+        }
+
+
+def _casefold(token):
+    return token.casefold()
+
+
+@lru_cache(maxsize=None)
+def _portuguese(stopwords):
+    folded_stopwords = frozenset(fold_accents(word.casefold()) for word in stopwords)
+
+    def remove_stopwords(token):
+        return None if fold_accents(token) in folded_stopwords else token
+
+    return Analyzer(
+        'portuguese',
+        normalizers=(_casefold,),
+        filters=(remove_stopwords, stem),
+        folding=(fold_accents,),
+        rules={
+            'stopwords': sorted(stopwords),
+            'plural': PLURAL_RULES, 'feminine': FEMININE_RULES, 'adverb': ADVERB_RULES,
+            'augmentative': AUGMENTATIVE_RULES, 'noun': NOUN_RULES, 'verb': VERB_RULES, 'vowel': VOWEL_RULES
+        }
+    )
+
+
+def portuguese(stopwords):
+    """Analisador português que descarta ``stopwords`` (o mesmo objeto, e cache, para a mesma lista)"""
+    return _portuguese(frozenset(stopwords))
+
+
+# Só minúsculas, como o índice anterior (para comparação e livros em outras línguas)
+SIMPLE = Analyzer('simple', normalizers=(_casefold,))
@@ -0,0 +1,644 @@
+"""Índice invertido posicional da busca do FLUX-ON Reader.
+
+Cada página passa uma única vez pelo analisador (search_analyzer.py), que
+separa as palavras e as reduz a termos. Para cada termo, o índice guarda
+as páginas em que ele aparece e, para cada página, os offsets (em
+caracteres, no texto original da página) e o número de ordem (contando
+todas as palavras da página, inclusive as stopwords descartadas) de cada
+ocorrência. Guarda também o offset do início de cada palavra de cada
+página (inclusive as stopwords), para que o contexto de uma ocorrência
+seja recortado direto do texto, sem separar a página em palavras. Tudo
+fica em sete buffers ``array('I')`` contíguos, no formato CSR:
+
+- ``page_bounds[t]:page_bounds[t + 1]`` delimita, em ``pages``, as páginas
+  (base 1, em ordem crescente) do termo de id ``t``
+- ``position_bounds[p]:position_bounds[p + 1]`` delimita, em ``positions``,
+  os offsets da p-ésima entrada de ``pages``; ``ordinals`` é paralelo a
+  ``positions``
+- ``token_bounds[p - 1]:token_bounds[p]`` delimita, em ``token_offsets``,
+  os offsets das palavras da página ``p``, na ordem (o ordinal da palavra
+  é o índice nesse intervalo)
+
+Os ids dos termos seguem a ordem alfabética do vocabulário (``terms``).
+O índice guarda também o vocabulário de superfície (``surfaces``): as
+palavras como aparecem no texto, só normalizadas (sem maiúsculas e sem
+acentos, sem radical), em ordem alfabética, com o id do termo de cada uma
+em ``surface_terms``. A busca por trecho de palavra procura o trecho nesse
+vocabulário ("passad" está em "passado", não no radical "pass") por um
+índice de trigramas, construído no primeiro uso, ou, em trechos curtos,
+pelo intervalo contíguo das formas com o prefixo, achado por ``bisect``.
+A busca tolerante a erros de digitação (``terms_within``) percorre uma
+trie do vocabulário de superfície, também construída no primeiro uso, com
+um autômato de Levenshtein da palavra digitada (normalizada, sem radical:
+o radical de um erro de digitação raramente é parecido com o certo): o
+estado de um prefixo vale para todas as palavras que começam com ele, e um
+prefixo já distante demais descarta a subárvore. As palavras encontradas
+valem pelos seus termos.
+``bm25`` pontua as páginas para um conjunto de termos direto das listas
+de ocorrências. Frases (``phrase_matches``) e proximidade (``near_matches``)
+são resolvidas pela interseção das listas posicionais, a partir do termo
+mais raro. ``occurrences`` lista as ocorrências de termos na ordem do
+livro (a concordância) e ``token_window`` dá os limites, em caracteres, do
+contexto de uma ocorrência.
+
+``save``/``load`` gravam o índice em um diretório (o cache de artefatos de
+precompute.py) em um formato que é mapeado em memória ao abrir, sem cópia
+nem decodificação dos arrays:
+
+- ``vocabulary.txt``: os termos em ordem alfabética, um por linha (UTF-8)
+- ``surfaces.txt``: o vocabulário de superfície, no mesmo formato
+- ``postings.bin``: ``page_bounds``, ``pages``, ``position_bounds``,
+  ``positions`` e ``ordinals``, em sequência (uint32)
+- ``docs.bin``: a tabela das páginas, ``token_bounds`` e ``token_offsets``
+- ``trigrams.txt`` e ``lexicon.bin``: ``surface_terms``, o índice de
+  trigramas (em CSR) e a trie do vocabulário de superfície, que assim não são
+  reconstruídos a cada processo
+- ``index.json``: tamanho de cada array, alfabeto da trie, chave e ordem
+  dos bytes; gravado por último, marca o diretório como completo
+
+Os buffers do índice aberto são ``memoryview`` sobre o ``mmap`` dos
+arquivos: a primeira busca de uma sessão nova lê as mesmas páginas já
+carregadas pelo sistema, e processos diferentes compartilham o cache de
+páginas do sistema operacional.
+"""
+
+import bisect
+import json
+import math
+import mmap
+import os
+import sys
+import threading
+from array import array
+
+import numpy as np
+
+ARRAY_NAMES = ('page_bounds', 'pages', 'position_bounds', 'positions', 'ordinals',
+               'token_bounds', 'token_offsets', 'surface_terms')
+
+# Arquivos do índice gravado (save/load) e os arrays de cada um, na ordem
+INDEX_FORMAT_VERSION = 3
+HEADER_FILE = 'index.json'
+VOCABULARY_FILE = 'vocabulary.txt'
+SURFACES_FILE = 'surfaces.txt'
+TRIGRAMS_FILE = 'trigrams.txt'
+INDEX_FILES = {
+    'postings.bin': ('page_bounds', 'pages', 'position_bounds', 'positions', 'ordinals'),
+    'docs.bin': ('token_bounds', 'token_offsets'),
+    'lexicon.bin': ('surface_terms', 'trigram_bounds', 'trigram_terms', 'trie_chars', 'trie_surfaces',
+                    'trie_child_bounds')
+}
+
+# Maior code point: ``prefixo + TERM_MAX`` vem depois de todo termo com o prefixo
+TERM_MAX = '\U0010ffff'
+NGRAM = 3
+
+# Distância de edição tolerada conforme o tamanho da palavra (até 3 letras: nenhuma)
+FUZZY_MIN_LENGTH = 4
+FUZZY_TWO_EDITS_LENGTH = 7
+# Estados do autômato em uint64: um bit por prefixo da palavra
+FUZZY_MAX_LENGTH = 63
+
+# Parâmetros usuais do BM25: saturação da frequência e peso do tamanho da página
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def _map_uint32(path):
+    """Arquivo de uint32 mapeado em memória (somente leitura), como ``memoryview``"""
+    with open(path, 'rb') as file:
+        # mmap não aceita arquivos vazios (índice sem ocorrências)
+        if not os.fstat(file.fileno()).st_size:
+            return memoryview(array('I'))
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast('I')
+
+
+def _read_lines(path):
+    with open(path, 'rb') as file:
+        text = file.read().decode('utf-8')
+    return text.split('\n') if text else []
+
+
+def fuzzy_distance(word):
+    """Distância de edição tolerada para ``word``: 0, 1 ou 2 conforme o tamanho"""
+    if len(word) < FUZZY_MIN_LENGTH:
+        return 0
+    return 1 if len(word) < FUZZY_TWO_EDITS_LENGTH else 2
+
+
+class PositionalIndex:
+    """Índice invertido posicional: termo -> páginas -> offsets das ocorrências"""
+
+    def __init__(self, terms, surfaces, page_bounds, pages, position_bounds, positions, ordinals,
+                 token_bounds, token_offsets, surface_terms):
+        self.terms = terms
+        self.term_ids = {term: term_id for term_id, term in enumerate(terms)}
+        # Formas normalizadas (sem radical) e o id do termo de cada uma
+        self.surfaces = surfaces
+        self.surface_terms = surface_terms
+        self.page_bounds = page_bounds
+        self.pages = pages
+        self.position_bounds = position_bounds
+        self.positions = positions
+        self.ordinals = ordinals
+        # Buffers ``array('I')`` (índice construído) ou ``memoryview`` do mmap (índice carregado)
+        self.token_bounds = token_bounds
+        self.token_offsets = token_offsets
+        self._trigrams = None
+        self._trigrams_lock = threading.Lock()
+        self._trie_arrays = None
+        self._trie_lock = threading.Lock()
+
+    @classmethod
+    def build(cls, texts, analyzer):
+        """Indexa ``texts`` (uma string por página) em uma passagem por página"""
+        postings = {}
+        surface_forms = {}
+        token_bounds = array('I', [0])
+        token_offsets = array('I')
+        for page, text in enumerate(texts, start=1):
+            for ordinal, (surface, term, offset) in enumerate(analyzer.forms(text)):
+                token_offsets.append(offset)
+                if term is None:
+                    continue
+                surface_forms[surface] = term
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = (array('I'), array('I'), array('I'), array('I'))
+                term_pages, term_bounds, term_positions, term_ordinals = entry
+                if not term_pages or term_pages[-1] != page:
+                    term_pages.append(page)
+                    term_bounds.append(len(term_positions))
+                term_positions.append(offset)
+                term_ordinals.append(ordinal)
+            token_bounds.append(len(token_offsets))
+
+        terms = sorted(postings)
+        term_ids = {term: term_id for term_id, term in enumerate(terms)}
+        surfaces = sorted(surface_forms)
+        surface_terms = array('I', (term_ids[surface_forms[surface]] for surface in surfaces))
+        page_bounds = array('I', [0])
+        pages = array('I')
+        position_bounds = array('I', [0])
+        positions = array('I')
+        ordinals = array('I')
+        for term in terms:
+            term_pages, term_bounds, term_positions, term_ordinals = postings[term]
+            base = len(positions)
+            pages.extend(term_pages)
+            position_bounds.extend(base + bound for bound in term_bounds[1:])
+            position_bounds.append(base + len(term_positions))
+            positions.extend(term_positions)
+            ordinals.extend(term_ordinals)
+            page_bounds.append(len(pages))
+
+        return cls(terms, surfaces, page_bounds, pages, position_bounds, positions, ordinals,
+                   token_bounds, token_offsets, surface_terms)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return term in self.term_ids
+
+    def prefix_surface_ids(self, prefix):
+        """Intervalo de ids das formas normalizadas que começam com ``prefix``"""
+        start = bisect.bisect_left(self.surfaces, prefix)
+        return range(start, bisect.bisect_left(self.surfaces, prefix + TERM_MAX, start))
+
+    def _surface_terms(self, surface_ids):
+        """Termos (sem repetição, em ordem alfabética) das formas ``surface_ids``"""
+        return [self.terms[term_id] for term_id in sorted({self.surface_terms[i] for i in surface_ids})]
+
+    def _trigram_index(self):
+        """Trigrama -> ids (crescentes) das formas normalizadas que o contêm"""
+        if self._trigrams is None:
+            with self._trigrams_lock:
+                if self._trigrams is None:
+                    trigrams = {}
+                    for surface_id, surface in enumerate(self.surfaces):
+                        for gram in {surface[i:i + NGRAM] for i in range(len(surface) - NGRAM + 1)}:
+                            surface_ids = trigrams.get(gram)
+                            if surface_ids is None:
+                                surface_ids = trigrams[gram] = array('I')
+                            surface_ids.append(surface_id)
+                    self._trigrams = trigrams
+        return self._trigrams
+
+    def terms_containing(self, fragment):
+        """Termos das palavras que contêm ``fragment`` (normalizado, sem radical), em ordem alfabética.
+
+        Fragmentos com menos de três letras casariam com boa parte do
+        vocabulário; para eles vale apenas o prefixo.
+        """
+        if len(fragment) < NGRAM:
+            return self._surface_terms(self.prefix_surface_ids(fragment))
+
+        trigrams = self._trigram_index()
+        candidates = None
+        for gram in {fragment[i:i + NGRAM] for i in range(len(fragment) - NGRAM + 1)}:
+            surface_ids = trigrams.get(gram)
+            if surface_ids is None:
+                return []
+            if candidates is None or len(surface_ids) < len(candidates):
+                candidates = surface_ids
+        # O trigrama mais raro limita os candidatos; a conferência final é exata
+        return self._surface_terms(i for i in candidates if fragment in self.surfaces[i])
+
+    def _trie(self):
+        """Trie do vocabulário de superfície em arrays, nível a nível (construída no primeiro uso).
+
+        Os nós ficam em ordem de largura: os filhos de ``n`` são o intervalo
+        ``child_bounds[n]:child_bounds[n + 1]``. ``chars`` traz o código da
+        letra de cada nó (índice em ``alphabet``) e ``surface_at`` o id da
+        forma que termina nele (-1 se nenhuma).
+        """
+        if self._trie_arrays is None:
+            with self._trie_lock:
+                if self._trie_arrays is None:
+                    alphabet = {}
+                    depths, chars, parents, surface_at = array('I', [0]), array('I', [0]), array('i', [-1]), array('i', [-1])
+                    path = [0]
+                    previous = ''
+                    for surface_id, surface in enumerate(self.surfaces):
+                        common = 0
+                        limit = min(len(previous), len(surface))
+                        while common < limit and previous[common] == surface[common]:
+                            common += 1
+                        del path[common + 1:]
+                        for depth in range(common, len(surface)):
+                            parents.append(path[-1])
+                            path.append(len(depths))
+                            depths.append(depth + 1)
+                            chars.append(alphabet.setdefault(surface[depth], len(alphabet)))
+                            surface_at.append(-1)
+                        surface_at[path[-1]] = surface_id
+                        previous = surface
+
+                    # Da ordem de profundidade (alfabética) para a de largura: a ordenação
+                    # estável mantém os filhos de cada nó juntos e na ordem dos pais
+                    order = np.argsort(np.frombuffer(depths, dtype=np.uint32), kind='stable')
+                    rank = np.empty_like(order)
+                    rank[order] = np.arange(len(order))
+                    parents = np.frombuffer(parents, dtype=np.int32)[order]
+                    bfs_parents = rank[parents[1:]]
+                    child_bounds = np.searchsorted(bfs_parents, np.arange(len(order) + 1)) + 1
+                    self._trie_arrays = (
+                        alphabet,
+                        np.frombuffer(chars, dtype=np.uint32)[order],
+                        np.frombuffer(surface_at, dtype=np.int32)[order],
+                        child_bounds
+                    )
+        return self._trie_arrays
+
+    def terms_within(self, word, max_distance):
+        """(termo, distância) dos termos das palavras a até ``max_distance`` edições de ``word``.
+
+        ``word`` é a palavra digitada, só normalizada (sem radical); cada
+        termo vem com a menor distância entre as suas palavras. Autômato de
+        Levenshtein de ``word`` simulado em paralelo de bits: o bit ``i`` de
+        ``state[d]`` indica que ``word[:i]`` casa com o prefixo lido com até
+        ``d`` edições. A trie do vocabulário de superfície é percorrida nível
+        a nível, com os estados de todos os nós do nível em arrays uint64;
+        um nó sem estado vivo descarta a subárvore inteira.
+        """
+        if len(word) >= FUZZY_MAX_LENGTH:
+            position = bisect.bisect_left(self.surfaces, word)
+            if position < len(self.surfaces) and self.surfaces[position] == word:
+                return [(term, 0) for term in self._surface_terms([position])]
+            return []
+        alphabet, chars, surface_at, child_bounds = self._trie()
+        full = np.uint64((1 << (len(word) + 1)) - 1)
+        goal = np.uint64(1 << len(word))
+        char_masks = np.zeros(len(alphabet) + 1, dtype=np.uint64)
+        for i, char in enumerate(word, start=1):
+            code = alphabet.get(char)
+            if code is not None:
+                char_masks[code] |= np.uint64(1 << i)
+
+        nodes = np.zeros(1, dtype=np.intp)
+        states = [np.array([((1 << (d + 1)) - 1)], dtype=np.uint64) & full for d in range(max_distance + 1)]
+        found_ids, found_distances = [], []
+        while len(nodes):
+            starts = child_bounds[nodes]
+            counts = child_bounds[nodes + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                break
+            # Filhos de todos os nós vivos e a posição do pai de cada um
+            parent_slots = np.repeat(np.arange(len(nodes)), counts)
+            children = np.arange(total) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+            masks = char_masks[chars[children]]
+            next_states = []
+            for d, bits in enumerate(states):
+                bits = bits[parent_slots]
+                # Acerto; com uma edição a mais: inserção, substituição e remoção
+                advanced = (bits << np.uint64(1)) & masks
+                if d:
+                    advanced |= previous | (previous << np.uint64(1)) | (next_states[-1] << np.uint64(1))
+                next_states.append(advanced & full)
+                previous = bits
+            alive = next_states[-1] != 0
+            nodes = children[alive]
+            states = [bits[alive] for bits in next_states]
+
+            surface_ids = surface_at[nodes]
+            hits = (surface_ids >= 0) & ((states[-1] & goal) != 0)
+            if hits.any():
+                reached = np.stack([(bits[hits] & goal) != 0 for bits in states])
+                found_ids.append(surface_ids[hits])
+                found_distances.append(reached.argmax(axis=0))
+        if not found_ids:
+            return []
+        term_ids = np.frombuffer(self.surface_terms, dtype=np.uint32)[np.concatenate(found_ids)]
+        distances = {}
+        for term_id, distance in zip(term_ids.tolist(), np.concatenate(found_distances).tolist()):
+            distances[term_id] = min(distance, distances.get(term_id, distance))
+        return [(self.terms[term_id], distances[term_id]) for term_id in sorted(distances)]
+
+    def _page_range(self, term):
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            return range(0)
+        return range(self.page_bounds[term_id], self.page_bounds[term_id + 1])
+
+    def term_pages(self, term):
+        """Páginas (base 1) em que ``term`` aparece"""
+        entries = self._page_range(term)
+        return self.pages[entries.start:entries.stop]
+
+    def document_frequency(self, term):
+        return len(self._page_range(term))
+
+    def _page_entry(self, entries, page):
+        """Entrada de ``page`` no intervalo ``entries`` de ``pages`` (None se não houver)"""
+        entry = bisect.bisect_left(self.pages, page, entries.start, entries.stop)
+        if entry == entries.stop or self.pages[entry] != page:
+            return None
+        return entry
+
+    def positions_on_page(self, term, page):
+        """Offsets das ocorrências de ``term`` em ``page`` (vazio se não houver)"""
+        entry = self._page_entry(self._page_range(term), page)
+        if entry is None:
+            return self.positions[0:0]
+        return self.positions[self.position_bounds[entry]:self.position_bounds[entry + 1]]
+
+    def _common_pages(self, terms, pages=None):
+        """(página, entradas de cada termo) das páginas em que todos os ``terms`` aparecem.
+
+        Percorre só as páginas do termo mais raro (ou as candidatas ``pages``,
+        se forem menos); nos demais, cada página é procurada por ``bisect``
+        dentro da própria lista.
+        """
+        ranges = [self._page_range(term) for term in terms]
+        if not all(ranges):
+            return
+        rarest = min(ranges, key=len)
+        if pages is not None and len(pages) < len(rarest):
+            # Menos candidatas que páginas do termo mais raro: elas é que são percorridas
+            anchors = ((page, None) for page in pages)
+            allowed = None
+        else:
+            anchors = ((self.pages[anchor], anchor) for anchor in rarest)
+            allowed = None if pages is None else set(pages)
+        for page, anchor in anchors:
+            if allowed is not None and page not in allowed:
+                continue
+            entries = []
+            for entry_range in ranges:
+                if entry_range is rarest and anchor is not None:
+                    entry = anchor
+                else:
+                    entry = self._page_entry(entry_range, page)
+                if entry is None:
+                    break
+                entries.append(entry)
+            else:
+                yield page, entries
+
+    def _occurrences(self, entry):
+        """(ordinais, offsets) da entrada ``entry`` de ``pages``"""
+        start, end = self.position_bounds[entry], self.position_bounds[entry + 1]
+        return self.ordinals[start:end], self.positions[start:end]
+
+    def phrase_matches(self, query_terms, pages=None):
+        """Ocorrências de uma frase: página -> offsets do primeiro termo.
+
+        ``query_terms`` traz (termo, ordinal na consulta) de cada palavra
+        indexada da frase; as stopwords descartadas ficam como lacunas entre
+        os ordinais. Há ocorrência quando todos os termos aparecem na página
+        com a mesma distância entre os ordinais que têm na consulta. Com
+        ``pages``, só essas páginas são consideradas.
+        """
+        if not query_terms:
+            return {}
+        terms = [term for term, _ in query_terms]
+        shifts = [ordinal - query_terms[0][1] for _, ordinal in query_terms]
+        matches = {}
+        for page, entries in self._common_pages(terms, pages):
+            first_ordinals, first_offsets = self._occurrences(entries[0])
+            starts = set(first_ordinals)
+            for entry, shift in zip(entries[1:], shifts[1:]):
+                starts.intersection_update(ordinal - shift for ordinal in self._occurrences(entry)[0])
+                if not starts:
+                    break
+            if starts:
+                matches[page] = [offset for ordinal, offset in zip(first_ordinals, first_offsets)
+                                 if ordinal in starts]
+        return matches
+
+    def near_matches(self, terms, distances, pages=None):
+        """Ocorrências de ``a NEAR/k b NEAR/j c ...``: página -> trechos (offset inicial, offset final).
+
+        Cada par de termos consecutivos precisa estar a no máximo
+        ``distances[i]`` palavras um do outro, em qualquer ordem. Os offsets
+        são os do início da primeira e da última palavra do trecho. Com
+        ``pages``, só essas páginas são consideradas.
+        """
+        if not terms or len(distances) != len(terms) - 1:
+            return {}
+        matches = {}
+        for page, entries in self._common_pages(terms, pages):
+            # Ocorrências alcançáveis do termo atual: (ordinal, offset, início, fim do trecho)
+            ordinals, offsets = self._occurrences(entries[0])
+            reachable = [(ordinal, offset, offset, offset) for ordinal, offset in zip(ordinals, offsets)]
+            for entry, distance in zip(entries[1:], distances):
+                previous = [item[0] for item in reachable]
+                ordinals, offsets = self._occurrences(entry)
+                current = []
+                for ordinal, offset in zip(ordinals, offsets):
+                    low = bisect.bisect_left(previous, ordinal - distance)
+                    high = bisect.bisect_right(previous, ordinal + distance)
+                    if low < high:
+                        # A ocorrência anterior mais próxima dá o trecho mais curto
+                        nearest = min(range(low, high), key=lambda i: abs(previous[i] - ordinal))
+                        _, _, start, end = reachable[nearest]
+                        current.append((ordinal, offset, min(start, offset), max(end, offset)))
+                reachable = current
+                if not reachable:
+                    break
+            if reachable:
+                matches[page] = sorted({(start, end) for _, _, start, end in reachable})
+        return matches
+
+    def bm25(self, term_groups, doc_lengths, k1=BM25_K1, b=BM25_B):
+        """Pontuação BM25 e número de ocorrências em cada página.
+
+        Cada item de ``term_groups`` é um termo da consulta ou um grupo de
+        termos que contam como um só (ex.: as expansões de um trecho de
+        palavra). ``doc_lengths`` é o tamanho (em palavras) de cada página.
+        Retorna dois arrays indexados pela página (base 1; a posição 0 fica
+        zerada).
+        """
+        doc_lengths = np.asarray(doc_lengths, dtype=np.float64)
+        doc_count = len(doc_lengths)
+        scores = np.zeros(doc_count + 1)
+        counts = np.zeros(doc_count + 1, dtype=np.int64)
+
+        average_length = doc_lengths.mean() if doc_count else 0.0
+        if average_length <= 0:
+            average_length = 1.0
+        # Denominador do BM25 por página, sem a frequência do termo
+        length_norm = np.concatenate(([k1], k1 * (1 - b + b * doc_lengths / average_length)))
+
+        all_pages = np.frombuffer(self.pages, dtype=np.uint32)
+        bounds = np.frombuffer(self.position_bounds, dtype=np.uint32)
+        for group in term_groups:
+            frequencies = np.zeros(doc_count + 1)
+            for term in ((group,) if isinstance(group, str) else group):
+                entries = self._page_range(term)
+                if entries:
+                    frequencies[all_pages[entries.start:entries.stop]] += np.diff(
+                        bounds[entries.start:entries.stop + 1])
+            pages = np.flatnonzero(frequencies)
+            if not len(pages):
+                continue
+            idf = math.log(1 + (doc_count - len(pages) + 0.5) / (len(pages) + 0.5))
+            page_frequencies = frequencies[pages]
+            scores[pages] += idf * page_frequencies * (k1 + 1) / (page_frequencies + length_norm[pages])
+            counts[pages] += page_frequencies.astype(np.int64)
+        return scores, counts
+
+    def postings(self, term):
+        """(página, offsets) de cada página em que ``term`` aparece"""
+        for entry in self._page_range(term):
+            start, end = self.position_bounds[entry], self.position_bounds[entry + 1]
+            yield self.pages[entry], self.positions[start:end]
+
+    def occurrences(self, terms):
+        """(páginas, ordinais, offsets) de todas as ocorrências de ``terms``, na ordem do livro.
+
+        Arrays numpy paralelos, montados sem percorrer as ocorrências em Python.
+        """
+        bounds = np.frombuffer(self.position_bounds, dtype=np.uint32)
+        indices = [np.arange(bounds[entries.start], bounds[entries.stop], dtype=np.intp)
+                   for entries in map(self._page_range, terms) if entries]
+        if not indices:
+            empty = np.zeros(0, dtype=np.uint32)
+            return empty, empty, empty
+        indices = np.concatenate(indices)
+        # Entrada de ``pages`` de cada ocorrência
+        entries = np.searchsorted(bounds, indices, side='right') - 1
+        pages = np.frombuffer(self.pages, dtype=np.uint32)[entries]
+        ordinals = np.frombuffer(self.ordinals, dtype=np.uint32)[indices]
+        offsets = np.frombuffer(self.positions, dtype=np.uint32)[indices]
+        if len(terms) > 1:
+            order = np.lexsort((offsets, pages))
+            pages, ordinals, offsets = pages[order], ordinals[order], offsets[order]
+        return pages, ordinals, offsets
+
+    def page_tokens(self, page):
+        """Offsets do início de cada palavra de ``page`` (o índice é o ordinal)"""
+        return self.token_offsets[self.token_bounds[page - 1]:self.token_bounds[page]]
+
+    def token_window(self, page, first, last, before, after):
+        """(início, fim) em caracteres das palavras ``first - before`` a ``last + after`` de ``page``.
+
+        O fim é o início da palavra seguinte à janela (None se a janela vai
+        até o fim da página), para que a pontuação colada à última palavra
+        venha junto.
+        """
+        base, stop = self.token_bounds[page - 1], self.token_bounds[page]
+        start = self.token_offsets[base + max(0, first - before)]
+        following = base + last + after + 1
+        return start, self.token_offsets[following] if following < stop else None
+
+    def _lexicon_arrays(self):
+        """(trigramas, alfabeto, arrays do léxico) para gravação"""
+        trigrams = self._trigram_index()
+        grams = sorted(trigrams)
+        trigram_bounds = np.cumsum([0] + [len(trigrams[gram]) for gram in grams])
+        trigram_terms = [np.frombuffer(trigrams[gram], dtype=np.uint32) for gram in grams]
+        alphabet, chars, surface_at, child_bounds = self._trie()
+        arrays = {
+            'trigram_bounds': trigram_bounds,
+            'trigram_terms': np.concatenate(trigram_terms) if trigram_terms else np.zeros(0),
+            'trie_chars': chars,
+            'trie_surfaces': surface_at,
+            'trie_child_bounds': child_bounds
+        }
+        # Tudo em 4 bytes; trie_surfaces usa -1 (nó sem forma) e é relido como int32
+        arrays = {name: values.astype(np.int32 if name == 'trie_surfaces' else np.uint32) for name, values in arrays.items()}
+        return grams, ''.join(alphabet), arrays
+
+    def save(self, directory, key=''):
+        """Grava o índice em ``directory`` (ver o formato no início do módulo)"""
+        os.makedirs(directory, exist_ok=True)
+        grams, alphabet, arrays = self._lexicon_arrays()
+        arrays.update({name: getattr(self, name) for name in ARRAY_NAMES})
+        for filename, lines in ((VOCABULARY_FILE, self.terms), (SURFACES_FILE, self.surfaces),
+                                (TRIGRAMS_FILE, grams)):
+            with open(os.path.join(directory, filename), 'wb') as file:
+                file.write('\n'.join(lines).encode('utf-8'))
+        for filename, names in INDEX_FILES.items():
+            with open(os.path.join(directory, filename), 'wb') as file:
+                for name in names:
+                    file.write(arrays[name])
+        header = {
+            'format_version': INDEX_FORMAT_VERSION,
+            'key': key,
+            'byteorder': sys.byteorder,
+            'alphabet': alphabet,
+            'lengths': {name: len(values) for name, values in arrays.items()}
+        }
+        with open(os.path.join(directory, HEADER_FILE), 'w', encoding='utf-8') as file:
+            json.dump(header, file)
+
+    @classmethod
+    def load(cls, directory, key=None):
+        """Índice gravado por ``save``, mapeado em memória (None se ausente, incompleto ou de outra chave)"""
+        try:
+            with open(os.path.join(directory, HEADER_FILE), encoding='utf-8') as file:
+                header = json.load(file)
+            if header['format_version'] != INDEX_FORMAT_VERSION or header['byteorder'] != sys.byteorder:
+                return None
+            if key is not None and header['key'] != key:
+                return None
+            terms, surfaces, grams = (_read_lines(os.path.join(directory, filename))
+                                      for filename in (VOCABULARY_FILE, SURFACES_FILE, TRIGRAMS_FILE))
+
+            buffers = {}
+            for filename, names in INDEX_FILES.items():
+                data = _map_uint32(os.path.join(directory, filename))
+                start = 0
+                for name in names:
+                    length = header['lengths'][name]
+                    buffers[name] = data[start:start + length]
+                    start += length
+                if start != len(data):
+                    return None
+        except (OSError, ValueError, KeyError):
+            return None
+
+        index = cls(terms, surfaces, *(buffers[name] for name in ARRAY_NAMES))
+        bounds, term_ids = buffers['trigram_bounds'], buffers['trigram_terms']
+        index._trigrams = {gram: term_ids[bounds[i]:bounds[i + 1]] for i, gram in enumerate(grams)}
+        index._trie_arrays = (
+            {char: code for code, char in enumerate(header['alphabet'])},
+            np.frombuffer(buffers['trie_chars'], dtype=np.uint32),
+            np.frombuffer(buffers['trie_surfaces'], dtype=np.int32),
+            np.frombuffer(buffers['trie_child_bounds'], dtype=np.uint32).astype(np.intp)
+        )
+        return index
@@ -0,0 +1,297 @@
+"""Linguagem de consulta booleana da busca do FLUX-ON Reader.
+
+Exemplo: ``deus AND (fé OR igreja) -ritual "caos do passado"``
+
+- ``AND``, ``OR`` e ``NOT`` (em maiúsculas) combinam os critérios; entre
+  dois critérios sem operador vale ``AND``
+- ``-palavra`` (ou ``-"frase"``, ``-(...)``) exclui as páginas do critério
+- ``"..."`` é uma frase exata e ``a NEAR/k b`` exige as palavras a até
+  ``k`` palavras de distância
+- parênteses agrupam; ``AND`` tem precedência sobre ``OR``
+
+``parse`` monta a árvore da consulta e ``evaluate`` devolve as páginas
+(base 1, em ordem crescente) que a satisfazem. As folhas (``Term``,
+``Phrase``, ``Near``) são resolvidas por um objeto do chamador, que
+informa o custo estimado de cada uma (tamanho da lista de páginas) e suas
+páginas, opcionalmente restritas a uma lista de candidatas. Em um ``AND``
+os critérios são avaliados do mais barato para o mais caro, cada um só
+sobre as páginas que restaram dos anteriores; as exclusões vêm por último.
+A interseção de listas ordenadas avança na lista maior por ponteiros de
+salto (a cada ~raiz do tamanho da lista).
+
+O analisador é tolerante: parênteses sem par e operadores soltos são
+ignorados, em vez de gerar erro para o leitor.
+"""
+
+import math
+import re
+
+TOKEN_RE = re.compile(r'''
+    \s*(?:
+        (?P<phrase>"[^"]*"?)
+      | (?P<near>NEAR/\d+)
+      | (?P<open>\()
+      | (?P<close>\))
+      | (?P<minus>-)(?=[^\s)])
+      | (?P<word>[^\s()"]+)
+    )''', re.VERBOSE)
+
+KEYWORDS = ('AND', 'OR', 'NOT')
+WORD_CHAR_RE = re.compile(r'\w')
+
+
+class Term:
+    """Palavra (ou palavras, como em "bem-estar") que precisam aparecer na página"""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return f"Term({self.text!r})"
+
+
+class Phrase:
+    """Frase exata (entre aspas)"""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return f"Phrase({self.text!r})"
+
+
+class Near:
+    """Palavras próximas: ``text`` no formato ``a NEAR/k b [NEAR/j c ...]``"""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return f"Near({self.text!r})"
+
+
+class And:
+    __slots__ = ('children',)
+
+    def __init__(self, children):
+        self.children = children
+
+    def __repr__(self):
+        return f"And({self.children!r})"
+
+
+class Or:
+    __slots__ = ('children',)
+
+    def __init__(self, children):
+        self.children = children
+
+    def __repr__(self):
+        return f"Or({self.children!r})"
+
+
+class Not:
+    __slots__ = ('child',)
+
+    def __init__(self, child):
+        self.child = child
+
+    def __repr__(self):
+        return f"Not({self.child!r})"
+
+
+LEAVES = (Term, Phrase, Near)
+
+
+def tokenize(query):
+    """(tipo, texto) de cada elemento da consulta"""
+    tokens = []
+    for match in TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        text = match.group(kind)
+        if kind == 'word' and text in KEYWORDS:
+            kind = text
+        tokens.append((kind, text))
+    return tokens
+
+
+def has_operators(query):
+    """Se a consulta usa algo da linguagem booleana (senão, vale a busca simples)"""
+    return any(kind != 'word' for kind, _ in tokenize(query))
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index][0] if self.index < len(self.tokens) else None
+
+    def take(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def parse(self):
+        node = self.parse_or()
+        while self.index < len(self.tokens):
+            # ")" sem par: descarta e continua
+            self.take()
+            rest = self.parse_or()
+            node = _combine(And, [node, rest])
+        return node
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.peek() == 'OR':
+            self.take()
+            children.append(self.parse_and())
+        return _combine(Or, children)
+
+    def parse_and(self):
+        children = []
+        while self.peek() not in (None, 'OR', 'close'):
+            if self.peek() == 'AND':
+                self.take()
+                continue
+            children.append(self.parse_unary())
+        return _combine(And, children)
+
+    def parse_unary(self):
+        if self.peek() in ('minus', 'NOT'):
+            self.take()
+            if self.peek() in (None, 'OR', 'close', 'AND'):
+                return None
+            child = self.parse_unary()
+            return Not(child) if child is not None else None
+        return self.parse_primary()
+
+    def parse_primary(self):
+        kind, text = self.take()
+        if kind == 'open':
+            node = self.parse_or()
+            if self.peek() == 'close':
+                self.take()
+            return node
+        if kind == 'phrase':
+            phrase = text.strip('"').strip()
+            return Phrase(phrase) if phrase else None
+        if kind == 'word':
+            if not WORD_CHAR_RE.search(text):
+                # Pontuação solta, como em "caos - ordem"
+                return None
+            words = [text]
+            while self.peek() == 'near' and self.index + 1 < len(self.tokens) \
+                    and self.tokens[self.index + 1][0] == 'word':
+                words.append(self.take()[1])
+                words.append(self.take()[1])
+            return Near(' '.join(words)) if len(words) > 1 else Term(text)
+        # NEAR/k sem palavra à esquerda
+        return None
+
+
+def _combine(node_type, children):
+    children = [child for child in children if child is not None]
+    if not children:
+        return None
+    if len(children) == 1:
+        return children[0]
+    return node_type(children)
+
+
+def parse(query):
+    """Árvore da consulta (None se não sobrar nenhum critério)"""
+    return _Parser(tokenize(query)).parse()
+
+
+def positive_leaves(node):
+    """Folhas que contam a favor da página (fora de ``Not``), em ordem"""
+    if node is None or isinstance(node, Not):
+        return
+    if isinstance(node, LEAVES):
+        yield node
+    else:
+        for child in node.children:
+            yield from positive_leaves(child)
+
+
+def intersect(first, second):
+    """Interseção de duas listas ordenadas de páginas, percorrendo a menor"""
+    shorter, longer = sorted((first, second), key=len)
+    skip = max(1, math.isqrt(len(longer)))
+    result = []
+    j = 0
+    for page in shorter:
+        # Ponteiros de salto: avança de ``skip`` em ``skip`` enquanto não passar da página
+        while j + skip < len(longer) and longer[j + skip] <= page:
+            j += skip
+        while j < len(longer) and longer[j] < page:
+            j += 1
+        if j == len(longer):
+            break
+        if longer[j] == page:
+            result.append(page)
+    return result
+
+
+def union(lists):
+    """União de listas ordenadas de páginas"""
+    return sorted(set().union(*lists))
+
+
+def difference(pages, excluded):
+    """``pages`` sem as páginas de ``excluded`` (ambas ordenadas)"""
+    excluded = set(excluded)
+    return [page for page in pages if page not in excluded]
+
+
+def estimate(node, resolver):
+    """Custo estimado (páginas) de avaliar ``node``"""
+    if isinstance(node, LEAVES):
+        return resolver.estimate(node)
+    if isinstance(node, Not):
+        return resolver.page_count
+    if isinstance(node, Or):
+        return sum(estimate(child, resolver) for child in node.children)
+    positives = [estimate(child, resolver) for child in node.children if not isinstance(child, Not)]
+    return min(positives) if positives else resolver.page_count
+
+
+def _universe(resolver, candidates):
+    return list(range(1, resolver.page_count + 1)) if candidates is None else candidates
+
+
+def evaluate(node, resolver, candidates=None):
+    """Páginas (ordenadas) que satisfazem ``node``, dentro de ``candidates`` se dada"""
+    if node is None:
+        return []
+    if isinstance(node, LEAVES):
+        return resolver.pages(node, candidates)
+    if isinstance(node, Not):
+        return difference(_universe(resolver, candidates), evaluate(node.child, resolver, candidates))
+    if isinstance(node, Or):
+        return union(evaluate(child, resolver, candidates) for child in node.children)
+
+    positives = sorted((child for child in node.children if not isinstance(child, Not)),
+                       key=lambda child: estimate(child, resolver))
+    result = candidates
+    for child in positives:
+        result = evaluate(child, resolver, result)
+        if not result:
+            return []
+    result = _universe(resolver, result)
+    for child in node.children:
+        if isinstance(child, Not):
+            result = difference(result, evaluate(child.child, resolver, result))
+            if not result:
+                break
+    return result
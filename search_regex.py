@@ -0,0 +1,329 @@
+"""Busca por expressão regular do FLUX-ON Reader.
+
+O texto de todas as páginas é concatenado uma única vez em um corpus
+(``Corpus``), com uma quebra de linha entre as páginas e o offset inicial
+de cada uma. A expressão é compilada uma vez e percorrida sobre esse
+corpus; cada ocorrência volta para a sua página por ``bisect`` nos offsets
+iniciais. Uma ocorrência que atravessa páginas conta na página em que
+começa, destacada até o fim dela. As expressões usam ``re.MULTILINE``
+(``^`` e ``$`` valem no início e no fim de cada linha e de cada página) e
+diferenciam maiúsculas; ``(?i)`` no início ignora a diferença.
+
+O módulo ``re`` não pode ser interrompido no meio de uma busca (nem por
+outra thread: ele não libera o GIL), então a proteção contra expressões
+patológicas tem quatro partes:
+
+- ``compile_pattern`` recusa de saída as formas mais comuns de retrocesso
+  exponencial: repetição ilimitada dentro de repetição ilimitada
+  (``(a+)+``, ``(\\w+\\s?)*``) e referências a grupos (``\\1``), além de
+  expressões longas demais, ambíguas (``FutureWarning`` do ``re``, como
+  ``[[a]``) ou que aceitam texto vazio
+- ``RegexWorker`` executa a busca em um processo separado, que é encerrado
+  se não responder até ``time_budget`` + ``WORKER_GRACE_SECONDS``; outras
+  formas lentas (``(.|..)*Z``, ``.*a.*a.*a.*Q``) não travam o servidor
+- ``scan`` percorre o corpus em janelas de cerca de ``WINDOW_CHARS``
+  caracteres (sempre em limites de página) e confere o prazo
+  ``time_budget`` a cada ocorrência e entre as janelas
+- a busca para em ``max_matches`` ocorrências
+
+Nos três últimos casos o resultado é parcial (``truncated``); se o
+processo precisou ser encerrado, não há ocorrências.
+"""
+
+import bisect
+import hashlib
+import os
+import pickle
+import math
+import queue
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+FLAGS = re.MULTILINE
+PAGE_SEPARATOR = '\n'
+
+MAX_PATTERN_LENGTH = 300
+WINDOW_CHARS = 16 * 1024
+TIME_BUDGET = 1.0
+MAX_MATCHES = 1000
+
+# Folga além do prazo da busca antes de encerrar o processo, e prazo para ele iniciar
+WORKER_GRACE_SECONDS = 0.5
+WORKER_START_TIMEOUT = 30.0
+# Corpus (livros) mantidos no processo de busca
+WORKER_CORPORA = 8
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKER_COMMAND = "import search_regex; search_regex.serve()"
+
+REPEATS = tuple(op for op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT,
+                              getattr(sre_parse, 'POSSESSIVE_REPEAT', None)) if op is not None)
+BACKREFERENCES = (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS)
+
+
+class PatternError(ValueError):
+    """Expressão inválida ou recusada (a mensagem é exibida ao leitor)"""
+
+
+class Corpus:
+    """Texto de todas as páginas em uma única string, com o offset inicial de cada página"""
+
+    __slots__ = ('text', 'page_starts', 'key')
+
+    def __init__(self, texts):
+        texts = list(texts)
+        self.page_starts = []
+        position = 0
+        for text in texts:
+            self.page_starts.append(position)
+            position += len(text) + len(PAGE_SEPARATOR)
+        self.text = PAGE_SEPARATOR.join(texts)
+        # Identifica o corpus no processo de busca (enviado uma vez)
+        self.key = hashlib.sha1(self.text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def __len__(self):
+        return len(self.page_starts)
+
+    def page_of(self, offset):
+        """Página (base 1) do caractere ``offset`` do corpus"""
+        return bisect.bisect_right(self.page_starts, offset)
+
+    def page_end(self, page):
+        """Offset, no corpus, do fim do texto de ``page`` (base 1)"""
+        if page < len(self.page_starts):
+            return self.page_starts[page] - len(PAGE_SEPARATOR)
+        return len(self.text)
+
+
+def _subpatterns(value):
+    if isinstance(value, sre_parse.SubPattern):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _subpatterns(item)
+
+
+def _check(items, inside_repeat=False):
+    for op, value in items:
+        if op in BACKREFERENCES:
+            raise PatternError("Referências a grupos (como \\1) não são aceitas na busca.")
+        if op in REPEATS:
+            _, high, item = value
+            unbounded = high == sre_parse.MAXREPEAT
+            if unbounded and inside_repeat:
+                raise PatternError("Repetição dentro de repetição (como (a+)+) pode travar a busca; "
+                                   "simplifique a expressão.")
+            _check(item, inside_repeat or unbounded)
+        else:
+            for item in _subpatterns(value):
+                _check(item, inside_repeat)
+
+
+def compile_pattern(pattern):
+    """Expressão compilada, ou ``PatternError`` se for inválida ou arriscada"""
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise PatternError(f"Expressão longa demais (máximo de {MAX_PATTERN_LENGTH} caracteres).")
+    try:
+        with warnings.catch_warnings():
+            # Conjuntos ambíguos ("[[a]", "[a&&b]"): recusados em vez de avisos no log do servidor
+            warnings.simplefilter('error', FutureWarning)
+            _check(sre_parse.parse(pattern, FLAGS))
+            compiled = re.compile(pattern, FLAGS)
+    except re.error as e:
+        raise PatternError(f"Expressão inválida: {e}") from None
+    except FutureWarning as e:
+        raise PatternError(f"Expressão ambígua: {e}; escape os colchetes e símbolos repetidos.") from None
+    if compiled.match(''):
+        raise PatternError("A expressão aceita texto vazio (como x*); exija ao menos um caractere (x+).")
+    return compiled
+
+
+def scan(pattern, corpus, time_budget=TIME_BUDGET, max_matches=MAX_MATCHES):
+    """(ocorrências, truncated): (página, início, fim) de cada ocorrência, com offsets na página.
+
+    Uma ocorrência que passaria do fim da página é refeita só dentro dela,
+    para que o resultado seja o mesmo de buscar página a página.
+    Ocorrências vazias (como as de ``(?=a)``) são ignoradas. ``truncated``
+    indica que o prazo ou o limite de ocorrências interrompeu a busca.
+    """
+    deadline = time.perf_counter() + time_budget
+    text, starts = corpus.text, corpus.page_starts
+    search = pattern.search
+    matches = []
+    page = 0
+    while page < len(starts):
+        # Janela de páginas inteiras: as que começam nos próximos WINDOW_CHARS caracteres
+        next_page = bisect.bisect_left(starts, starts[page] + WINDOW_CHARS, page + 1)
+        position, window_end = starts[page], corpus.page_end(next_page)
+        page_start = page_end = -1
+        while position <= window_end:
+            match = search(text, position, window_end)
+            if match is None:
+                break
+            start, end = match.span()
+            if start > page_end:
+                match_page = corpus.page_of(start)
+                page_start, page_end = starts[match_page - 1], corpus.page_end(match_page)
+            if end > page_end:
+                match = search(text, start, page_end)
+                if match is None:
+                    position = page_end + len(PAGE_SEPARATOR)
+                    continue
+                start, end = match.span()
+            if start == end:
+                position = end + 1
+            else:
+                matches.append((match_page, start - page_start, end - page_start))
+                if len(matches) >= max_matches:
+                    return matches, True
+                position = end
+            if time.perf_counter() > deadline:
+                return matches, True
+        page = next_page
+        if page < len(starts) and time.perf_counter() > deadline:
+            return matches, True
+    return matches, False
+
+
+
+def serve(requests=None, replies=None):
+    """Laço do processo de busca (``RegexWorker``): pedidos na entrada padrão, respostas na saída"""
+    requests = requests or sys.stdin.buffer
+    replies = replies or sys.stdout.buffer
+
+    def reply(value):
+        pickle.dump(value, replies)
+        replies.flush()
+
+    corpora = OrderedDict()
+    reply('ready')
+    while True:
+        try:
+            message = pickle.load(requests)
+        except EOFError:
+            return
+        if message[0] == 'corpus':
+            _, corpus = message
+            corpora[corpus.key] = corpus
+            while len(corpora) > WORKER_CORPORA:
+                corpora.popitem(last=False)
+        else:
+            _, key, source, flags, time_budget, max_matches = message
+            corpora.move_to_end(key)
+            if hasattr(signal, 'alarm'):
+                # Se o servidor sair sem encerrar este processo, o SIGALRM (sem tratador) o encerra
+                signal.alarm(math.ceil(time_budget + WORKER_GRACE_SECONDS) + 1)
+            reply(scan(re.compile(source, flags), corpora[key], time_budget, max_matches))
+            if hasattr(signal, 'alarm'):
+                signal.alarm(0)
+
+
+def _read_replies(stream, replies):
+    # None: o processo terminou (ou foi encerrado)
+    while True:
+        try:
+            replies.put(pickle.load(stream))
+        except (EOFError, OSError, pickle.UnpicklingError):
+            replies.put(None)
+            return
+
+
+class RegexWorker:
+    """Executa ``scan`` em um processo separado, encerrado se passar do prazo.
+
+    O processo (``python -c WORKER_COMMAND``, que só importa este módulo) é
+    criado no primeiro uso, e de novo depois de encerrado, e guarda os
+    últimos ``WORKER_CORPORA`` corpus recebidos; as buscas são atendidas uma
+    de cada vez. Se não for possível criar o processo, a busca roda neste
+    processo, só com as proteções de ``scan``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process = None
+        self._replies = None
+        # Chaves dos corpus que o processo atual tem, na mesma ordem LRU que ele
+        self._corpora = OrderedDict()
+
+    def scan(self, pattern, corpus, time_budget=TIME_BUDGET, max_matches=MAX_MATCHES):
+        """Mesmo resultado de ``scan``; ``([], True)`` se o processo precisou ser encerrado"""
+        with self._lock:
+            try:
+                self._start()
+            except OSError:
+                return scan(pattern, corpus, time_budget, max_matches)
+            try:
+                if corpus.key in self._corpora:
+                    self._corpora.move_to_end(corpus.key)
+                else:
+                    self._send(('corpus', corpus))
+                    self._corpora[corpus.key] = None
+                    while len(self._corpora) > WORKER_CORPORA:
+                        self._corpora.popitem(last=False)
+                self._send(('scan', corpus.key, pattern.pattern, pattern.flags, time_budget, max_matches))
+                result = self._replies.get(timeout=time_budget + WORKER_GRACE_SECONDS)
+                if result is not None:
+                    return result
+            except (queue.Empty, OSError):
+                pass
+            # Preso em uma única chamada do re (ou terminado): o processo é descartado
+            self._stop()
+            return [], True
+
+    def _send(self, message):
+        pickle.dump(message, self._process.stdin, protocol=pickle.HIGHEST_PROTOCOL)
+        self._process.stdin.flush()
+
+    def _start(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._stop()
+        process = subprocess.Popen([sys.executable, '-c', WORKER_COMMAND], cwd=MODULE_DIR,
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        replies = queue.Queue()
+        threading.Thread(target=_read_replies, args=(process.stdout, replies), daemon=True,
+                         name='fluxon-regex-replies').start()
+        try:
+            ready = replies.get(timeout=WORKER_START_TIMEOUT)
+        except queue.Empty:
+            ready = None
+        if ready != 'ready':
+            process.kill()
+            process.wait()
+            raise OSError("processo de busca por expressão regular não iniciou")
+        self._process, self._replies = process, replies
+
+    def _stop(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process.stdin.close()
+        self._process = self._replies = None
+        self._corpora.clear()
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+
+_shared_worker = None
+_shared_worker_lock = threading.Lock()
+
+
+def shared_worker():
+    """``RegexWorker`` único do processo, comum a todos os livros e sessões"""
+    global _shared_worker
+    with _shared_worker_lock:
+        if _shared_worker is None:
+            _shared_worker = RegexWorker()
+        return _shared_worker
@@ -0,0 +1,206 @@
+"""Carregamento preguiçoso de segmentos para livros muito grandes.
+
+Em vez de decodificar o JSON inteiro do livro (``livros/<Título>.json``),
+uma única varredura registra os offsets em bytes de cada segmento dentro
+do arquivo. O índice é salvo ao lado dos livros compilados e reaproveitado
+enquanto o arquivo não mudar. Cada página é decodificada apenas quando
+``BookStateManager.get_current_segment`` (ou outro consumidor) a pede, e
+os segmentos decodificados ficam em um LRU limitado.
+"""
+
+import json
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+
+import book_schema
+import book_store
+
+INDEX_FORMAT_VERSION = 2
+
+# Segmentos decodificados mantidos em memória por livro
+SEGMENT_CACHE_SIZE = 128
+
+# Strings JSON (com escapes) são consumidas inteiras para que colchetes dentro
+# do texto não sejam confundidos com a estrutura; o grupo 2 marca chaves
+_TOKEN_RE = re.compile(rb'("[^"\\]*(?:\\.[^"\\]*)*")(\s*:)?|[\[\]{}]')
+
+
+class LazySegmentList(Sequence):
+    """Sequência de segmentos decodificados sob demanda, com LRU limitado"""
+
+    def __init__(self, length, decode, cache_size=SEGMENT_CACHE_SIZE):
+        self._length = length
+        self._decode = decode
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('segmento fora do intervalo')
+
+        with self._lock:
+            segment = self._cache.get(index)
+            if segment is not None:
+                self._cache.move_to_end(index)
+                return segment
+
+        segment = self._decode(index)
+
+        with self._lock:
+            self._cache[index] = segment
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return segment
+
+
+def scan_json_book(data):
+    """Varre o JSON do livro e retorna (spans do resumo, spans dos segmentos, span da lista).
+
+    ``data`` é o conteúdo em bytes (ou um mmap). Os spans são pares
+    ``(início, fim)`` em bytes: um por chave de primeiro nível (exceto
+    ``segments``), um por objeto da lista ``segments`` e o da própria lista,
+    de ``[`` a ``]`` (``None`` se a chave não existir ou não for uma lista).
+    """
+    summary_spans = {}
+    segment_spans = []
+    segments_span = None
+
+    depth = 0
+    current_key = None
+    value_start = None
+    segment_start = None
+    list_start = None
+
+    for match in _TOKEN_RE.finditer(data):
+        token = match.group(0)
+
+        if match.group(1) is not None:
+            if match.group(2) is not None and depth == 1:
+                if current_key is not None and current_key != 'segments':
+                    summary_spans[current_key] = (value_start, match.start())
+                current_key = json.loads(match.group(1))
+                value_start = match.end()
+            continue
+
+        if token in (b'{', b'['):
+            depth += 1
+            if depth == 2 and current_key == 'segments' and token == b'[':
+                list_start = match.start()
+            if depth == 3 and current_key == 'segments' and token == b'{':
+                segment_start = match.start()
+        else:
+            if depth == 3 and current_key == 'segments' and token == b'}':
+                segment_spans.append((segment_start, match.end()))
+            if depth == 2 and current_key == 'segments' and token == b']' and list_start is not None:
+                segments_span = (list_start, match.end())
+            depth -= 1
+            if depth == 0:
+                if current_key is not None and current_key != 'segments':
+                    summary_spans[current_key] = (value_start, match.start())
+                break
+
+    if depth != 0 or current_key is None:
+        raise ValueError("JSON do livro incompleto ou sem objeto de primeiro nível")
+
+    return summary_spans, segment_spans, segments_span
+
+
+def _index_path(source_path, store_root=None):
+    return os.path.join(store_root or book_store.STORE_ROOT,
+                        f"{book_store.book_id_from_path(source_path)}.segidx.npz")
+
+
+def load_or_build_index(source_path, data, content_hash, store_root=None):
+    """Índice de offsets do arquivo, reaproveitado do disco quando o hash confere"""
+    index_path = _index_path(source_path, store_root)
+
+    if os.path.exists(index_path):
+        try:
+            with np.load(index_path, allow_pickle=False) as saved:
+                header = json.loads(str(saved['header']))
+                if (header.get('format_version') == INDEX_FORMAT_VERSION and
+                        header.get('content_hash') == content_hash):
+                    spans = {k: tuple(v) for k, v in header['summary'].items()}
+                    return spans, saved['segments'].copy()
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # Só livros válidos são indexados: um índice salvo dispensa nova validação
+    summary_spans, segment_spans = book_schema.validate_book(data, scan_json_book)
+    segments = np.array(segment_spans, dtype=np.int64).reshape(-1, 2)
+
+    header = {
+        'format_version': INDEX_FORMAT_VERSION,
+        'content_hash': content_hash,
+        'summary': summary_spans
+    }
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp_path = f"{index_path}.tmp-{os.getpid()}.npz"
+        np.savez(tmp_path, header=np.array(json.dumps(header)), segments=segments)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # Diretório somente leitura: o índice vale apenas para este processo
+        pass
+
+    return summary_spans, segments
+
+
+class JsonBook:
+    """Livro lido diretamente do JSON de análise, com segmentos sob demanda"""
+
+    def __init__(self, source_path, store_root=None):
+        self.source_path = source_path
+        self.book_id = book_store.book_id_from_path(source_path)
+        self.content_hash = book_store.content_hash(source_path)
+
+        self._file = open(source_path, 'rb')
+        if not os.fstat(self._file.fileno()).st_size:
+            # mmap não aceita arquivos vazios
+            self._file.close()
+            raise book_schema.MissingBookDataError("arquivo vazio", offset=0, line=1, column=1)
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._summary_spans, self._segment_spans = load_or_build_index(
+                source_path, self._data, self.content_hash, store_root)
+        except Exception:
+            self.close()
+            raise
+
+        self.segments = LazySegmentList(len(self._segment_spans), self._decode_segment)
+
+    def _decode_segment(self, index):
+        start, end = self._segment_spans[index]
+        return json.loads(self._data[int(start):int(end)])
+
+    def as_analysis_data(self):
+        """Dicionário no formato esperado por ``QuantumBookReader``"""
+        analysis_data = {}
+        for key, (start, end) in self._summary_spans.items():
+            raw = self._data[start:end].strip().rstrip(b',').strip()
+            analysis_data[key] = json.loads(raw)
+        analysis_data['segments'] = self.segments
+        return analysis_data
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+
+def open_json_book(source_path, store_root=None):
+    """Abre o livro com segmentos preguiçosos; ``book_schema.BookFormatError`` se for inválido"""
+    return JsonBook(source_path, store_root)
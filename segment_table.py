@@ -0,0 +1,443 @@
+"""Representação compacta dos segmentos (páginas) de um livro.
+
+``SegmentTable`` guarda os campos numéricos de todas as páginas
+(difficulty, complexity_metrics.*, analysis.*) como colunas NumPy, com os
+mesmos nomes das colunas do livro compilado (book_store.py), e as
+palavras-chave/entidades com strings internadas, em vez de milhares de
+dicionários aninhados. ``Segment`` é uma visão leve (``__slots__``) de uma
+página da tabela.
+
+A tabela pode ser:
+
+- compacta: construída a partir de uma lista de dicts, que é descartada;
+- compilada: colunas mapeadas do disco, demais campos lidos sob demanda;
+- preguiçosa: todos os campos lidos sob demanda de uma sequência de dicts
+  (segment_loader.py), com as colunas calculadas no primeiro uso.
+
+Uso (linha de comando)::
+
+    python segment_table.py         # memória (tracemalloc) por livro: dicts x tabela
+
+Cada livro é medido em um interpretador novo: no mesmo processo, as
+strings internadas e as alocações já feitas por um livro distorcem a
+medição dos seguintes.
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import tracemalloc
+from collections.abc import Sequence
+
+import numpy as np
+
+import book_store
+
+# Campos de analysis que não são numéricos e ficam fora das colunas
+ANALYSIS_LIST_FIELDS = ('keywords', 'entities')
+
+_MISSING = object()
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MEASURE_COMMAND = "import sys, segment_table; print(*segment_table.measure_memory(sys.argv[1]))"
+
+
+def texts_hash(encoded_texts):
+    """SHA-256 dos textos (em bytes UTF-8) de todas as páginas, em ordem"""
+    digest = hashlib.sha256()
+    for text in encoded_texts:
+        digest.update(len(text).to_bytes(8, 'little'))
+        digest.update(text)
+    return digest.hexdigest()
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _numeric_fields(segment):
+    """Pares (nome da coluna, valor) dos campos numéricos de um segmento"""
+    for key, value in segment.items():
+        if key in book_store.NUMERIC_GROUPS and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                if book_store.is_number(sub_value):
+                    yield book_store.column_name(key, sub_key), sub_value
+        elif book_store.is_number(value):
+            yield key, value
+
+
+def build_columns(segments):
+    """Colunas para os campos numéricos presentes em todos os segmentos"""
+    values = None
+    for segment in segments:
+        row = dict(_numeric_fields(segment))
+        if values is None:
+            values = {name: [value] for name, value in row.items()}
+            continue
+        for name in list(values):
+            if name in row:
+                values[name].append(row[name])
+            else:
+                del values[name]
+
+    columns = {}
+    for name, column_values in (values or {}).items():
+        all_int = all(isinstance(v, int) for v in column_values)
+        columns[name] = np.array(column_values, dtype=np.int64 if all_int else np.float64)
+    return columns
+
+
+class SegmentMeta:
+    """Campos não numéricos de uma página, com strings internadas"""
+
+    __slots__ = ('keywords', 'entities', 'themes', 'fields')
+
+    def __init__(self, keywords, entities, themes, fields):
+        self.keywords = keywords
+        self.entities = entities
+        self.themes = themes
+        self.fields = fields
+
+    @classmethod
+    def from_dict(cls, segment, columns=()):
+        analysis = segment.get('analysis') or {}
+        keywords = tuple(_intern(k) for k in analysis.get('keywords', ()))
+        entities = tuple(
+            tuple(_intern(part) for part in entity) if isinstance(entity, (list, tuple)) else _intern(entity)
+            for entity in analysis.get('entities', ())
+        )
+        themes = segment.get('themes') or None
+        if themes:
+            themes = {_intern(theme): score for theme, score in themes.items()}
+
+        # Restante do segmento que não está nas colunas (mantido para exportação)
+        fields = {}
+        for key, value in segment.items():
+            if key in ('text', 'themes'):
+                continue
+            if key in book_store.NUMERIC_GROUPS and isinstance(value, dict):
+                rest = {
+                    sub_key: sub_value for sub_key, sub_value in value.items()
+                    if book_store.column_name(key, sub_key) not in columns and
+                    not (key == 'analysis' and sub_key in ANALYSIS_LIST_FIELDS)
+                }
+                if rest:
+                    fields[key] = rest
+            elif key not in columns:
+                fields[key] = _intern(value)
+
+        return cls(keywords, entities, themes, fields or None)
+
+
+class Segment:
+    """Visão de uma página da ``SegmentTable`` (não copia os dados)"""
+
+    __slots__ = ('_table', 'index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self.index = index
+
+    def __repr__(self):
+        return f"Segment(página={self.number})"
+
+    @property
+    def number(self):
+        """Número da página (1-based)"""
+        return self.index + 1
+
+    @property
+    def text(self):
+        return self._table.text(self.index)
+
+    @property
+    def difficulty(self):
+        return self._table.value(self.index, 'difficulty')
+
+    @property
+    def word_count(self):
+        return self._table.value(self.index, 'complexity_metrics.word_count')
+
+    @property
+    def sentence_count(self):
+        return self._table.value(self.index, 'complexity_metrics.sentence_count')
+
+    @property
+    def readability_score(self):
+        return self._table.value(self.index, 'analysis.readability_score')
+
+    @property
+    def complexity_metrics(self):
+        return self._table.group(self.index, 'complexity_metrics')
+
+    @property
+    def keywords(self):
+        return self._table.meta(self.index).keywords
+
+    @property
+    def entities(self):
+        return self._table.meta(self.index).entities
+
+    @property
+    def themes(self):
+        return self._table.meta(self.index).themes or {}
+
+    def to_dict(self):
+        """Segmento no formato original da análise (usado na exportação)"""
+        return self._table.row_dict(self.index)
+
+    # Compatibilidade com código que ainda trata o segmento como dict: só o campo pedido é montado
+    def get(self, key, default=None):
+        return self._table.field(self.index, key, default)
+
+    def __getitem__(self, key):
+        value = self._table.field(self.index, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._table.field(self.index, key, _MISSING) is not _MISSING
+
+
+class SegmentTable(Sequence):
+    """Páginas de um livro em formato colunar; ``table[i]`` retorna um ``Segment``"""
+
+    def __init__(self, length, columns, texts=None, metas=None, layout=None, source=None, known_texts_hash=None):
+        self._length = length
+        self._columns = dict(columns)
+        self._texts = texts
+        self._metas = metas
+        self._layout = layout
+        self._layout_keys = dict(layout or ())
+        # Sequência de dicts para leitura sob demanda (livros compilados/preguiçosos)
+        self._source = source
+        self._columns_complete = source is None or bool(columns)
+        self._texts_hash = known_texts_hash
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_segments(cls, segments):
+        """Tabela compacta: os dicts de ``segments`` podem ser descartados depois"""
+        columns = build_columns(segments)
+        texts = [segment.get('text', '') for segment in segments]
+        metas = [SegmentMeta.from_dict(segment, columns) for segment in segments]
+
+        # Campos restantes costumam se repetir (ex.: segment_type='page'): uma cópia só
+        shared_fields = {}
+        for meta in metas:
+            if meta.fields:
+                try:
+                    key = json.dumps(meta.fields, sort_keys=True)
+                except TypeError:
+                    continue
+                meta.fields = shared_fields.setdefault(key, meta.fields)
+
+        layout = []
+        if segments:
+            for key, value in segments[0].items():
+                layout.append((key, tuple(value) if isinstance(value, dict) and key != 'themes' else None))
+
+        return cls(len(segments), columns, texts=texts, metas=metas, layout=layout)
+
+    @classmethod
+    def from_compiled(cls, book):
+        """Colunas mapeadas do livro compilado; textos e metadados sob demanda"""
+        columns = {book_store.column_name(group, key): values for (group, key), values in book.columns.items()}
+        return cls(len(book.segments), columns, texts=book.texts, source=book.segments,
+                   known_texts_hash=book.manifest.get('texts_sha256'))
+
+    @classmethod
+    def from_lazy(cls, segments):
+        """Tudo sob demanda; as colunas são calculadas no primeiro uso vetorizado"""
+        return cls(len(segments), {}, source=segments)
+
+    @classmethod
+    def coerce(cls, segments):
+        if isinstance(segments, cls):
+            return segments
+        if isinstance(segments, (list, tuple)):
+            return cls.from_segments(segments)
+        return cls.from_lazy(segments)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Segment(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('segmento fora do intervalo')
+        return Segment(self, index)
+
+    # --- acesso por página ---
+
+    def text(self, index):
+        if self._texts is not None:
+            return self._texts[index]
+        return self._source[index].get('text', '')
+
+    def meta(self, index):
+        if self._metas is not None:
+            return self._metas[index]
+        return SegmentMeta.from_dict(self._source[index], self._columns)
+
+    def value(self, index, name, default=0):
+        column = self._columns.get(name)
+        if column is not None:
+            return column[index].item()
+        if self._source is not None:
+            group, _, key = name.rpartition('.')
+            container = self._source[index].get(group, {}) if group else self._source[index]
+            return container.get(key, default)
+        return default
+
+    def group(self, index, group):
+        """Dicionário aninhado (ex.: complexity_metrics) de uma página"""
+        if self._source is not None and not self._columns:
+            return dict(self._source[index].get(group, {}))
+        prefix = group + '.'
+        values = {name[len(prefix):]: column[index].item()
+                  for name, column in self._columns.items() if name.startswith(prefix)}
+        fields = self.meta(index).fields or {}
+        return {**fields.get(group, {}), **values}
+
+    def row_dict(self, index):
+        if self._source is not None:
+            return self._source[index]
+
+        fields = self._metas[index].fields or {}
+        row = {}
+        for key, sub_keys in self._layout:
+            value = self._layout_value(index, key, sub_keys)
+            if value is not _MISSING:
+                row[key] = value
+        for key, value in fields.items():
+            row.setdefault(key, value)
+        return row
+
+    def field(self, index, key, default=None):
+        """Campo ``key`` de uma página no formato original, sem montar a linha inteira"""
+        if key == 'text':
+            return self.text(index)
+        if self._source is not None:
+            return self._source[index].get(key, default)
+        if key in self._layout_keys:
+            value = self._layout_value(index, key, self._layout_keys[key])
+            if value is not _MISSING:
+                return value
+        return (self._metas[index].fields or {}).get(key, default)
+
+    def _layout_value(self, index, key, sub_keys):
+        meta = self._metas[index]
+        fields = meta.fields or {}
+        if key == 'text':
+            return self._texts[index]
+        if key == 'themes':
+            return dict(meta.themes or {})
+        if sub_keys is not None:
+            nested = {}
+            for sub_key in sub_keys:
+                name = book_store.column_name(key, sub_key)
+                if name in self._columns:
+                    nested[sub_key] = self._columns[name][index].item()
+                elif key == 'analysis' and sub_key == 'keywords':
+                    nested[sub_key] = list(meta.keywords)
+                elif key == 'analysis' and sub_key == 'entities':
+                    nested[sub_key] = [list(e) if isinstance(e, tuple) else e for e in meta.entities]
+                elif sub_key in fields.get(key, {}):
+                    nested[sub_key] = fields[key][sub_key]
+            return nested
+        if key in self._columns:
+            return self._columns[key][index].item()
+        return fields.get(key, _MISSING)
+
+    @property
+    def texts_hash_known(self):
+        return self._texts_hash is not None
+
+    def texts_hash(self):
+        """Hash dos textos (chave dos dados derivados); percorre o livro se não for conhecido"""
+        if self._texts_hash is None:
+            digest = texts_hash(self.text(i).encode('utf-8') for i in range(self._length))
+            with self._lock:
+                self._texts_hash = digest
+        return self._texts_hash
+
+    # --- acesso vetorizado ---
+
+    def _ensure_columns(self):
+        if self._columns_complete:
+            return
+        with self._lock:
+            if not self._columns_complete:
+                self._columns = build_columns(self._source)
+                self._columns_complete = True
+
+    def column(self, name):
+        """Coluna numérica de todas as páginas (zeros se o campo não existir)"""
+        self._ensure_columns()
+        column = self._columns.get(name)
+        if column is None:
+            return np.zeros(self._length)
+        return column
+
+    @property
+    def column_names(self):
+        self._ensure_columns()
+        return list(self._columns)
+
+
+def measure_memory(source_path):
+    """Memória alocada (bytes) pelos segmentos como lista de dicts e como tabela"""
+    with open(source_path, encoding='utf-8') as f:
+        raw = f.read()
+
+    tracemalloc.start()
+    try:
+        segments = json.loads(raw)['segments']
+        as_dicts = tracemalloc.get_traced_memory()[0]
+
+        table = SegmentTable.from_segments(segments)
+        del segments
+        gc.collect()
+        as_table = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return as_dicts, as_table, len(table)
+
+
+def measure_memory_isolated(source_path, python=None):
+    """``measure_memory`` em um interpretador novo, que só carrega esse livro"""
+    completed = subprocess.run(
+        [python or sys.executable, '-c', MEASURE_COMMAND, source_path],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Falha ao medir {source_path}: {completed.stderr.strip().splitlines()[-1:]}")
+    as_dicts, as_table, pages = map(int, completed.stdout.split())
+    return as_dicts, as_table, pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede a memória dos segmentos: dicts x SegmentTable")
+    parser.add_argument('sources', nargs='*', help="Arquivos de análise (.json); padrão: todos os livros")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or list(book_store.list_books().values())
+    for source in sources:
+        as_dicts, as_table, pages = measure_memory_isolated(source)
+        print(f"{source}: {pages} páginas | dicts {as_dicts / 1024:.0f} KiB -> "
+              f"tabela {as_table / 1024:.0f} KiB ({as_table / max(as_dicts, 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
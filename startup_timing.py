@@ -0,0 +1,115 @@
+"""Tempo de inicialização do FLUX-ON Reader.
+
+Dependências pesadas (pandas, plotly, requests) são importadas apenas
+quando um gráfico ou a API é usado, por ``lazy_import``, que registra
+quanto cada importação custou. Esses tempos, junto com o tempo de import
+do próprio leitor, aparecem no painel de depuração (``?debug=1`` na URL
+ou ``FLUXON_DEBUG=1``).
+
+O cold start completo de um worker novo é medido em um subprocesso com
+``python -X importtime``, que detalha o custo de cada módulo importado.
+
+Uso (linha de comando)::
+
+    python startup_timing.py                  # cold start de leitor_quantico
+    python startup_timing.py biblioteca -n 40 # outro módulo, 40 imports mais caros
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_timings = OrderedDict()
+_timings_lock = threading.Lock()
+
+
+def record(name, seconds):
+    """Registra um tempo de inicialização (mantém a primeira medição)"""
+    with _timings_lock:
+        _timings.setdefault(name, seconds)
+
+
+def recorded_timings():
+    """Lista de (nome, segundos) na ordem em que foram registrados"""
+    with _timings_lock:
+        return list(_timings.items())
+
+
+def lazy_import(module_name):
+    """Importa ``module_name`` no primeiro uso, registrando o tempo gasto"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    record(f"import {module_name}", time.perf_counter() - started)
+    return module
+
+
+def measure_cold_start(module_name='leitor_quantico', python=None):
+    """Importa ``module_name`` em um interpretador novo com ``-X importtime``.
+
+    Retorna (tempo total em segundos, lista de imports), onde cada import é
+    um dict com ``module``, ``self_us``, ``cumulative_us`` e ``depth``.
+    """
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {module_name}: {completed.stderr.strip().splitlines()[-1:]}")
+
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append({
+            'module': name.strip(),
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'depth': (len(name) - len(name.lstrip())) // 2
+        })
+    return elapsed, imports
+
+
+def format_report(elapsed, imports, top=25):
+    """Relatório em texto: tempo total e os imports de maior custo acumulado"""
+    lines = [f"Cold start: {elapsed * 1000:.0f} ms (subprocesso, incluindo o interpretador)"]
+
+    direct = [entry for entry in imports if entry['depth'] == 0]
+    if direct:
+        lines.append("")
+        lines.append("Imports diretos (ms acumulado):")
+        for entry in sorted(direct, key=lambda e: e['cumulative_us'], reverse=True)[:top]:
+            lines.append(f"  {entry['cumulative_us'] / 1000:8.1f}  {entry['module']}")
+
+    lines.append("")
+    lines.append(f"Top {top} imports por custo acumulado (ms):")
+    for entry in sorted(imports, key=lambda e: e['cumulative_us'], reverse=True)[:top]:
+        lines.append(f"  {entry['cumulative_us'] / 1000:8.1f}  {'  ' * entry['depth']}{entry['module']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o cold start (tempo de import) do FLUX-ON Reader")
+    parser.add_argument('module', nargs='?', default='leitor_quantico', help="Módulo a importar")
+    parser.add_argument('-n', '--top', type=int, default=25, help="Quantidade de imports listados")
+    args = parser.parse_args(argv)
+
+    elapsed, imports = measure_cold_start(args.module)
+    print(format_report(elapsed, imports, args.top))
+
+
+if __name__ == "__main__":
+    main()
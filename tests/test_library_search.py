@@ -0,0 +1,47 @@
+"""Busca na biblioteca (``FederatedSearch`` sobre o ``LibraryIndexCache``)."""
+
+import pickle
+
+import book_store
+import precompute
+from leitor_quantico import FederatedSearch, LibraryIndexCache
+
+
+def library(tmp_path, catalog, max_entries=16):
+    cache = LibraryIndexCache(max_entries=max_entries, artifact_cache=precompute.ArtifactCache(str(tmp_path)))
+    return cache, FederatedSearch({title: (lambda path=path: cache.engine(path)) for title, path in catalog.items()})
+
+
+def test_invalid_book_is_reported_to_the_caller(tmp_path):
+    empty = tmp_path / 'Vazio.json'
+    empty.write_bytes(b'')
+    catalog = {'Caos': book_store.list_books()['Caos'], 'Vazio': str(empty)}
+    _, search = library(tmp_path / 'derivados', catalog)
+
+    results = search.search('caos', 'all', 20)
+
+    assert results.hits()
+    assert {hit['book'] for hit in results.hits()} == {'Caos'}
+    assert set(results.errors) == {'Vazio'}
+    assert 'arquivo vazio' in results.errors['Vazio']
+
+
+def test_cache_keeps_at_most_max_entries_engines(tmp_path):
+    books = book_store.list_books()
+    catalog = {title: books[title] for title in sorted(books)[:2]}
+    cache, search = library(tmp_path / 'derivados', catalog, max_entries=1)
+
+    search.search('vida', 'all', 20)
+
+    assert len(cache.resident_books()) == 1
+
+
+def test_saved_search_is_materialized_by_a_new_cache(tmp_path):
+    books = book_store.list_books()
+    catalog = {title: books[title] for title in sorted(books)[:2]}
+    _, search = library(tmp_path / 'derivados', catalog)
+    saved = pickle.loads(pickle.dumps(search.search_hits('vida')))
+
+    _, new_search = library(tmp_path / 'derivados', catalog)
+
+    assert list(new_search.cursor(saved)) == list(search.search('vida'))
@@ -0,0 +1,84 @@
+"""Analisador da busca (search_analyzer.py): acentos, stopwords e radicais."""
+
+import pytest
+
+import search_analyzer
+from leitor_quantico import SearchEngine
+from search_analyzer import fold_accents, stem
+
+PORTUGUESE = SearchEngine.default_analyzer()
+
+
+@pytest.mark.parametrize('word, expected', [
+    ('religião', 'religiao'),
+    ('ação', 'acao'),
+    ('País', 'Pais'),
+])
+def test_fold_accents(word, expected):
+    assert fold_accents(word) == expected
+
+
+def test_stopwords_are_discarded():
+    assert PORTUGUESE.analyze_token('não') is None
+    assert PORTUGUESE.analyze_token('Porquê') is None
+    # A lista é comparada sem acentos
+    assert PORTUGUESE.analyze_token('nao') is None
+
+
+def test_stopwords_come_from_the_search_engine():
+    assert PORTUGUESE is search_analyzer.portuguese(SearchEngine._get_stopwords())
+    assert PORTUGUESE.rules['stopwords'] == sorted(SearchEngine._get_stopwords())
+
+
+@pytest.mark.parametrize('words', [
+    ('político', 'políticos', 'política'),
+    ('mãe', 'mães'),
+    ('canção', 'canções'),
+    ('animal', 'animais'),
+    ('papel', 'papéis'),
+    ('pai', 'pais'),
+    ('país', 'países'),
+    ('fácil', 'fáceis'),
+    ('possível', 'possíveis'),
+    ('lençol', 'lençóis', 'lencois'),
+    ('sol', 'sóis'),
+    ('religião', 'religiões', 'religiao', 'religioes'),
+    ('através', 'atraves'),
+])
+def test_inflections_share_a_stem(words):
+    assert len({PORTUGUESE.analyze_token(word) for word in words}) == 1
+
+
+@pytest.mark.parametrize('word, expected', [
+    ('politicos', 'polit'),
+    ('maes', 'mae'),
+    ('mae', 'mae'),
+    ('cancoes', 'canca'),
+    ('pais', 'pai'),
+    ('país', 'pais'),
+    ('países', 'pais'),
+])
+def test_stem(word, expected):
+    assert stem(word) == expected
+
+
+@pytest.mark.parametrize('word', ['cais', 'mais', 'lapis', 'deus', 'caos', 'dois', 'pois', 'depois', 'demais',
+                                  'jamais'])
+def test_plural_exceptions_are_kept(word):
+    assert stem(word) == word
+
+
+def test_country_and_fathers_do_not_share_a_stem():
+    # "país" é singular; sem acento, "pais" é o plural de "pai"
+    assert PORTUGUESE.analyze_token('país') != PORTUGUESE.analyze_token('pais')
+
+
+def test_exception_skips_only_its_rule():
+    # "maes" é exceção de -aes -> -ao, mas ainda perde o -s do plural
+    assert search_analyzer._apply_rules('maes', search_analyzer.PLURAL_RULES) == ('mae', True)
+    assert search_analyzer._apply_rules('cais', search_analyzer.PLURAL_RULES) == ('cais', False)
+
+
+def test_analyze_keeps_ordinals_and_offsets():
+    text = 'O caos e a ordem'
+    assert list(PORTUGUESE.analyze(text)) == [('caos', 1, 2), ('ord', 4, 11)]
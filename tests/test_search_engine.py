@@ -0,0 +1,91 @@
+"""Busca por palavra do ``SearchEngine`` (leitor_quantico.py) sobre um livro do acervo."""
+
+import json
+import pickle
+
+import pytest
+
+import book_store
+import search_analyzer
+from leitor_quantico import SearchEngine
+from segment_table import SegmentTable
+
+
+@pytest.fixture(scope='module')
+def engine():
+    with open(book_store.list_books()['Caos'], encoding='utf-8') as f:
+        segments = SegmentTable.from_segments(json.load(f)['segments'])
+    engine = SearchEngine(segments, [])
+    engine.export_index()
+    return engine
+
+
+def pages_with(engine, predicate):
+    """Páginas com alguma palavra (normalizada) que satisfaça ``predicate``"""
+    return {
+        page for page, segment in enumerate(engine.segments, start=1)
+        if any(predicate(engine.analyzer.normalize(token))
+               for token in search_analyzer.TOKEN_RE.findall(segment.text))
+    }
+
+
+def found_pages(results):
+    return {hit['page'] for hit in results.hits()}
+
+
+def test_partial_word_finds_the_word_it_is_part_of(engine):
+    # "passad" não é o radical de "passado" ("pass"), mas está na palavra
+    expected = pages_with(engine, lambda word: 'passad' in word)
+    assert expected
+    assert found_pages(engine.search_word('passad')) == expected
+
+
+def test_partial_word_is_not_stemmed(engine):
+    expected = pages_with(engine, lambda word: 'religi' in word)
+    assert found_pages(engine.search_word('religi', fuzzy=False)) == expected
+
+
+def test_short_fragment_matches_word_prefixes(engine):
+    expected = pages_with(engine, lambda word: word.startswith('zo'))
+    assert found_pages(engine.search_word('zo', fuzzy=False)) == expected
+
+
+@pytest.mark.parametrize('typo, word', [
+    ('cahos', 'caos'),
+    ('pasado', 'passado'),
+    ('felicidde', 'felicidade'),
+    ('zoroastor', 'zoroastro'),
+])
+def test_typos_find_the_intended_word(engine, typo, word):
+    expected = pages_with(engine, lambda form: form == word)
+    assert expected
+    assert expected <= found_pages(engine.search_word(typo, exact_match=True))
+    assert not engine.search_word(typo, exact_match=True, fuzzy=False)
+
+
+def test_fuzzy_matches_agree_with_edit_distance(engine):
+    def distance(a, b):
+        previous = list(range(len(b) + 1))
+        for i, char_a in enumerate(a, start=1):
+            current = [i]
+            for j, char_b in enumerate(b, start=1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+            previous = current
+        return previous[-1]
+
+    index = engine.word_index
+    for typo in ('cahos', 'pasado', 'felicidde'):
+        expected = {}
+        for surface, term_id in zip(index.surfaces, index.surface_terms):
+            edits = distance(typo, surface)
+            if edits <= 2:
+                term = index.terms[term_id]
+                expected[term] = min(edits, expected.get(term, edits))
+        assert dict(index.terms_within(typo, 2)) == expected
+
+
+def test_saved_search_rebuilds_the_same_results(engine):
+    saved = engine.advanced_search_hits('caos passado')
+    # Só dados leves: nada do motor (que tem locks e não é serializável)
+    restored = pickle.loads(pickle.dumps(saved))
+    assert list(engine.cursor(restored)) == list(engine.advanced_search('caos passado'))
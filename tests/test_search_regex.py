@@ -0,0 +1,96 @@
+"""Busca por expressão regular (search_regex.py): validação, mapeamento para páginas e limites."""
+
+import re
+import time
+import warnings
+
+import pytest
+
+import search_regex
+from search_regex import Corpus, PatternError, RegexWorker, compile_pattern, scan
+
+PAGES = [
+    'Capítulo 1\nO caos do passado.',
+    'Sendo vivido no futuro. Caos',
+    'e ordem.\nCapítulo 2',
+    '',
+    'Fim do caos.',
+]
+
+
+@pytest.fixture(scope='module')
+def worker():
+    worker = RegexWorker()
+    yield worker
+    worker.close()
+
+
+@pytest.mark.parametrize('pattern', [
+    r'(a+)+$',
+    r'(\w+\s?)*x',
+    r'(?:x*)*y',
+    r'(a|b)\1',
+    'x*',
+    '^$',
+    'a' * (search_regex.MAX_PATTERN_LENGTH + 1),
+    '[',
+])
+def test_compile_rejects(pattern):
+    with pytest.raises(PatternError):
+        compile_pattern(pattern)
+
+
+@pytest.mark.parametrize('pattern', ['[[a]', '[a&&b]', '[a--b]', '[a||b]'])
+def test_ambiguous_sets_are_rejected_without_warnings(pattern):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        with pytest.raises(PatternError):
+            compile_pattern(pattern)
+    assert not caught
+
+
+def _per_page(pattern, pages):
+    return [(page, match.start(), match.end())
+            for page, text in enumerate(pages, 1)
+            for match in pattern.finditer(text) if match.start() != match.end()]
+
+
+@pytest.mark.parametrize('pattern', [r'(?i)caos', r'\w+\s+\w+', r'\s\S', r'^Cap\w+ \d', r'\.\s*\w*', r'o$'])
+def test_scan_matches_page_by_page_search(pattern):
+    compiled = compile_pattern(pattern)
+    matches, truncated = scan(compiled, Corpus(PAGES))
+    assert matches == _per_page(compiled, PAGES)
+    assert not truncated
+
+
+def test_page_of_maps_corpus_offsets():
+    corpus = Corpus(PAGES)
+    for page, start in enumerate(corpus.page_starts, 1):
+        assert corpus.page_of(start) == page
+        assert corpus.text[start:corpus.page_end(page)] == PAGES[page - 1]
+
+
+def test_scan_stops_at_max_matches():
+    matches, truncated = scan(compile_pattern(r'\w+'), Corpus(PAGES), max_matches=3)
+    assert len(matches) == 3 and truncated
+
+
+def test_worker_returns_the_same_matches(worker):
+    compiled = compile_pattern(r'(?i)caos')
+    corpus = Corpus(PAGES)
+    assert worker.scan(compiled, corpus) == scan(compiled, corpus)
+
+
+@pytest.mark.parametrize('pattern, text', [
+    (r'(.|..)*Z', 'a' * 60),
+    (r'[\s\S]*[\s\S]*[\s\S]*Q', 'x' * 4000),
+])
+def test_worker_stops_pathological_patterns(worker, pattern, text):
+    compiled = compile_pattern(pattern)
+    time_budget = 0.2
+    started = time.perf_counter()
+    assert worker.scan(compiled, Corpus([text] * 3), time_budget=time_budget) == ([], True)
+    assert time.perf_counter() - started < time_budget + search_regex.WORKER_GRACE_SECONDS + 1.0
+
+    # O processo encerrado é recriado na busca seguinte
+    assert worker.scan(compile_pattern('a+'), Corpus(['bab'])) == ([(1, 1, 2)], False)
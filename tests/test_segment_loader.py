@@ -0,0 +1,41 @@
+"""Leitura preguiçosa do JSON do livro (segment_loader.py): arquivos inválidos."""
+
+import pytest
+
+import book_schema
+import book_store
+import segment_loader
+
+
+@pytest.fixture
+def source_book():
+    return next(iter(book_store.list_books().values()))
+
+
+def test_empty_file_is_a_format_error(tmp_path):
+    source = tmp_path / 'Vazio.json'
+    source.write_bytes(b'')
+    with pytest.raises(book_schema.MissingBookDataError) as error:
+        segment_loader.open_json_book(str(source), store_root=str(tmp_path))
+    assert isinstance(error.value, book_schema.BookFormatError)
+    assert (error.value.line, error.value.column) == (1, 1)
+
+
+def test_truncated_file_is_a_format_error(tmp_path, source_book):
+    with open(source_book, 'rb') as f:
+        data = f.read()
+    source = tmp_path / 'Truncado.json'
+    source.write_bytes(data[:len(data) // 2])
+    with pytest.raises(book_schema.BookFormatError) as error:
+        segment_loader.open_json_book(str(source), store_root=str(tmp_path))
+    assert error.value.offset is not None
+    assert error.value.line is not None
+
+
+def test_valid_file_opens(tmp_path, source_book):
+    book = segment_loader.open_json_book(source_book, store_root=str(tmp_path))
+    try:
+        assert len(book.segments) > 0
+        assert 'text' in book.segments[0]
+    finally:
+        book.close()
@@ -0,0 +1,131 @@
+"""Forma normalizada do ``theme_analysis`` dos livros do FLUX-ON Reader.
+
+No JSON de análise, ``theme_analysis`` guarda, para cada tema, uma lista de
+ocorrências ``{segment, score, position, chapter}``, em que ``position`` é
+o offset em caracteres no texto do livro (o campo ``segment`` vale 1 em
+quase todas). ``ThemeTable`` guarda as mesmas ocorrências como:
+
+- ``scores``: matriz float32 temas x posições (0 onde o tema não ocorre)
+- ``positions``: offsets distintos, em ordem crescente (int64)
+- ``chapters``: capítulo de cada posição (int32)
+- ``pages``: página (base 0) de cada posição, resolvida uma única vez a
+  partir do offset inicial de cada página
+- ``occurrences``: as ocorrências originais, na ordem do JSON (tema,
+  coluna da posição, ``score`` em float64, ``segment`` e ``chapter``), para
+  que ``to_dict`` reproduza o ``theme_analysis`` sem perdas; a matriz
+  ``scores`` fica com a maior intensidade por (tema, posição)
+
+Mapa de calor (temas x páginas) e agregados por capítulo são então uma
+única operação vetorizada cada. O livro compilado (book_store.py) grava a
+tabela em ``themes.npz``.
+"""
+
+import hashlib
+
+import numpy as np
+
+ARRAY_NAMES = ('scores', 'positions', 'chapters', 'pages', 'occurrences')
+
+OCCURRENCE_DTYPE = np.dtype([('theme', np.int32), ('column', np.int32), ('score', np.float64),
+                             ('segment', np.int64), ('chapter', np.int64)])
+
+
+class ThemeTable:
+    """Ocorrências de temas da análise: matriz temas x posições e arrays por posição"""
+
+    __slots__ = ('names', 'scores', 'positions', 'chapters', 'pages', 'occurrences')
+
+    def __init__(self, names, scores, positions, chapters, pages, occurrences):
+        self.names = tuple(names)
+        self.scores = scores
+        self.positions = positions
+        self.chapters = chapters
+        self.pages = pages
+        self.occurrences = occurrences
+
+    @classmethod
+    def from_theme_analysis(cls, theme_analysis, page_starts):
+        """Normaliza ``theme_analysis``; ``page_starts`` é o offset inicial de cada página"""
+        names = list(theme_analysis or {})
+        points = [(row, point) for row, name in enumerate(names) for point in theme_analysis[name]]
+
+        raw_positions = np.array([point.get('position', 0) for _, point in points], dtype=np.int64)
+        positions, columns = np.unique(raw_positions, return_inverse=True)
+
+        scores = np.zeros((len(names), len(positions)), dtype=np.float32)
+        rows = np.array([row for row, _ in points], dtype=np.intp)
+        # Ocorrências repetidas do mesmo tema na mesma posição: vale a maior
+        np.maximum.at(scores, (rows, columns), [point['score'] for _, point in points])
+
+        chapters = np.zeros(len(positions), dtype=np.int32)
+        chapters[columns] = [point.get('chapter', 0) for _, point in points]
+
+        page_starts = np.asarray(page_starts)
+        if len(page_starts):
+            pages = np.searchsorted(page_starts, positions, side='right') - 1
+            pages = np.clip(pages, 0, len(page_starts) - 1).astype(np.int32)
+        else:
+            pages = np.zeros(len(positions), dtype=np.int32)
+
+        occurrences = np.zeros(len(points), dtype=OCCURRENCE_DTYPE)
+        occurrences['theme'] = rows
+        occurrences['column'] = columns
+        occurrences['score'] = [point['score'] for _, point in points]
+        occurrences['segment'] = [point.get('segment', 1) for _, point in points]
+        occurrences['chapter'] = [point.get('chapter', 0) for _, point in points]
+
+        return cls(names, scores, positions, chapters, pages, occurrences)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __bool__(self):
+        return bool(self.names)
+
+    def page_matrix(self, page_count):
+        """Matriz temas x páginas com a maior intensidade de cada tema na página"""
+        heatmap = np.zeros((len(self.names), page_count), dtype=np.float32)
+        if not self.positions.size or not page_count:
+            return heatmap
+        # As posições estão ordenadas, logo as páginas também: um grupo contíguo por página
+        pages, starts = np.unique(self.pages, return_index=True)
+        inside = pages < page_count
+        heatmap[:, pages[inside]] = np.maximum.reduceat(self.scores, starts, axis=1)[:, inside]
+        return heatmap
+
+    def chapter_means(self):
+        """(capítulos, matriz temas x capítulos) com a intensidade média de cada tema"""
+        chapters, inverse = np.unique(self.chapters, return_inverse=True)
+        membership = np.zeros((len(self.positions), len(chapters)), dtype=np.float32)
+        membership[np.arange(len(self.positions)), inverse] = 1
+        totals = self.scores @ membership
+        counts = (self.scores > 0).astype(np.float32) @ membership
+        return chapters, np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+
+    def digest(self):
+        """Hash do conteúdo (chave dos dados derivados que dependem dos temas)"""
+        digest = hashlib.sha256('\x00'.join(self.names).encode('utf-8'))
+        for name in ARRAY_NAMES:
+            digest.update(np.ascontiguousarray(getattr(self, name)).tobytes())
+        return digest.hexdigest()
+
+    def to_dict(self):
+        """De volta ao ``theme_analysis`` do JSON (exportação), com os valores e a ordem originais"""
+        theme_analysis = {name: [] for name in self.names}
+        for theme, column, score, segment, chapter in self.occurrences.tolist():
+            theme_analysis[self.names[theme]].append({
+                'segment': segment,
+                'score': score,
+                'position': int(self.positions[column]),
+                'chapter': chapter
+            })
+        return theme_analysis
+
+    def save(self, path):
+        np.savez(path, names=np.array(self.names, dtype=str),
+                 **{name: getattr(self, name) for name in ARRAY_NAMES})
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as saved:
+            return cls(saved['names'].tolist(), *(saved[name] for name in ARRAY_NAMES))